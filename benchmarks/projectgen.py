@@ -0,0 +1,162 @@
+"""Synthetic project generator for benchmarks."""
+
+# Official Libraries
+import os
+import random
+import shutil
+from dataclasses import asdict, dataclass
+
+
+__all__ = (
+        'ProjectSpec',
+        'generate_project',
+        )
+
+
+# Define Constants
+DIR_DATA = os.path.join(os.path.dirname(__file__), '..', 'sms', 'data')
+
+COMMON_FILES = ('time.yml', 'word.yml')
+
+ACTS = ('be', 'come', 'go', 'do', 'think', 'have', 'wear', 'feel', 'explain', 'voice', 'know')
+
+TIMES = ('morning', 'afternoon', 'night', '-', 'same', '10:00')
+
+DATES = ('-', 'next', 'nextday2', 'nextweek', 'same')
+
+
+@dataclass
+class ProjectSpec(object):
+    files: int = 10
+    scenes: int = 20
+    depth: int = 3
+    persons: int = 10
+    mobs: int = 5
+    rubis: int = 20
+    dialogue: float = 0.3
+    actions: int = 20
+    seed: int = 1
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Main
+def generate_project(dirname: str, spec: ProjectSpec) -> str:
+    """Write a project with the given size into dirname and return the path."""
+    assert isinstance(dirname, str)
+    assert isinstance(spec, ProjectSpec)
+
+    rand = random.Random(spec.seed)
+
+    for sub in ('assets', os.path.join('assets', 'common'), 'src', 'build'):
+        os.makedirs(os.path.join(dirname, sub), exist_ok=True)
+
+    for fname in ('project.yml', 'book.yml', 'config.yml'):
+        shutil.copy(os.path.join(DIR_DATA, fname), os.path.join(dirname, fname))
+    for fname in COMMON_FILES:
+        shutil.copy(os.path.join(DIR_DATA, 'common', fname),
+                os.path.join(dirname, 'assets', 'common', fname))
+
+    persons = [f"p{i}" for i in range(spec.persons)]
+    mobs = [f"mob{i}" for i in range(spec.mobs)]
+    rubis = [f"難語{i}" for i in range(spec.rubis)]
+
+    _write(dirname, os.path.join('assets', 'common', 'mob.yml'), _mobs_yaml_of(mobs))
+    _write(dirname, os.path.join('assets', 'common', 'rubi.yml'), _rubis_yaml_of(rubis))
+    _write(dirname, os.path.join('assets', 'Room.yml'),
+            '#!SMSdata\nstage:\n  tag: Room\n  name: 部屋\n  note: 備考\n')
+    for i, tag in enumerate(persons):
+        _write(dirname, os.path.join('assets', f"{tag}.yml"), _person_yaml_of(i, tag, persons))
+
+    subjects = persons + mobs
+    words = [f"${tag}" for tag in persons] + rubis
+    chapters = []
+
+    for i in range(spec.files):
+        lines = []
+        leaves = [f"sc{i}_{j}" for j in range(spec.scenes)]
+        heads = _nested(lines, f"ch{i}", leaves, max(spec.depth - 2, 0))
+        chapters.append(f"ch{i}")
+        lines += [f"## ch{i}", '', f"::title = 第{i}章", f"::outline = 章{i}の概要 ${persons[0]}", '']
+        lines += [f"<{head}>" for head in heads] + ['<flashback>', '']
+        for j, tag in enumerate(leaves):
+            lines += _scene_lines_of(rand, spec, tag, i == 0 and j == 0, subjects, words)
+        _write(dirname, os.path.join('src', f"part{i:03}.md"), '\n'.join(lines) + '\n')
+
+    main = ['#!SMSscript', '', '## main', '', '::title = 長編', '::flags = nospin', '',
+            '[plot]', '', 'メインプロット', '']
+    main += [f"<{tag}>" for tag in chapters] + ['']
+    main += ['## flashback', '', '::title = 回想', '::flags = nospin', '',
+            f"[{persons[0]}:think:回想]", f"あの日の${persons[0]}", '']
+    _write(dirname, os.path.join('src', 'main.md'), '\n'.join(main) + '\n')
+
+    return dirname
+
+
+# Private Functions
+def _mobs_yaml_of(mobs: list) -> str:
+    lines = ['#!SMSdata', 'mob:']
+    for i, tag in enumerate(mobs):
+        lines += [f"  {tag}:", '    type: mob', f"    name: 群衆{i}"]
+    return '\n'.join(lines) + '\n'
+
+
+def _nested(lines: list, parent: str, tags: list, levels: int) -> list:
+    if levels <= 0 or len(tags) <= 2:
+        return tags
+
+    size = max(2, round(len(tags) ** (1 / (levels + 1))))
+    heads = []
+
+    for i in range(0, len(tags), size):
+        head = f"{parent}_{i // size}"
+        children = _nested(lines, head, tags[i:i + size], levels - 1)
+        lines += [f"## {head}", '', f"::title = {head}", '']
+        lines += [f"<{child}>" for child in children] + ['']
+        heads.append(head)
+
+    return heads
+
+
+def _person_yaml_of(index: int, tag: str, persons: list) -> str:
+    lines = ['#!SMSdata', 'person:', f"  tag: {tag}", f"  name: 名{index}",
+            f"  fullname: 姓{index},名{index}", '  age: 17', '  sex: male', '  job: 学生',
+            '  belong: 高校', '  calling:', f"    me: 私{index}"]
+    for other in persons[:3]:
+        if other != tag:
+            lines.append(f"    {other}: {other}さん")
+    lines.append('  note: 備考')
+    return '\n'.join(lines) + '\n'
+
+
+def _rubis_yaml_of(rubis: list) -> str:
+    lines = ['#!SMSdata', 'rubi:']
+    for word in rubis:
+        lines += [f"  {word}:", f"    name: {word}《なんご》", '    exclusions: []', '    always: false']
+    return '\n'.join(lines) + '\n'
+
+
+def _scene_lines_of(rand: random.Random, spec: ProjectSpec, tag: str, is_first: bool,
+        subjects: list, words: list) -> list:
+    lines = [f"## {tag}", '', f"::title = 場面{tag}", f"::camera = {rand.choice(subjects)}",
+            '::stage = Room', f"::location = {rand.choice(('INT', 'EXT'))}",
+            '::year = ' + ('2021' if is_first else rand.choice(('-', 'same'))),
+            '::date = ' + ('4/1' if is_first else rand.choice(DATES)),
+            '::time = ' + ('morning' if is_first else rand.choice(TIMES)),
+            f"::outline = {rand.choice(words)}の場面", '']
+
+    for _ in range(spec.actions):
+        subject = rand.choice(subjects)
+        if rand.random() < spec.dialogue:
+            lines += [f"[{subject}:talk]", f"{rand.choice(words)}は$Sに話した", '']
+        else:
+            lines += [f"[{subject}:{rand.choice(ACTS)}:{rand.choice(words)}と]",
+                    f"{rand.choice(words)}が{rand.choice(words)}を見た。", '']
+
+    return lines
+
+
+def _write(dirname: str, fname: str, text: str) -> None:
+    with open(os.path.join(dirname, fname), 'w', encoding='utf-8') as file:
+        file.write(text)
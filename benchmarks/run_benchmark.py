@@ -0,0 +1,207 @@
+"""End-to-end benchmark of the build stages.
+
+Generate a synthetic project in a temp directory and time each stage of the
+build, then print the result as JSON. Run from the repository root:
+
+    python benchmarks/run_benchmark.py --files 20 --scenes 50 --output result.json
+
+The wall time is the best of --repeat runs, and the peak memory is taken
+from one more run traced by tracemalloc.
+"""
+
+# Official Libraries
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+# My Modules
+from projectgen import ProjectSpec, generate_project
+
+
+# Define Constants
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+# Main
+def main(argv: list) -> int:
+    args = _parse_args(argv)
+    spec = ProjectSpec(args.files, args.scenes, args.depth, args.persons, args.mobs,
+            args.rubis, args.dialogue, args.actions, args.seed)
+
+    dirname = tempfile.mkdtemp(prefix='sms_bench_')
+    try:
+        generate_project(dirname, spec)
+        # NOTE: the project path is fixed when sms is imported
+        os.chdir(dirname)
+        result = _run(spec, args.repeat)
+    finally:
+        os.chdir(ROOT)
+        if not args.keep:
+            shutil.rmtree(dirname, ignore_errors=True)
+
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+
+    return 0
+
+
+# Private Functions
+def _commit_of() -> str:
+    try:
+        ret = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+        return ret.stdout.strip()
+    except OSError:
+        return ''
+
+
+def _parse_args(argv: list) -> argparse.Namespace:
+    spec = ProjectSpec()
+    parser = argparse.ArgumentParser(description='sms build benchmark')
+    parser.add_argument('--files', type=int, default=spec.files, help='scene files')
+    parser.add_argument('--scenes', type=int, default=spec.scenes, help='scenes per file')
+    parser.add_argument('--depth', type=int, default=spec.depth, help='call depth from main')
+    parser.add_argument('--persons', type=int, default=spec.persons, help='persons')
+    parser.add_argument('--mobs', type=int, default=spec.mobs, help='mobs')
+    parser.add_argument('--rubis', type=int, default=spec.rubis, help='rubi entries')
+    parser.add_argument('--dialogue', type=float, default=spec.dialogue, help='ratio of talk actions')
+    parser.add_argument('--actions', type=int, default=spec.actions, help='actions per scene')
+    parser.add_argument('--seed', type=int, default=spec.seed, help='random seed')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs')
+    parser.add_argument('--output', type=str, help='json file to write')
+    parser.add_argument('--keep', action='store_true', help='keep the generated project')
+    return parser.parse_args(argv[1:])
+
+
+def _run(spec: ProjectSpec, repeat: int) -> dict:
+    from sms import __app_name__
+    from sms.utils import log
+
+    log.init_logger(__app_name__, tempfile.mkdtemp(prefix='sms_bench_log_'))
+    log.logger.setLevel(logging.ERROR)
+
+    walls = {}
+    counts = {}
+
+    for _ in range(max(repeat, 1)):
+        for name, wall, _, count in _stages():
+            walls.setdefault(name, []).append(wall)
+            counts[name] = count
+
+    peaks = {name: peak for name, _, peak, _ in _stages(True)}
+
+    return {
+            'commit': _commit_of(),
+            'python': platform.python_version(),
+            'spec': spec.to_dict(),
+            'total': sum(min(values) for values in walls.values()),
+            'stages': {
+                name: {
+                    'wall': min(values),
+                    'walls': values,
+                    'peak_memory': peaks.get(name, 0),
+                    'records': counts[name],
+                    } for name, values in walls.items()},
+            }
+
+
+def _stages(is_traced: bool = False) -> list:
+    from sms.cmds.builder import Outputter, _get_build_path
+    from sms.commons.pathmanager import PathManager
+    from sms.commons.projectconfig import get_project_config
+    from sms.core.charcounter import char_counts_from
+    from sms.core.compiler import compile_codes
+    from sms.core.contentsbuilder import build_contents
+    from sms.core.dbmanager import get_assets_db, get_srcs_db, scenes_db_from
+    from sms.db.assetindex import AssetIndex
+    from sms.core.infobuilder import build_info
+    from sms.core.nametagconv import callingtags_from, nametags_from, rubitags_from
+    from sms.core.novelbuilder import build_novel
+    from sms.core.outlinebuilder import build_outline
+    from sms.core.plotbuilder import build_plot
+    from sms.core.rubiapplyer import apply_rubi_in_novel_data
+    from sms.core.scriptbuilder import build_script
+    from sms.core.structbuilder import build_struct
+    from sms.core.tagresolver import tags_resolved_story_data
+    from sms.types.build import BuildType
+
+    tmp = []
+
+    # NOTE: new outputs on each run, not to skip the writes of the unchanged outputs
+    shutil.rmtree('build', ignore_errors=True)
+    os.makedirs('build')
+
+    def _stage(name, func, *args):
+        if is_traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        ret = func(*args)
+        wall = time.perf_counter() - start
+        peak = 0
+        if is_traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        tmp.append((name, wall, peak, _count_of(ret)))
+        return ret
+
+    config = get_project_config()
+    PathManager.set_project_dirs(config.asset, config.source)
+    assets = _stage('asset_index', AssetIndex, _stage('get_assets_db', get_assets_db, False))
+    srcs = _stage('get_srcs_db', get_srcs_db, False)
+    scenes = _stage('scenes_db_from', scenes_db_from, srcs)
+    codes = _stage('compile_codes', compile_codes, scenes, assets, config)
+    tags = nametags_from(assets, config)
+    callings = callingtags_from(assets)
+    columns, rows = config.columns, config.rows
+    contents = _stage('build_contents', build_contents, codes, tags)
+    resolved = _stage('resolve_tags', tags_resolved_story_data, codes, tags, callings)
+
+    outputs = {
+            'outline': _stage('build_outline', build_outline, resolved, tags),
+            'plot': _stage('build_plot', build_plot, resolved, tags),
+            'struct': _stage('build_struct', build_struct, codes, tags, callings, False),
+            'script': _stage('build_script', build_script, resolved, tags, callings, False),
+            'novel': _stage('build_novel', build_novel, resolved, tags, callings, False),
+            'info': _stage('build_info', build_info, codes, tags, callings),
+            }
+    outputs['novel_rubi'] = _stage('apply_rubi', apply_rubi_in_novel_data,
+            outputs['novel'], rubitags_from(assets), config.rubi)
+
+    for name in ('outline', 'plot', 'struct', 'script', 'novel'):
+        _stage(f"char_counts_{name}", char_counts_from, BuildType[name.upper()],
+                outputs[name].stats, columns, rows)
+
+    for name, data in outputs.items():
+        _stage(f"write_{name}", Outputter.output_data, _get_build_path(name),
+                data, None if 'info' == name else contents)
+
+    return tmp
+
+
+def _count_of(data) -> int:
+    for attr in ('get_data', 'data'):
+        if hasattr(data, attr):
+            value = getattr(data, attr)
+            return len(value() if callable(value) else value)
+    if isinstance(data, (list, dict)):
+        return len(data)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,118 @@
+"""Memory benchmark of the compiled story records.
+
+Run from the repository root:
+
+    python benchmarks/story_memory.py [scenes] [actions]
+"""
+
+# Official Libraries
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+# My Modules
+from sms import __app_name__
+from sms.utils.log import init_logger
+
+init_logger(__app_name__, tempfile.mkdtemp())
+
+from sms.core.aliasconv import AliasPass
+from sms.core.instrunner import InstructionPass
+from sms.core.nextconv import NextPass
+from sms.core.novelbuilder import build_novel
+from sms.core.passmanager import PassManager
+from sms.core.sameconv import SameActionPass, SameInfoPass
+from sms.core.serializer import call_scene
+from sms.core.structbuilder import build_struct
+from sms.core.timeclockconv import TimeClockPass
+from sms.db.scenes import ScenesDB
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.instruction import Instruction
+from sms.objs.scenecode import SceneCode
+from sms.types.action import ActType
+from sms.types.instruction import InstType
+
+
+# Define Constants
+DEFAULT_SCENES = 500
+
+DEFAULT_ACTIONS = 50
+
+ACT_TYPES = (ActType.DO, ActType.TALK, ActType.BE, ActType.SAME)
+
+
+# Main
+def main(argv: list) -> int:
+    scenes_num = int(argv[1]) if len(argv) > 1 else DEFAULT_SCENES
+    actions_num = int(argv[2]) if len(argv) > 2 else DEFAULT_ACTIONS
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    story = _compiled_story_of(_scenes_of(scenes_num, actions_num))
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    records = len(story.get_data())
+    print(f"compiled story: {records} records, {size / 1024 / 1024:.1f} MiB"
+            f" ({size / records:.0f} B/record), {elapsed:.2f}s")
+
+    for name, builder in (('novel', build_novel), ('struct', build_struct)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        builder(story, {}, {}, False)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"build {name}: peak {peak / 1024 / 1024:.1f} MiB, {elapsed:.2f}s")
+
+    return 0
+
+
+# Private Functions
+def _compiled_story_of(scenes: ScenesDB) -> StoryData:
+    data = call_scene(0, 'main', scenes)
+    passes = PassManager([
+            AliasPass(),
+            TimeClockPass({}),
+            SameInfoPass(),
+            SameActionPass(),
+            NextPass(),
+            InstructionPass(),
+            ])
+
+    return StoryData(passes.run(data))
+
+
+def _scenes_of(scenes_num: int, actions_num: int) -> ScenesDB:
+    db = ScenesDB()
+    main = SceneCode('main')
+    main.title = 'main'
+    db.add('main', main)
+
+    for i in range(scenes_num):
+        tag = f"scene{i}"
+        main.add(Instruction(InstType.CALL, [tag]))
+        scode = SceneCode(tag)
+        scode.title = f"scene {i}"
+        scode.camera = 'taro'
+        scode.stage = 'room'
+        scode.year = '2021'
+        scode.date = '4/1'
+        scode.time = 'morning'
+        for j in range(actions_num):
+            scode.add(Action(ACT_TYPES[j % len(ACT_TYPES)], 'taro' if j % 3 else '',
+                f"outline {i}-{j}", [f"description of {i}-{j}."]))
+        db.add(tag, scode)
+
+    return db
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
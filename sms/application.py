@@ -7,9 +7,7 @@ from enum import auto, Enum
 
 
 # My Modules
-from sms.cmds.builder import build_project
 from sms.cmds.cmdlineparser import get_commandline_arguments
-from sms.cmds.initializer import init_project
 from sms.syss import messages as msg
 from sms.utils.log import logger
 
@@ -26,11 +24,13 @@ PROC = 'APPLICATION'
 class BuildType(Enum):
     BUILD = auto()
     INIT = auto()
+    WATCH = auto()
 
     def to_check(self) -> tuple:
         return {
                 self.BUILD: ('b', 'build'),
-                self.INIT: ('i', 'init')
+                self.INIT: ('i', 'init'),
+                self.WATCH: ('w', 'watch'),
                 }[self]
 
 
@@ -48,11 +48,19 @@ class Application(object):
             logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"command line args: {PROC}"))
             return os.EX_NOINPUT
 
+        # NOTE: commands are imported only when they run to start fast
         if BuildChecker.has_build_cmd_of(args, BuildType.BUILD):
+            from sms.cmds.builder import build_project
             if not build_project(args):
                 logger.debug(msg.ERR_FAIL_SUBPROCESS.format(proc=f"build project: {PROC}"))
                 return os.EX_SOFTWARE
+        elif BuildChecker.has_build_cmd_of(args, BuildType.WATCH):
+            from sms.cmds.watcher import watch_project
+            if not watch_project(args):
+                logger.debug(msg.ERR_FAIL_SUBPROCESS.format(proc=f"watch project: {PROC}"))
+                return os.EX_SOFTWARE
         elif BuildChecker.has_build_cmd_of(args, BuildType.INIT):
+            from sms.cmds.initializer import init_project
             if not init_project():
                 logger.debug(msg.ERR_FAIL_SUBPROCESS.format(proc=f"init project: {PROC}"))
                 return os.EX_SOFTWARE
@@ -1,44 +1,127 @@
 """Build module."""
 
 # Official Libraries
+import importlib
 import os
-import yaml
 from argparse import Namespace
+from dataclasses import dataclass
+from enum import auto, Enum
+from typing import Any, Callable
 
 
 # My Modules
+from sms.commons.pathmanager import PathManager as PM
+from sms.commons.projectconfig import ProjectConfig, get_project_config
 from sms.core.charcounter import char_counts_from
 from sms.core.compiler import compile_codes
 from sms.core.contentsbuilder import build_contents
-from sms.core.dbmanager import get_assets_db, get_srcs_db
+from sms.core.dbmanager import get_assets_db, get_fragment_cache, get_srcs_db
+from sms.core.dbmanager import load_scene_graph, save_scene_graph, scene_graph_from
 from sms.core.dbmanager import scenes_db_from
-from sms.core.infobuilder import build_info
 from sms.core.nametagconv import nametags_from, callingtags_from
 from sms.core.nametagconv import rubitags_from
-from sms.core.novelbuilder import build_novel
-from sms.core.outlinebuilder import build_outline
-from sms.core.plotbuilder import build_plot
-from sms.core.rubiapplyer import apply_rubi_in_novel_data
-from sms.core.scriptbuilder import build_script
-from sms.core.structbuilder import build_struct
+from sms.core.tagresolver import tags_resolved_story_data
+from sms.db.assetindex import AssetIndex
+from sms.db.fragmentcache import digest_of
+from sms.db.outputmanifest import OutputManifest
 from sms.db.outputsdata import OutputsData
+from sms.db.scenegraph import SceneGraph, SceneImpact
+from sms.db.scenes import LazyScenesDB
+from sms.db.storydata import StoryData
+from sms.objs.rubi import RubiData
 from sms.syss import messages as msg
-from sms.syss.paths import DIR_PROJECT, DIR_BUILD_NAME, EXT_MARKDOWN
-from sms.syss.paths import FILE_CONFIG
+from sms.syss.paths import DIR_PROJECT, DIR_BUILD_NAME, EXT_JSON, EXT_MARKDOWN
+from sms.syss.paths import EXT_PROFILE
 from sms.types.build import BuildType
-from sms.utils.fileio import read_file, write_file
+from sms.types.rubi import RubiScope
+from sms.utils.fileio import write_file
 from sms.utils.filepath import add_extention, is_exists_path
 from sms.utils.log import logger
+from sms.utils.pools import imap_forked, jobs_count_of
+from sms.utils.profiler import add_records, disable_profiling, dump_stats
+from sms.utils.profiler import enable_profiling, json_of, markdown_of, profiled
+from sms.utils.profiler import records_count, records_since, slowest_of
 
 
 __all__ = (
+        'build_outputs_from',
         'build_project',
+        'output_unreachable_scenes',
+        'update_scene_graph',
         )
 
 
 # Define Constants
 PROC = 'BUILD PROJECT'
 
+MANIFEST_NAME = '.manifest'
+"""str: file name of the digests of the outputs in the build directory."""
+
+BUILD_ORDER = (
+        BuildType.OUTLINE,
+        BuildType.PLOT,
+        BuildType.STRUCT,
+        BuildType.SCRIPT,
+        BuildType.NOVEL,
+        BuildType.INFO,
+        )
+"""tuple: build types in the order of building and reporting."""
+
+BUILD_NAMES = {
+        BuildType.OUTLINE: 'outline',
+        BuildType.PLOT: 'plot',
+        BuildType.STRUCT: 'struct',
+        BuildType.SCRIPT: 'script',
+        BuildType.NOVEL: 'novel',
+        BuildType.INFO: 'info',
+        }
+"""dict: output file name of each build type."""
+
+BUILDERS = {
+        BuildType.OUTLINE: ('sms.core.outlinebuilder', 'build_outline'),
+        BuildType.PLOT: ('sms.core.plotbuilder', 'build_plot'),
+        BuildType.STRUCT: ('sms.core.structbuilder', 'build_struct'),
+        BuildType.SCRIPT: ('sms.core.scriptbuilder', 'build_script'),
+        BuildType.NOVEL: ('sms.core.novelbuilder', 'build_novel'),
+        BuildType.INFO: ('sms.core.infobuilder', 'build_info'),
+        }
+"""dict: module and function of each builder, imported when the type is built."""
+
+RESOLVED_BUILDS = (
+        BuildType.OUTLINE,
+        BuildType.PLOT,
+        BuildType.SCRIPT,
+        BuildType.NOVEL,
+        )
+"""tuple: build types reading the story data with the name tags translated.
+
+The struct and info builders justify the columns by the raw tags, so they
+read the story data as compiled.
+"""
+
+RUBI_APPLYER = ('sms.core.rubiapplyer', 'apply_rubi_in_novel_data')
+"""tuple: module and function of rubi applyer."""
+
+
+class BuildFailure(Enum):
+    MISSING = auto()
+    CANNOT_WRITE = auto()
+    CANNOT_WRITE_RUBI = auto()
+
+
+@dataclass
+class BuildData(object):
+    codes: StoryData
+    resolved: StoryData
+    tags: dict
+    callings: dict
+    contents: OutputsData
+    is_comment: bool
+    is_rubi: bool
+    rubis: RubiData
+    rubi_scope: RubiScope
+    is_cached: bool
+
 
 # Main
 def build_project(args: Namespace) -> bool:
@@ -46,11 +129,38 @@ def build_project(args: Namespace) -> bool:
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    assets = get_assets_db()
-    if not assets or assets.is_empty():
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"assets db: {PROC}"))
+    is_profile = args.profile or args.cprofile or args.mprofile
+    if is_profile:
+        enable_profiling(args.cprofile, args.mprofile)
+
+    try:
+        is_built = _build_project(args)
+    finally:
+        records = disable_profiling() if is_profile else None
+
+    if records and not ProfileOutputter.output_profile(records):
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"profile data: {PROC}"))
+
+    if not is_built:
         return False
 
+    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+
+    return True
+
+
+def build_outputs_from(args: Namespace, assets: AssetIndex, codes: StoryData,
+        config: ProjectConfig, kept: dict = None) -> bool:
+    """Build and write the outputs of the args.
+
+    With the outputs kept from the last build, the builders whose inputs are
+    the same are skipped and their outputs are used again.
+    """
+    assert isinstance(args, Namespace)
+    assert isinstance(assets, AssetIndex)
+    assert isinstance(codes, StoryData)
+    assert isinstance(config, ProjectConfig)
+
     builds = {
             BuildType.OUTLINE: None,
             BuildType.PLOT: None,
@@ -59,140 +169,95 @@ def build_project(args: Namespace) -> bool:
             BuildType.STRUCT: None,
             }
 
-    if not _check_and_create_build_dir():
-        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"build directory: {PROC}"))
-        return False
-
-    srcs = get_srcs_db()
-    if not srcs or srcs.is_empty():
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"srcs db: {PROC}"))
-        return False
-
-    scenes = scenes_db_from(srcs)
-    if not scenes or scenes.is_empty():
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"scenes db: {PROC}"))
-        return False
-
-    codes = compile_codes(scenes, assets)
-    if not codes:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"story data: {PROC}"))
-        return False
-
-    logger.debug(msg.MSG_UNIMPLEMENT_PROC.format(proc=PROC))
-
-    nametags = nametags_from(assets)
+    nametags = nametags_from(assets, config)
     callings = callingtags_from(assets)
     is_comment = args.comment
 
-    contents = build_contents(codes, nametags)
+    with profiled('contents', 'build') as stage:
+        contents = build_contents(codes, nametags)
+        stage.records = _size_of(contents)
     if not contents:
         logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"contents data: {PROC}"))
         return False
 
-    if Checker.has(args, BuildType.OUTLINE):
-        outputs = build_outline(codes, nametags)
-        if not outputs or outputs.is_empty():
-            logger.error(
-                    msg.ERR_FAIL_MISSING_DATA.format(data=f"outline output data: {PROC}"))
-            return False
-
-        builds[BuildType.OUTLINE] = outputs
-
-        if not Outputter.output_data(_get_build_path('outline'),
-                contents.cloned() + outputs):
-            logger.error(
-                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output outline data: {PROC}"))
-            return False
-
-    if Checker.has(args, BuildType.PLOT):
-        outputs = build_plot(codes, nametags)
-        if not outputs or outputs.is_empty():
-            logger.error(
-                    msg.ERR_FAIL_MISSING_DATA.format(data=f"plot output data: {PROC}"))
-            return False
-
-        builds[BuildType.PLOT] = outputs
-
-        if not Outputter.output_data(_get_build_path('plot'),
-                contents.cloned() + outputs):
-            logger.error(
-                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output plot data: {PROC}"))
-            return False
-
-    if Checker.has(args, BuildType.STRUCT):
-        outputs = build_struct(codes, nametags, callings, is_comment)
-        if not outputs or outputs.is_empty():
-            logger.error(
-                    msg.ERR_FAIL_MISSING_DATA.format(data=f"struct output data: {PROC}"))
+    is_rubi = args.rubi and Checker.has(args, BuildType.NOVEL)
+    types = [type for type in BUILD_ORDER if Checker.has(args, type)]
+
+    build_data = BuildData(codes, codes, nametags, callings, contents, is_comment,
+            is_rubi, rubitags_from(assets) if is_rubi else None, config.rubi,
+            not args.nocache)
+
+    keys = {}
+    if kept is not None:
+        keys = {type: _inputs_key_of(build_data, type) for type in types}
+        for type in [type for type in types if type in kept and kept[type][0] == keys[type]]:
+            logger.debug(msg.PROC_MESSAGE.format(proc=f"same inputs of {BUILD_NAMES[type]}: {PROC}"))
+            if type in builds:
+                builds[type] = kept[type][1]
+            types.remove(type)
+
+    if any(type in RESOLVED_BUILDS for type in types):
+        with profiled('resolve tags', 'build') as stage:
+            build_data.resolved = tags_resolved_story_data(codes, nametags, callings)
+            stage.records = _size_of(build_data.resolved)
+
+    # NOTE: import the builders before forking not to import them on each worker
+    for type in types:
+        _function_of(BUILDERS[type])
+    if is_rubi:
+        _function_of(RUBI_APPLYER)
+
+    manifest = _get_manifest()
+
+    for type, (outputs, failure, stages, updates) in zip(types,
+            imap_forked(_build_and_output, types, build_data, jobs_count_of(args.jobs))):
+        add_records(stages)
+        manifest.add_updates(updates)
+        if failure:
+            Reporter.report_failure(type, failure)
             return False
 
-        builds[BuildType.STRUCT] = outputs
+        if type in builds:
+            builds[type] = outputs
+        if kept is not None:
+            kept[type] = (keys[type], outputs)
 
-        if not Outputter.output_data(_get_build_path('struct'),
-                contents.cloned() + outputs):
-            logger.error(
-                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output struct data: {PROC}"))
-            return False
-
-    if Checker.has(args, BuildType.SCRIPT):
-        outputs = build_script(codes, nametags, callings, is_comment)
-        if not outputs or outputs.is_empty():
-            logger.error(
-                    msg.ERR_FAIL_MISSING_DATA.format(data=f"script output data: {PROC}"))
-            return False
-
-        builds[BuildType.SCRIPT] = outputs
-
-        if not Outputter.output_data(_get_build_path('script'),
-                contents.cloned() + outputs):
-            logger.error(
-                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output script data: {PROC}"))
-            return False
+    with profiled('base info', 'output'):
+        is_base_built = BaseInfoBuilder.build_base_info(args, builds, config)
+    if not is_base_built:
+        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"base info outputs: {PROC}"))
+        return False
 
-    if Checker.has(args, BuildType.NOVEL):
-        outputs = build_novel(codes, nametags, callings, is_comment)
-        if not outputs or outputs.is_empty():
-            logger.error(
-                    msg.ERR_FAIL_MISSING_DATA.format(data=f"novel output data: {PROC}"))
-            return False
+    written, skipped = manifest.summary()
+    if not manifest.save():
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"outputs manifest: {PROC}"))
+    Reporter.report_outputs(written, skipped)
 
-        builds[BuildType.NOVEL] = outputs
+    return True
 
-        if not Outputter.output_data(_get_build_path('novel'),
-                contents.cloned() + outputs):
-            logger.error(
-                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output novel data: {PROC}"))
-            return False
 
-        if args.rubi:
-            outputs_rubi = outputs.cloned()
-            rubis = rubitags_from(assets)
-            updated_rubi = apply_rubi_in_novel_data(outputs_rubi, rubis)
+def update_scene_graph(args: Namespace, graph: SceneGraph, old: SceneGraph,
+        codes: StoryData) -> SceneImpact:
+    """Report the scenes and the outputs changed from the old graph, and save the graph."""
+    assert isinstance(args, Namespace)
+    assert isinstance(graph, SceneGraph)
+    assert isinstance(old, SceneGraph)
+    assert isinstance(codes, StoryData)
 
-            if not Outputter.output_data(_get_build_path('novel_rubi'),
-                    contents.cloned() + updated_rubi):
-                logger.error(
-                        msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output novel with rubi data: {PROC}"))
-                return False
+    impact = graph.impact_from(old, codes)
+    Reporter.report_impact(graph, impact, _output_names_of(args) if impact.affected else [])
 
-    if Checker.has(args, BuildType.INFO):
-        outputs = build_info(codes, nametags, callings)
-        if not outputs or outputs.is_empty():
-            logger.debug(msg.ERR_FAIL_MISSING_DATA.format(data=f"info output data: {PROC}"))
-            return False
+    if not save_scene_graph(graph):
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"scene graph: {PROC}"))
 
-        if not Outputter.output_data(_get_build_path('info'),
-                outputs):
-            logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output info data: {PROC}"))
-            return False
+    return impact
 
-    if not BaseInfoBuilder.build_base_info(args, builds):
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"base info outputs: {PROC}"))
-        return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+def output_unreachable_scenes(scenes: LazyScenesDB) -> bool:
+    """Write the scenes not converted in compiling, or remove the old list."""
+    assert isinstance(scenes, LazyScenesDB)
 
-    return True
+    return Outputter.output_unreachable(scenes.unused_tags())
 
 
 # Processes
@@ -221,17 +286,18 @@ class Checker(object):
 class BaseInfoBuilder(object):
 
     @classmethod
-    def build_base_info(cls, args: Namespace, outputs_data: dict) -> bool:
+    def build_base_info(cls, args: Namespace, outputs_data: dict, config: ProjectConfig) -> bool:
         assert isinstance(args, Namespace)
         assert isinstance(outputs_data, dict)
+        assert isinstance(config, ProjectConfig)
 
         tmp = OutputsData(['BASE INFO\n===\n\n'])
-        columns, rows = _get_columns_and_rows()
+        columns, rows = config.columns, config.rows
 
         for type, outputs in outputs_data.items():
             if Checker.has(args, type) and outputs:
                 assert isinstance(outputs, OutputsData)
-                ret = char_counts_from(type, outputs.get_data(), columns, rows)
+                ret = char_counts_from(type, outputs.stats, columns, rows)
                 if ret:
                     tmp += OutputsData(ret)
 
@@ -248,21 +314,245 @@ class BaseInfoBuilder(object):
         return True
 
 
+class Reporter(object):
+
+    def report_failure(type: BuildType, failure: BuildFailure) -> None:
+        assert isinstance(type, BuildType)
+        assert isinstance(failure, BuildFailure)
+
+        name = BUILD_NAMES[type]
+
+        if BuildFailure.MISSING is failure:
+            if BuildType.INFO is type:
+                logger.debug(msg.ERR_FAIL_MISSING_DATA.format(data=f"{name} output data: {PROC}"))
+            else:
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"{name} output data: {PROC}"))
+        elif BuildFailure.CANNOT_WRITE is failure:
+            logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output {name} data: {PROC}"))
+        elif BuildFailure.CANNOT_WRITE_RUBI is failure:
+            logger.error(
+                    msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"output {name} with rubi data: {PROC}"))
+
+    def report_impact(graph: SceneGraph, impact: SceneImpact, outputs: list) -> None:
+        assert isinstance(graph, SceneGraph)
+        assert isinstance(impact, SceneImpact)
+        assert isinstance(outputs, list)
+
+        for tag in impact.changed:
+            node = graph.nodes.get(tag)
+            logger.debug(msg.PROC_MESSAGE.format(
+                proc=f"changed scene '{tag}' in {node.path}:{node.lines[0]}-{node.lines[1]}"
+                if node else f"removed scene '{tag}'"))
+        for tag, start, end in impact.ranges:
+            logger.debug(msg.PROC_MESSAGE.format(proc=f"changed story data of '{tag}': {start}-{end}"))
+
+        if impact.changed:
+            logger.info(msg.PROC_MESSAGE_WITH_DATA.format(
+                proc=f"{len(impact.changed)} scenes changed, invalidated outputs"),
+                ', '.join(outputs) if outputs else '-')
+
+    def report_outputs(written: list, skipped: list) -> None:
+        assert isinstance(written, list)
+        assert isinstance(skipped, list)
+
+        if written:
+            logger.debug(msg.PROC_MESSAGE_WITH_DATA.format(proc=f"written outputs: {PROC}"),
+                    ', '.join(written))
+        logger.info(msg.PROC_MESSAGE.format(
+            proc=f"wrote {len(written)} outputs, skipped {len(skipped)} unchanged"))
+
+
 class Outputter(object):
 
-    def output_data(path: str, outputs: OutputsData) -> bool:
+    def output_data(path: str, outputs: OutputsData, header: OutputsData = None) -> bool:
         assert isinstance(path, str)
         assert isinstance(outputs, OutputsData)
 
-        if not write_file(path, outputs.get_serialized_data()):
+        # NOTE: the segments of the header and the outputs are streamed in order, without joining
+        segments = header.segments + outputs.segments if header else outputs.segments
+
+        if not _get_manifest().write(path, *segments):
             logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"outputs data to {path}: {PROC}"))
             return False
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"write {path}"))
         return True
 
+    def output_unreachable(tags: list) -> bool:
+        assert isinstance(tags, list)
+
+        path = _get_build_path('unreachable')
+
+        if not tags:
+            return _get_manifest().remove(path)
+
+        data = ['UNREACHABLE SCENES\n===\n\n',
+                'Scenes not called from the entrypoint, which are not converted.\n\n']
+        data.extend(f"- {tag}\n" for tag in tags)
+
+        if not _get_manifest().write(path, data):
+            return False
+
+        logger.info(msg.PROC_MESSAGE.format(proc=f"{len(tags)} scenes unreachable from the entrypoint: {path}"))
+
+        return True
+
+
+class ProfileOutputter(object):
+
+    def output_profile(records: list) -> bool:
+        assert isinstance(records, list)
+
+        if not _check_and_create_build_dir():
+            return False
+
+        if not write_file(_get_build_path('profile'), markdown_of(records)):
+            return False
+
+        if not write_file(_get_build_path('profile', EXT_JSON), json_of(records)):
+            return False
+
+        slowest = slowest_of(records)
+        if slowest:
+            path = _get_build_path('profile', EXT_PROFILE)
+            if not dump_stats(path, slowest):
+                return False
+            logger.info(msg.PROC_MESSAGE.format(proc=f"cProfile of '{slowest.name}' to {path}"))
+
+        logger.debug(msg.PROC_MESSAGE.format(proc=f"ouputted profile: {PROC}"))
+
+        return True
+
 
 # Private Functions
+def _build_project(args: Namespace) -> bool:
+    assert isinstance(args, Namespace)
+
+    is_cached = not args.nocache
+
+    config = get_project_config()
+    if not config:
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"config file: {PROC}"))
+        return False
+    PM.set_project_dirs(config.asset, config.source)
+
+    with profiled('assets', 'load') as stage:
+        assets_db = get_assets_db(is_cached, jobs_count_of(args.jobs))
+        stage.records = _size_of(assets_db)
+    if not assets_db or assets_db.is_empty():
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"assets db: {PROC}"))
+        return False
+    assets = AssetIndex(assets_db)
+
+    if not _check_and_create_build_dir():
+        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"build directory: {PROC}"))
+        return False
+
+    with profiled('sources', 'load') as stage:
+        srcs = get_srcs_db(is_cached)
+        stage.records = _size_of(srcs)
+    if not srcs or srcs.is_empty():
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"srcs db: {PROC}"))
+        return False
+
+    with profiled('scenes', 'load') as stage:
+        scenes = scenes_db_from(srcs)
+        stage.records = _size_of(scenes)
+    if not scenes or scenes.is_empty():
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"scenes db: {PROC}"))
+        return False
+
+    with profiled('compile', 'compile') as stage:
+        codes = compile_codes(scenes, assets, config, not args.nofuse)
+        stage.records = _size_of(codes)
+    if not codes:
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"story data: {PROC}"))
+        return False
+
+    if not output_unreachable_scenes(scenes):
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"unreachable scenes: {PROC}"))
+
+    with profiled('scene graph', 'compile'):
+        graph = scene_graph_from(scenes, config.entrypoint)
+    if graph:
+        update_scene_graph(args, graph, load_scene_graph(), codes)
+
+    logger.debug(msg.MSG_UNIMPLEMENT_PROC.format(proc=PROC))
+
+    return build_outputs_from(args, assets, codes, config)
+
+
+def _build_and_output(data: BuildData, type: BuildType) -> tuple:
+    assert isinstance(data, BuildData)
+    assert isinstance(type, BuildType)
+
+    # NOTE: run on the forked workers too, so failures, profiled stages and
+    #       written outputs are returned
+    start = records_count()
+    manifest = _get_manifest()
+    written = manifest.updates_count()
+    outputs, failure = _build_and_write(data, type)
+
+    return outputs, failure, records_since(start), manifest.updates_since(written)
+
+
+def _build_and_write(data: BuildData, type: BuildType) -> tuple:
+    assert isinstance(data, BuildData)
+    assert isinstance(type, BuildType)
+
+    name = BUILD_NAMES[type]
+
+    with profiled(name, 'build') as stage:
+        outputs = _build_outputs_of(data, type)
+        stage.records = _size_of(outputs)
+    if not outputs or outputs.is_empty():
+        return None, BuildFailure.MISSING
+
+    header = None if BuildType.INFO is type else data.contents
+
+    with profiled(f"write {name}", 'output'):
+        is_written = Outputter.output_data(_get_build_path(name), outputs, header)
+    if not is_written:
+        return None, BuildFailure.CANNOT_WRITE
+
+    if BuildType.NOVEL is type and data.is_rubi:
+        with profiled('novel rubi', 'build') as stage:
+            updated_rubi = _function_of(RUBI_APPLYER)(outputs, data.rubis, data.rubi_scope)
+            stage.records = _size_of(updated_rubi)
+
+        with profiled('write novel rubi', 'output'):
+            is_written = Outputter.output_data(_get_build_path('novel_rubi'),
+                    updated_rubi, data.contents)
+        if not is_written:
+            return None, BuildFailure.CANNOT_WRITE_RUBI
+
+    return outputs, None
+
+
+def _build_outputs_of(data: BuildData, type: BuildType) -> OutputsData:
+    assert isinstance(data, BuildData)
+    assert isinstance(type, BuildType)
+
+    builder = _function_of(BUILDERS[type])
+    codes = data.resolved if type in RESOLVED_BUILDS else data.codes
+
+    if type in (BuildType.OUTLINE, BuildType.PLOT):
+        return builder(codes, data.tags)
+    elif BuildType.STRUCT is type:
+        return builder(codes, data.tags, data.callings, data.is_comment)
+    elif type in (BuildType.SCRIPT, BuildType.NOVEL):
+        # NOTE: the fragments are saved here, as the builder may run on a worker
+        cache = get_fragment_cache(BUILD_NAMES[type]) if data.is_cached else None
+        outputs = builder(codes, data.tags, data.callings, data.is_comment, cache)
+        if cache and not cache.save():
+            logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"fragment cache: {PROC}"))
+        return outputs
+    elif BuildType.INFO is type:
+        return builder(codes, data.tags, data.callings)
+    else:
+        return None
+
+
 def _check_and_create_build_dir() -> bool:
     build_dir = os.path.join(DIR_PROJECT, DIR_BUILD_NAME)
 
@@ -273,13 +563,71 @@ def _check_and_create_build_dir() -> bool:
     return True
 
 
-def _get_build_path(fname: str) -> str:
+def _function_of(path: tuple) -> Callable:
+    assert isinstance(path, tuple)
+
+    module, name = path
+    return getattr(importlib.import_module(module), name)
+
+
+_manifests = {}
+"""dict: outputs manifests loaded in this process."""
+
+
+def _get_manifest() -> OutputManifest:
+    path = _get_build_path(MANIFEST_NAME, EXT_JSON)
+
+    if path not in _manifests:
+        manifest = OutputManifest(path)
+        if not manifest.load():
+            logger.debug(msg.PROC_MESSAGE.format(proc=f"new outputs manifest: {PROC}"))
+        _manifests[path] = manifest
+
+    return _manifests[path]
+
+
+def _get_build_path(fname: str, ext: str = EXT_MARKDOWN) -> str:
     assert isinstance(fname, str)
+    assert isinstance(ext, str)
 
     dir_name = os.path.join(DIR_PROJECT, DIR_BUILD_NAME)
-    return os.path.join(dir_name, add_extention(fname, EXT_MARKDOWN))
+    return os.path.join(dir_name, add_extention(fname, ext))
+
+
+def _inputs_key_of(data: BuildData, type: BuildType) -> tuple:
+    """Return the key of the inputs of the builder, with the story data compared by identity."""
+    assert isinstance(data, BuildData)
+    assert isinstance(type, BuildType)
+
+    if type in (BuildType.OUTLINE, BuildType.PLOT):
+        # NOTE: the calling keys are left in the story data resolved for them
+        inputs = (data.tags, {tag: list(calling.keys()) for tag, calling in data.callings.items()})
+    elif BuildType.INFO is type:
+        inputs = (data.tags, data.callings)
+    elif BuildType.NOVEL is type:
+        inputs = (data.tags, data.callings, data.is_comment, data.is_rubi, data.rubis,
+                data.rubi_scope)
+    else:
+        inputs = (data.tags, data.callings, data.is_comment)
+
+    # NOTE: the callings are pickled as their tables, so the same tables give the same digest
+    return data.codes, digest_of(*inputs)
+
+
+def _output_names_of(args: Namespace) -> list:
+    assert isinstance(args, Namespace)
+
+    tmp = [BUILD_NAMES[type] for type in BUILD_ORDER if Checker.has(args, type)]
+
+    if args.rubi and Checker.has(args, BuildType.NOVEL):
+        tmp.append('novel_rubi')
+    tmp.append('base')
+
+    return tmp
 
 
-def _get_columns_and_rows() -> tuple:
-    data = yaml.safe_load(read_file(FILE_CONFIG))['config']
-    return data['columns'], data['rows']
+def _size_of(data: Any) -> int:
+    # NOTE: the dbs keep their records in data, and the outputs in the segments
+    if isinstance(data, OutputsData):
+        return len(data)
+    return len(data.data) if data else 0
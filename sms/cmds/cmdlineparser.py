@@ -76,7 +76,9 @@ def _set_parser_options(parser: ArgumentParser) -> bool:
     _PROC = f"{PROC}: set parser options"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
-    parser.add_argument('cmd', metavar='command', type=str, help='builder command')
+    parser.add_argument('cmd', metavar='command', type=str,
+            help='builder command (build, watch or init); watch compiles the story again on each change,'
+            ' and runs only the builders whose inputs changed')
     parser.add_argument('-o', '--outline', help='outline output', action='store_true')
     parser.add_argument('-p', '--plot', help='plot output', action='store_true')
     parser.add_argument('-i', '--info', help='scene info output', action='store_true')
@@ -89,6 +91,12 @@ def _set_parser_options(parser: ArgumentParser) -> bool:
     parser.add_argument('-e', '--edit', help='add and edit when new file', action='store_true')
     parser.add_argument('--part', type=str, help='select ouput part')
     parser.add_argument('--comment', help='show comment', action='store_true')
+    parser.add_argument('--nocache', help='build without parse and fragment caches', action='store_true')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of build processes (0 for all cores)')
+    parser.add_argument('--nofuse', help='run compile passes one by one', action='store_true')
+    parser.add_argument('--profile', help='write build/profile.md of the build stages', action='store_true')
+    parser.add_argument('--cprofile', help='profile and dump cProfile of the slowest stage', action='store_true')
+    parser.add_argument('--mprofile', help='profile with the traced memory of the stages', action='store_true')
     parser.add_argument('--debug', help='set debug flag', action='store_true')
     parser.add_argument('--debugdetail', help='set detal debug output', action='store_true')
 
@@ -0,0 +1,230 @@
+"""Watch module."""
+
+# Official Libraries
+import os
+import time
+from argparse import Namespace
+from dataclasses import dataclass, field
+
+
+# My Modules
+from sms.cmds.builder import build_outputs_from, output_unreachable_scenes
+from sms.cmds.builder import update_scene_graph
+from sms.commons.pathmanager import PathManager as PM
+from sms.commons.projectconfig import ProjectConfig, get_project_config
+from sms.core.compiler import compile_codes
+from sms.core.dbmanager import get_assets_db, get_srcs_db
+from sms.core.dbmanager import load_scene_graph, scene_graph_from, scenes_db_from
+from sms.core.nametagconv import timeclocks_from
+from sms.db.assetindex import AssetIndex
+from sms.db.scenegraph import SceneGraph
+from sms.db.scenes import ScenesDB
+from sms.db.storydata import StoryData
+from sms.syss import messages as msg
+from sms.syss.paths import DIR_PROJECT, DIR_BUILD_NAME
+from sms.syss.paths import EXT_MARKDOWN, EXT_YAML, FILE_CONFIG
+from sms.utils.filepath import get_filepaths_in
+from sms.utils.log import logger
+from sms.utils.pools import jobs_count_of
+
+
+__all__ = (
+        'watch_project',
+        )
+
+
+# Define Constants
+PROC = 'WATCH PROJECT'
+
+POLL_INTERVAL = 0.5
+"""float: seconds between the checks of the project files."""
+
+DEBOUNCE_TIME = 0.3
+"""float: seconds the files must stay unchanged before rebuilding."""
+
+
+@dataclass
+class WatchState(object):
+    stamps: dict = field(default_factory=dict)
+    converted: dict = field(default_factory=dict)
+    assets: AssetIndex = None
+    scenes: ScenesDB = None
+    timeclocks: dict = None
+    config: ProjectConfig = None
+    codes: StoryData = None
+    graph: SceneGraph = None
+    builds: dict = field(default_factory=dict)
+    """dict: keys of the inputs and the outputs of the last build by the build type."""
+
+
+# Main
+def watch_project(args: Namespace) -> bool:
+    assert isinstance(args, Namespace)
+
+    logger.debug(msg.PROC_START.format(proc=PROC))
+
+    build_dir = os.path.join(DIR_PROJECT, DIR_BUILD_NAME)
+    if not os.path.exists(build_dir):
+        os.makedirs(build_dir)
+
+    state = WatchState()
+    state.stamps = _stamps_of_project()
+
+    _rebuild_logged(args, state, list(state.stamps.keys()))
+    # NOTE: the dirs named in the config are watched from the first build
+    state.stamps = _stamps_of_project()
+
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            stamps = _stamps_of_project()
+            if stamps == state.stamps:
+                continue
+
+            stamps = _stamps_debounced(stamps)
+            changed = _changed_paths(state.stamps, stamps)
+            state.stamps = stamps
+            if changed:
+                _rebuild_logged(args, state, changed)
+    except KeyboardInterrupt:
+        logger.debug(msg.PROC_MESSAGE.format(proc=f"stop watching: {PROC}"))
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+
+    return True
+
+
+# Processes
+class Rebuilder(object):
+
+    @classmethod
+    def rebuild(cls, args: Namespace, state: WatchState, changed: list) -> bool:
+        assert isinstance(args, Namespace)
+        assert isinstance(state, WatchState)
+        assert isinstance(changed, list)
+
+        start = time.perf_counter()
+        is_cached = not args.nocache
+        is_config = FILE_CONFIG in changed or not state.config
+        is_assets = is_config or not state.assets or cls._has_changed_in(changed, PM.get_asset_dir_path())
+        is_srcs = not state.scenes or cls._has_changed_in(changed, PM.get_src_dir_path())
+
+        if is_config:
+            config = get_project_config()
+            if not config:
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"config file: {PROC}"))
+                return False
+            # NOTE: the sources in another dir are read again, and the assets are by the config
+            is_srcs = is_srcs or not state.config or config.source != state.config.source
+            PM.set_project_dirs(config.asset, config.source)
+            state.config = config
+
+        if is_assets:
+            assets = get_assets_db(is_cached, jobs_count_of(args.jobs))
+            if not assets or assets.is_empty():
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"assets db: {PROC}"))
+                return False
+            state.assets = AssetIndex(assets)
+
+        if is_srcs:
+            srcs = get_srcs_db(is_cached)
+            if not srcs or srcs.is_empty():
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"srcs db: {PROC}"))
+                return False
+
+            scenes = scenes_db_from(srcs, state.converted)
+            if not scenes or scenes.is_empty():
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"scenes db: {PROC}"))
+                return False
+            state.scenes = scenes
+
+        # NOTE: the sources changed only out of the scenes called from the entrypoint
+        #       keep the story data
+        if is_srcs or is_config:
+            graph = scene_graph_from(state.scenes, state.config.entrypoint)
+        else:
+            graph = state.graph
+        is_story = not graph or not state.graph or not graph.impact_from(state.graph).is_empty()
+
+        # NOTE: the assets are used in compiling only as the time clocks
+        timeclocks = timeclocks_from(state.assets)
+        is_compiled = is_story or is_config or not state.codes or timeclocks != state.timeclocks
+        if is_compiled:
+            codes = compile_codes(state.scenes, state.assets, state.config, not args.nofuse)
+            if not codes:
+                logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"story data: {PROC}"))
+                return False
+            state.codes = codes
+            state.timeclocks = timeclocks
+        if graph and graph is not state.graph:
+            update_scene_graph(args, graph, state.graph or load_scene_graph(), state.codes)
+            state.graph = graph
+        if is_srcs and not output_unreachable_scenes(state.scenes):
+            logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"unreachable scenes: {PROC}"))
+
+        if not is_compiled and not is_assets:
+            logger.info(msg.PROC_MESSAGE.format(proc="no scene called from the entrypoint changed"))
+        elif not build_outputs_from(args, state.assets, state.codes, state.config, state.builds):
+            logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"build outputs: {PROC}"))
+            return False
+
+        logger.info(msg.PROC_DONE_WITH_DATA.format(proc=f"rebuilt in {time.perf_counter() - start:.2f}s"),
+                ', '.join(os.path.basename(path) for path in changed[:3]) + (' ...' if len(changed) > 3 else ''))
+
+        return True
+
+    def _has_changed_in(changed: list, dirname: str) -> bool:
+        assert isinstance(changed, list)
+        assert isinstance(dirname, str)
+
+        return any(path.startswith(dirname + os.sep) for path in changed)
+
+
+# Private Functions
+def _rebuild_logged(args: Namespace, state: WatchState, changed: list) -> bool:
+    """Rebuild the project, logging the error of the rebuild to keep watching."""
+    assert isinstance(args, Namespace)
+    assert isinstance(state, WatchState)
+    assert isinstance(changed, list)
+
+    try:
+        return Rebuilder.rebuild(args, state, changed)
+    except Exception as err:
+        # NOTE: the state is updated only by the finished steps, so the next change rebuilds again
+        logger.error(msg.ERR_FAIL_PROC_WITH_DATA.format(proc=f"rebuild: {PROC}"), err)
+        return False
+
+
+def _changed_paths(old: dict, new: dict) -> list:
+    assert isinstance(old, dict)
+    assert isinstance(new, dict)
+
+    return sorted(path for path in set(old.keys()) | set(new.keys())
+            if old.get(path) != new.get(path))
+
+
+def _stamps_debounced(stamps: dict) -> dict:
+    assert isinstance(stamps, dict)
+
+    while True:
+        time.sleep(DEBOUNCE_TIME)
+        current = _stamps_of_project()
+        if current == stamps:
+            return current
+        stamps = current
+
+
+def _stamps_of_project() -> dict:
+    paths = get_filepaths_in(PM.get_src_dir_path(), EXT_MARKDOWN, True) \
+            + get_filepaths_in(PM.get_asset_dir_path(), EXT_YAML, True) \
+            + [FILE_CONFIG]
+    tmp = {}
+
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        tmp[path] = (stat.st_size, stat.st_mtime_ns)
+
+    return tmp
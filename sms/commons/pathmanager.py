@@ -4,7 +4,7 @@
 import os
 
 # My Modules
-from sms.syss.paths import DIR_PROJECT
+from sms.syss.paths import DIR_PROJECT, DIR_BUILD_NAME
 
 
 __all__ = (
@@ -17,17 +17,33 @@ DEFAULT_ASSET_DIR = 'assets'
 
 DEFAULT_SRC_DIR = 'src'
 
+DEFAULT_CACHE_DIR = '.cache'
+
 
 # Main
 class PathManager(object):
 
     asset_dir = os.path.join(DIR_PROJECT, DEFAULT_ASSET_DIR)
     src_dir = os.path.join(DIR_PROJECT, DEFAULT_SRC_DIR)
+    cache_dir = os.path.join(DIR_PROJECT, DIR_BUILD_NAME, DEFAULT_CACHE_DIR)
 
     @classmethod
     def get_asset_dir_path(cls) -> str:
         return cls.asset_dir
 
+    @classmethod
+    def get_cache_dir_path(cls) -> str:
+        return cls.cache_dir
+
     @classmethod
     def get_src_dir_path(cls) -> str:
         return cls.src_dir
+
+    @classmethod
+    def set_project_dirs(cls, asset: str, source: str) -> None:
+        """Set the asset and source dirs in the project, named in the config."""
+        assert isinstance(asset, str)
+        assert isinstance(source, str)
+
+        cls.asset_dir = os.path.join(DIR_PROJECT, asset)
+        cls.src_dir = os.path.join(DIR_PROJECT, source)
@@ -0,0 +1,80 @@
+"""Project config module."""
+
+# Official Libraries
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+
+
+# My Modules
+from sms.syss.paths import FILE_CONFIG
+from sms.types.rubi import RubiScope
+from sms.utils import assertion
+from sms.utils.fileio import read_file
+from sms.utils.yamls import yaml_data_from
+
+
+__all__ = (
+        'ProjectConfig',
+        'get_project_config',
+        )
+
+
+# Define Constants
+ELM_CONFIG = 'config'
+
+
+@dataclass(frozen=True)
+class ProjectConfig(object):
+    entrypoint: str = 'main'
+    columns: int = 20
+    rows: int = 20
+    mobs: int = 20
+    asset: str = 'assets'
+    source: str = 'src'
+    rubi: RubiScope = RubiScope.NOVEL
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProjectConfig:
+        assert isinstance(data, dict)
+
+        default = cls()
+
+        return cls(
+                assertion.is_str(data.get('entrypoint', default.entrypoint)),
+                assertion.is_int(data.get('columns', default.columns)),
+                assertion.is_int(data.get('rows', default.rows)),
+                assertion.is_int(data.get('mobs', default.mobs)),
+                assertion.is_str(data.get('asset', default.asset)),
+                assertion.is_str(data.get('source', default.source)),
+                RubiScope(data.get('rubi', str(default.rubi))),
+                )
+
+
+_configs = {}
+"""dict: loaded configs and the stamps of the files by path."""
+
+
+# Main
+def get_project_config(path: str = FILE_CONFIG) -> ProjectConfig:
+    """Return the config loaded once, which is loaded again when the file is changed."""
+    assert isinstance(path, str)
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _configs.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    data = yaml_data_from(read_file(path))
+    if not isinstance(data, dict) or not isinstance(data.get(ELM_CONFIG), dict):
+        return None
+
+    config = ProjectConfig.from_dict(data[ELM_CONFIG])
+    _configs[path] = (stamp, config)
+
+    return config
@@ -4,20 +4,22 @@
 
 
 # My Modules
+from sms.core.passmanager import CodePass, PassManager
 from sms.objs.action import Action
 from sms.objs.basecode import BaseCode
 from sms.objs.instruction import Instruction
 from sms.objs.sceneend import SceneEnd
-from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.instruction import InstType
 from sms.utils import assertion
 from sms.utils.dicts import dict_sorted
 from sms.utils.log import logger
+from sms.utils.strtranslate import TagTranslator
 from sms.utils.strtranslate import translate_tags_str
 
 
 __all__ = (
+        'AliasPass',
         'apply_alias',
         )
 
@@ -30,39 +32,43 @@ PROC = 'ALIAS CONV'
 def apply_alias(data: list) -> list:
     assert isinstance(data, list)
 
-    # TODO: 現在はそのシーンのみでAlias置換を行っているが、レベルが深くなっても維持するように変更する
-
-    tmp = []
-    alias = {}
-
-    for record in data:
-        assert isinstance(record, BaseCode)
-        if isinstance(record, SceneInfo):
-            tmp.append(record)
-        elif isinstance(record, SceneEnd):
-            tmp.append(record)
-            alias = {}
-        elif isinstance(record, Instruction) and InstType.ALIAS is record.type:
-            tokens = assertion.is_list(record.args)
-            alias[tokens[0]] = tokens[2]
-        elif isinstance(record, Action):
-            ret = TagConv.apply_alias_to_action(
-                    record, dict_sorted(alias, True))
-            tmp.append(ret)
-        else:
-            tmp.append(record)
+    tmp = PassManager([AliasPass()]).run(data)
 
     logger.debug(msg.PROC_MESSAGE.format(proc=f"completed apply alias: {PROC}"))
 
     return tmp
 
 
+class AliasPass(CodePass):
+
+    name = 'alias'
+
+    def __init__(self):
+        # TODO: 現在はそのシーンのみでAlias置換を行っているが、レベルが深くなっても維持するように変更する
+        self.alias = {}
+        self.translator = None
+
+    def step(self, record: BaseCode) -> BaseCode:
+        if isinstance(record, SceneEnd):
+            self.alias = {}
+            self.translator = None
+        elif isinstance(record, Instruction) and InstType.ALIAS is record.type:
+            tokens = assertion.is_list(record.args)
+            self.alias[tokens[0]] = tokens[2]
+            self.translator = None
+        elif isinstance(record, Action) and self.alias:
+            if not self.translator:
+                self.translator = TagTranslator(dict_sorted(self.alias, True))
+            return TagConv.apply_alias_to_action(record, self.translator)
+        return record
+
+
 # Processes
 class TagConv(object):
 
-    def apply_alias_to_action(record: Action, alias: dict) -> Action:
+    def apply_alias_to_action(record: Action, alias: TagTranslator) -> Action:
         assert isinstance(record, Action)
-        assert isinstance(alias, dict)
+        assert isinstance(alias, TagTranslator)
 
         descs = [translate_tags_str(desc, alias) for desc in record.descs]
 
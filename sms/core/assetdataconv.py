@@ -1,7 +1,6 @@
 """Data converter for assets data."""
 
 # Official Libraries
-import yaml
 from typing import Any
 
 
@@ -16,6 +15,7 @@ from sms.syss import messages as msg
 from sms.types.asset import AssetType
 from sms.utils import assertion
 from sms.utils.log import logger
+from sms.utils.yamls import yaml_data_from
 
 
 __all__ = (
@@ -37,7 +37,7 @@ def asset_object_from(data: str) -> SObject:
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    tmp = assertion.is_dict(yaml.safe_load(data))
+    tmp = assertion.is_dict(yaml_data_from(data))
 
     obj = None
 
@@ -3,17 +3,21 @@
 # Official Libraries
 import re
 from dataclasses import dataclass
+from enum import auto, Enum
 
 # My Modules
 from sms.commons.format import get_br, get_breakline
 from sms.syss import messages as msg
 from sms.types.build import BuildType
-from sms.utils.counts import count_lines_by_columns, count_white_space
+from sms.utils.counts import CharStats
 from sms.utils.log import logger
+from sms.utils.slots import slotted
 from sms.utils.strings import just_string_of, rid_rn
 
 __all__ = (
+        'StatsRecorder',
         'char_counts_from',
+        'scene_stats_from',
         )
 
 
@@ -31,13 +35,44 @@ class CountRecord(object):
     papers: float
 
 
-TITLE_PREFIX = re.compile(r'^[0-9]+\. ')
+@slotted
+@dataclass
+class SceneStats(object):
+    level: int
+    title: str
+    stats: CharStats
+
+
+class MarkType(Enum):
+    HEAD = auto()
+    TEXT = auto()
+    END = auto()
+
+
+@slotted
+@dataclass
+class StatsMark(object):
+    type: MarkType
+    level: int = 0
+    title: str = None
+    stats: CharStats = None
+
 
-NOVEL_TITLE_PREFIX = re.compile(r'^#+ ')
+HEAD_PREFIX = re.compile(r'^#+ ')
+
+SKIPPED_TEXTS = {
+        BuildType.OUTLINE: re.compile(r'^(?:#|<!--|\*\* )'),
+        BuildType.PLOT: re.compile(r'^(?:#|<!--|\*\* )'),
+        BuildType.SCRIPT: re.compile(r'^(?:<!--|----)|[0-9]+\.'),
+        BuildType.NOVEL: re.compile(r'^(?:<!--|----)|[0-9]+\.'),
+        BuildType.STRUCT: re.compile(r'^(?:<!--|----|\[|>>)|[0-9]+\.'),
+        }
+"""dict: patterns of the output lines not counted as the text by the build type."""
 
 
 # Main
 def char_counts_from(type: BuildType, data: list, columns: int, rows: int) -> list:
+    """Format the char counts of the scene stats made by scene_stats_from."""
     assert isinstance(type, BuildType)
     assert isinstance(data, list)
     assert isinstance(columns, int)
@@ -60,168 +95,156 @@ def char_counts_from(type: BuildType, data: list, columns: int, rows: int) -> li
     return formatted
 
 
+def scene_stats_from(marks: list) -> list:
+    """Return the scenes with their char stats from the marks of a builder.
+
+    The scene of each level counts the text until the next head of the level
+    or its end, so the text after a deeper scene counts in it too, as the
+    counts so far. The text between two marks is added to the open scenes once.
+    """
+    assert isinstance(marks, list)
+
+    tmp = []
+    opened = []
+
+    for mark in marks:
+        assert isinstance(mark, StatsMark)
+        if MarkType.TEXT is mark.type:
+            for scene in opened:
+                if scene:
+                    scene.stats += mark.stats
+        elif MarkType.HEAD is mark.type:
+            while len(opened) <= mark.level:
+                opened.append(None)
+            opened[mark.level] = SceneStats(mark.level, mark.title, CharStats())
+            tmp.append(opened[mark.level])
+        elif mark.level < len(opened):
+            opened[mark.level] = None
+
+    logger.debug(msg.PROC_MESSAGE.format(proc=f"summed {len(tmp)} scene stats: {PROC}"))
+
+    return tmp
+
+
 # Processes
-class CharCounter(object):
+class StatsRecorder(object):
+    """Marks of the scene heads, texts and ends, put by a formatter with its outputs.
 
-    @classmethod
-    def counts_data_from(cls, type: BuildType,
-            data: list, columns: int, rows: int) -> list:
+    The marks keep the places of the output lines, and are read after the
+    tags of the lines are translated, without the lines skipped by the type.
+    """
+
+    def __init__(self, type: BuildType):
         assert isinstance(type, BuildType)
-        assert isinstance(data, list)
-        assert isinstance(columns, int)
-        assert isinstance(rows, int)
 
-        if type in [BuildType.OUTLINE, BuildType.PLOT]:
-            return cls._counts_outline_from(type, data, columns, rows)
-        elif type in [BuildType.SCRIPT, BuildType.NOVEL, BuildType.STRUCT]:
-            return cls._counts_data_from(type, data, columns, rows)
-        else:
-            return []
+        self._marks = []
+        self._level = 0
+        self._skipped = SKIPPED_TEXTS[type]
 
-    @classmethod
-    def _counts_data_from(cls, type: BuildType,
-            data: list, columns: int, rows: int) -> list:
-        assert isinstance(type, BuildType)
-        assert isinstance(data, list)
-        assert isinstance(columns, int)
-        assert isinstance(rows, int)
+    def head(self, level: int, pos: int) -> None:
+        assert isinstance(level, int)
+        assert isinstance(pos, int)
+
+        self._level = level
+        self._marks.append((MarkType.HEAD, level, pos, pos + 1))
+
+    def texts(self, start: int, end: int) -> None:
+        assert isinstance(start, int)
+        assert isinstance(end, int)
+
+        if start < end:
+            self._marks.append((MarkType.TEXT, 0, start, end))
+
+    def end(self) -> None:
+        """Close the scene of the last head, which counts no more text."""
+        self._marks.append((MarkType.END, self._level, 0, 0))
+
+    def marks_of(self, lines: list) -> list:
+        """Return the marks with the titles and the stats read from the lines."""
+        assert isinstance(lines, list)
 
         tmp = []
-        indices = [0]
-        titles = [['']]
-        descs = [['']]
+        texts = []
 
-        for record in data:
-            assert isinstance(record, str)
-            if record.startswith('#'):
-                # scene head
-                level = record.count('#')
-                if len(indices) <= level:
-                    indices.append(0)
-                    titles.append([''])
-                    descs.append([''])
-                indices[level] += 1
-                titles[level].append(cls._title_from(record))
-                descs[level].append('')
-            elif re.search(r'[0-9]+\.', record):
-                # scene head in outline and plot
-                pass
-            elif record.startswith('<!--'):
-                # comment
-                continue
-            elif record.startswith('----'):
-                # breakline
-                continue
-            elif BuildType.STRUCT is type and record.startswith('['):
-                # spin info
-                continue
-            elif BuildType.STRUCT is type and record.startswith('>>'):
-                # person info
+        for type, level, start, end in self._marks:
+            if MarkType.TEXT is type:
+                texts.extend(rid_rn(line) for line in lines[start:end]
+                        if not self._skipped.search(line))
                 continue
+            if texts:
+                # NOTE: the texts between the heads and the ends are counted at once
+                tmp.append(StatsMark(MarkType.TEXT, stats=CharStats.of(''.join(texts))))
+                texts = []
+            if MarkType.HEAD is type:
+                tmp.append(StatsMark(type, level, rid_rn(HEAD_PREFIX.sub('', lines[start]))))
             else:
-                # text
-                for level in range(len(indices)):
-                    descs[level][indices[level]] += rid_rn(record)
-
-        for level in range(len(indices)):
-            tmp.extend(Converter.counts_from(
-                level,
-                titles[level],
-                descs[level],
-                columns, rows))
+                tmp.append(StatsMark(type, level))
 
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted '{type}' char count data: {PROC}"))
+        if texts:
+            tmp.append(StatsMark(MarkType.TEXT, stats=CharStats.of(''.join(texts))))
 
         return tmp
 
+
+class CharCounter(object):
+
     @classmethod
-    def _counts_outline_from(cls, type: BuildType,
+    def counts_data_from(cls, type: BuildType,
             data: list, columns: int, rows: int) -> list:
         assert isinstance(type, BuildType)
         assert isinstance(data, list)
         assert isinstance(columns, int)
         assert isinstance(rows, int)
 
-        tmp = []
-        indices = [0]
-        titles = [['']]
-        descs = [['']]
-        level = 0
-        cur_index = 0
+        if type not in [BuildType.OUTLINE, BuildType.PLOT, BuildType.SCRIPT, BuildType.NOVEL,
+                BuildType.STRUCT]:
+            return []
 
-        for record in data:
-            assert isinstance(record, str)
-            if record.startswith('----'):
-                # change level
-                level += 1
-                if len(indices) <= level:
-                    indices.append(0)
-                    titles.append([''])
-                    descs.append([''])
-            elif re.search(TITLE_PREFIX, record):
-                # scene head in outline
-                indices[level] += 1
-                titles[level].append(rid_rn(record))
-                descs[level].append('')
-            elif record.startswith('#'):
-                # novel scene head
-                continue
-            elif record.startswith('<!--'):
-                # comment
-                continue
-            elif record.startswith('** '):
-                # sub title
-                continue
-            else:
-                # text
-                descs[level][indices[level]] += rid_rn(record)
+        tmp = []
 
-        for level in range(len(indices)):
-            tmp.extend(Converter.counts_from(
-                level,
-                titles[level],
-                descs[level],
-                columns, rows))
+        for level, level_nodes in enumerate(cls._nodes_from(data)):
+            tmp.extend(Converter.counts_from(level, level_nodes, columns, rows))
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"converted '{type}' char count data: {PROC}"))
+
         return tmp
 
-    def _title_from(record: str) -> str:
-        assert isinstance(record, str)
+    def _nodes_from(data: list) -> list:
+        assert isinstance(data, list)
+
+        nodes = [[]]
+
+        for record in data:
+            assert isinstance(record, SceneStats)
+            while len(nodes) <= record.level:
+                nodes.append([])
+            nodes[record.level].append([record.title, record.stats])
 
-        return re.sub(NOVEL_TITLE_PREFIX, '', record)
+        return nodes
 
 
 class Converter(object):
 
     @classmethod
-    def counts_from(cls, level: int, titles: list, descs: list,
-            columns: int, rows: int) -> list:
+    def counts_from(cls, level: int, nodes: list, columns: int, rows: int) -> list:
         assert isinstance(level, int)
-        assert isinstance(titles, list)
-        assert isinstance(descs, list)
+        assert isinstance(nodes, list)
         assert isinstance(columns, int)
         assert isinstance(rows, int)
 
-        tmp = []
-
-        for title, text in zip(titles[1:], descs[1:]):
-            tmp.append(cls._record_from(level, title, text, columns, rows))
-
-        return tmp
+        return [cls._record_from(level, title, stats, columns, rows) for title, stats in nodes]
 
-    def _record_from(level: int, title: str, text: str,
+    def _record_from(level: int, title: str, stats: CharStats,
             columns: int, rows: int) -> CountRecord:
         assert isinstance(level, int)
         assert isinstance(title, str)
-        assert isinstance(text, str)
+        assert isinstance(stats, CharStats)
         assert isinstance(columns, int)
         assert isinstance(rows, int)
 
-        lines = count_lines_by_columns(text, columns)
+        lines = stats.lines_by_columns(columns)
 
-        return CountRecord(level, title, len(text), count_white_space(text),
-                lines, lines / rows)
+        return CountRecord(level, title, stats.chars, stats.spaces, lines, lines / rows)
 
 
 class Formatter(object):
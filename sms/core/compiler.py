@@ -1,25 +1,26 @@
 """Compile module."""
 
 # Official Libraries
-import yaml
+
 
 # My Modules
-from sms.core.aliasconv import apply_alias
-from sms.core.instrunner import apply_instructions
+from sms.commons.projectconfig import ProjectConfig
+from sms.core.aliasconv import AliasPass
+from sms.core.instrunner import InstructionPass
 from sms.core.nametagconv import nametags_from
 from sms.core.nametagconv import timeclocks_from
-from sms.core.nextconv import apply_scene_info_next
-from sms.core.sameconv import apply_scene_action_same, apply_scene_info_same
+from sms.core.nextconv import NextPass
+from sms.core.passmanager import PassManager
+from sms.core.sameconv import SameActionPass, SameInfoPass
 from sms.core.serializer import call_scene
-from sms.core.timeclockconv import apply_scene_time_to_clock
-from sms.db.assets import AssetsDB
+from sms.core.timeclockconv import TimeClockPass
+from sms.db.assetindex import AssetIndex
 from sms.db.scenes import ScenesDB
 from sms.db.storydata import StoryData
 from sms.syss import messages as msg
-from sms.syss.paths import FILE_CONFIG
 from sms.utils.dicts import dict_sorted
-from sms.utils.fileio import read_file
 from sms.utils.log import logger
+from sms.utils.profiler import profiled
 
 
 __all__ = (
@@ -30,36 +31,32 @@ __all__ = (
 # Define Constants
 PROC = 'COMPILER'
 
-ELM_CONFIG = 'config'
-
-ELM_ENTRY = 'entrypoint'
-
 
 # Main
-def compile_codes(scenes: ScenesDB, assets: AssetsDB) -> StoryData:
+def compile_codes(scenes: ScenesDB, assets: AssetIndex, config: ProjectConfig,
+        is_fused: bool = True) -> StoryData:
     assert isinstance(scenes, ScenesDB)
-    assert isinstance(assets, AssetsDB)
+    assert isinstance(assets, AssetIndex)
+    assert isinstance(config, ProjectConfig)
+    assert isinstance(is_fused, bool)
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    config = yaml.safe_load(read_file(FILE_CONFIG))
-    if not config:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"config file: {PROC}"))
-        return None
-
-    entry = config[ELM_CONFIG][ELM_ENTRY]
+    entry = config.entrypoint
 
     if not scenes.has(entry):
         logger.error(msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"entry point: {PROC}"),
                 entry)
         return None
 
-    data = call_scene(0, entry, scenes)
+    with profiled('call scenes', 'compile') as stage:
+        data = call_scene(0, entry, scenes)
+        stage.records = len(data) if data else 0
     if not data:
         logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"story data: {PROC}"))
         return None
 
-    tags = nametags_from(assets)
+    tags = nametags_from(assets, config)
     if not tags:
         logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"name tags: {PROC}"))
         return None
@@ -72,36 +69,21 @@ def compile_codes(scenes: ScenesDB, assets: AssetsDB) -> StoryData:
                 msg.ERR_FAIL_MISSING_DATA.format(data=f"time clocks tags: {PROC}"))
         return None
 
-    updated_alias = apply_alias(data)
-    if not updated_alias:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply alias data: {PROC}"))
-        return None
-
-    updated_timeclock = apply_scene_time_to_clock(updated_alias, timeclocks)
-    if not updated_timeclock:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply time clock data: {PROC}"))
-        return None
-
-    updated_same_info = apply_scene_info_same(updated_timeclock)
-    if not updated_same_info:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply same info data: {PROC}"))
-        return None
-
-    updated_same_acts = apply_scene_action_same(updated_same_info)
-    if not updated_same_acts:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply same act data: {PROC}"))
-        return None
-
-    # if date and year refine by next
-    updated_next = apply_scene_info_next(updated_same_acts)
-    if not updated_next:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply next date time: {PROC}"))
-        return None
-
-    # apply inst
-    updated_inst = apply_instructions(updated_next)
-    if not updated_inst:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply instruction data: {PROC}"))
+    passes = PassManager([
+            AliasPass(),
+            TimeClockPass(timeclocks),
+            SameInfoPass(),
+            SameActionPass(),
+            # if date and year refine by next
+            NextPass(),
+            InstructionPass(),
+            ], is_fused)
+
+    with profiled('passes', 'compile') as stage:
+        updated = passes.run(data)
+        stage.records = len(updated)
+    if not updated:
+        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"apply passes data: {PROC}"))
         return None
 
     # tag convert
@@ -109,7 +91,7 @@ def compile_codes(scenes: ScenesDB, assets: AssetsDB) -> StoryData:
     logger.debug(msg.MSG_UNIMPLEMENT_PROC.format(proc=f"tag convert phase: {PROC}"))
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return StoryData(updated_inst)
+    return StoryData(updated)
 
 
 # Processes
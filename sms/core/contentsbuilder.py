@@ -13,6 +13,7 @@ from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.utils.log import logger
+from sms.utils.slots import slotted
 from sms.utils.strtranslate import translate_tags_text_list
 
 
@@ -25,6 +26,7 @@ __all__ = (
 PROC = 'BUILD CONTENTS'
 
 
+@slotted
 @dataclass
 class ContentRecord(object):
     level: int
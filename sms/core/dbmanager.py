@@ -1,72 +1,115 @@
 """DB management module."""
 
 # Official Libraries
+import hashlib
+import os
 
 
 # My Modules
 from sms.commons.pathmanager import PathManager as PM
 from sms.core.assetdataconv import asset_object_from
-from sms.core.rawdataconv import raw_src_objects_from
+from sms.core.rawdataconv import raw_src_index_from, raw_src_index_restamped, raw_src_objects_from
 from sms.core.scenecodeconv import scene_code_object_from
+from sms.core.serializer import CallGraph
 from sms.db.assets import AssetsDB
-from sms.db.scenes import ScenesDB
+from sms.db.fragmentcache import FragmentCache
+from sms.db.parsecache import ParseCache
+from sms.db.scenegraph import SceneGraph, SceneNode
+from sms.db.scenes import LazyScenesDB, ScenesDB
 from sms.db.srcs import SrcsDB
 from sms.objs.baseobject import SObject
 from sms.objs.rawsrc import RawSrc
-from sms.objs.scenecode import SceneCode
 from sms.syss.paths import EXT_MARKDOWN, EXT_YAML
 from sms.syss import messages as msg
 from sms.utils import assertion
 from sms.utils.fileio import read_file
 from sms.utils.filepath import get_filepaths_in, is_exists_path
-from sms.utils.log import logger
+from sms.utils.log import logger, logs_kept, replay_logs
+from sms.utils.pools import imap_forked
 
 
 __all__ = (
         'get_assets_db',
+        'get_fragment_cache',
+        'get_srcs_db',
+        'load_scene_graph',
+        'save_scene_graph',
+        'scene_graph_from',
+        'scenes_db_from',
         )
 
 
 # Define Constants
 PROC = 'DB MANAGER'
 
+CACHE_ASSETS = 'assets.pickle'
+
+CACHE_SRCS = 'srcs.pickle'
+
+CACHE_FRAGMENTS = '{name}.fragments.pickle'
+"""str: file name of the rendered fragments of a builder in the cache directory."""
+
+FILE_SCENE_GRAPH = 'scenegraph.json'
+"""str: file name of the scene graph of the last build in the cache directory."""
+
+INDEX_MIN_SIZE = 1 << 20
+"""int: bytes of the source file indexed instead of reading."""
+
+PARALLEL_MIN_ASSETS = 256
+"""int: asset files parsed at least to share them among the processes."""
+
+ASSETS_CHUNK_SIZE = 64
+"""int: asset files parsed at once by a worker process."""
+
 
 # Main
-def get_assets_db() -> AssetsDB:
+def get_assets_db(is_cached: bool = True, jobs: int = 1) -> AssetsDB:
+    assert isinstance(is_cached, bool)
+    assert isinstance(jobs, int)
 
     _PROC = f"{PROC}: get assets db"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
     db = AssetsDB()
+    cache = _get_cache(CACHE_ASSETS) if is_cached else None
 
-    paths = get_filepaths_in(PM.get_asset_dir_path(), EXT_YAML, True)
-
-    for path in paths:
+    paths = []
 
+    for path in get_filepaths_in(PM.get_asset_dir_path(), EXT_YAML, True):
         if not is_exists_path(path):
             logger.warning(msg.ERR_FAIL_MISSING_DATA.format(data=f"asset data of {path}: {PROC}"))
             continue
+        paths.append(path)
 
-        data = read_file(path)
-        # NOTE: file validate?
-        obj = asset_object_from(data)
+    # NOTE: file validate?
+    if cache:
+        objs = cache.fetch_all(paths, lambda texts: _asset_objects_from(texts, jobs))
+    else:
+        objs = _asset_objects_from([read_file(path) for path in paths], jobs)
+
+    for obj in objs:
         if obj:
             assert isinstance(obj, SObject)
             db.add(obj.tag, obj)
             logger.debug(msg.PROC_MESSAGE.format(proc=f"Add '{obj.tag}' to asset db"))
 
+    if cache and not cache.save():
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"assets cache: {_PROC}"))
+
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
     return db
 
 
-def get_srcs_db() -> SrcsDB:
+def get_srcs_db(is_cached: bool = True) -> SrcsDB:
+    assert isinstance(is_cached, bool)
 
     _PROC = f"{PROC}: get sources db"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
     db = SrcsDB()
     key_cache = []
+    cache = _get_cache(CACHE_SRCS) if is_cached else None
 
     paths = get_filepaths_in(PM.get_src_dir_path(), EXT_MARKDOWN, True)
 
@@ -76,8 +119,17 @@ def get_srcs_db() -> SrcsDB:
             logger.warning(msg.ERR_FAIL_MISSING_DATA.format(data=f"source data of {path}: {PROC}"))
             continue
 
-        data = read_file(path)
-        raws = assertion.is_list(raw_src_objects_from(data))
+        if os.path.getsize(path) >= INDEX_MIN_SIZE:
+            # NOTE: large files are indexed, and the scenes are read when they are used
+            if cache:
+                raws = assertion.is_list(cache.fetch_by_path(path, raw_src_index_from,
+                        raw_src_index_restamped))
+            else:
+                raws = assertion.is_list(raw_src_index_from(path))
+        elif cache:
+            raws = assertion.is_list(cache.fetch(path, lambda text: raw_src_objects_from(text, path)))
+        else:
+            raws = assertion.is_list(raw_src_objects_from(read_file(path), path))
         for raw in raws:
             if raw:
                 assert isinstance(raw, RawSrc)
@@ -90,29 +142,142 @@ def get_srcs_db() -> SrcsDB:
                 key_cache.append(raw.tag)
                 logger.debug(msg.PROC_MESSAGE.format(proc=f"Add '{raw.tag}' to srcs db"))
 
+    if cache and not cache.save():
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"sources cache: {_PROC}"))
+
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
     return db
 
 
-def scenes_db_from(srcs: SrcsDB) -> ScenesDB:
+def scenes_db_from(srcs: SrcsDB, converted: dict = None) -> ScenesDB:
+    """Make the scene codes db of the sources, converted when they are used.
+
+    Only the scenes reachable from the entrypoint are converted in compiling.
+    converted keeps the pairs of source and scene code by tag over the calls,
+    and the code is reused while the source is the same object.
+    """
     assert isinstance(srcs, SrcsDB)
 
     _PROC = f"{PROC}: conv scenes db from srcs db"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
-    db = ScenesDB()
-
-    for tag, src in srcs.data.items():
-        assert isinstance(tag, str)
-        assert isinstance(src, RawSrc)
-        code = scene_code_object_from(src)
+    if converted is not None:
+        for tag in [tag for tag, (src, _) in converted.items()
+                if not srcs.has(tag) or srcs.get(tag) is not src]:
+            del converted[tag]
 
-        if code:
-            assert isinstance(code, SceneCode)
-            db.add(code.tag, code)
-            logger.debug(msg.PROC_MESSAGE.format(proc=f"Add '{code.tag}' to scenes db"))
+    db = LazyScenesDB(srcs, scene_code_object_from, converted)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
     return db
+
+
+def scene_graph_from(scenes: LazyScenesDB, entry: str) -> SceneGraph:
+    """Make the graph of the scenes called from the entrypoint, with their sources.
+
+    The scenes in the graph are converted, as the compiler does.
+    """
+    assert isinstance(scenes, LazyScenesDB)
+    assert isinstance(entry, str)
+
+    _PROC = f"{PROC}: scene graph"
+    logger.debug(msg.PROC_START.format(proc=_PROC))
+
+    if not scenes.has(entry):
+        logger.error(msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"entry point: {_PROC}"),
+                entry)
+        return None
+
+    graph = SceneGraph(entry)
+
+    for tag, callees in CallGraph.calls_from(entry, scenes).items():
+        src = scenes.srcs.get(tag)
+        digest = hashlib.sha1('\n'.join(src.data).encode('utf-8')).hexdigest()
+        graph.add(SceneNode(tag, src.path, src.lines, digest, callees))
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+
+    return graph
+
+
+def load_scene_graph() -> SceneGraph:
+    """Return the scene graph of the last build, or the empty graph."""
+    graph = SceneGraph()
+
+    if not graph.load(os.path.join(PM.get_cache_dir_path(), FILE_SCENE_GRAPH)):
+        logger.debug(msg.PROC_MESSAGE.format(proc=f"new scene graph: {PROC}"))
+
+    return graph
+
+
+def save_scene_graph(graph: SceneGraph) -> bool:
+    assert isinstance(graph, SceneGraph)
+
+    return graph.save(os.path.join(PM.get_cache_dir_path(), FILE_SCENE_GRAPH))
+
+
+def get_fragment_cache(name: str) -> FragmentCache:
+    """Return the fragment cache of the builder, loaded again if saved by a worker."""
+    assert isinstance(name, str)
+
+    cache = _fragment_caches.get(name)
+
+    if not cache or cache.is_stale():
+        cache = FragmentCache(os.path.join(PM.get_cache_dir_path(),
+            CACHE_FRAGMENTS.format(name=name)))
+        if not cache.load():
+            logger.debug(msg.PROC_MESSAGE.format(proc=f"new fragment cache {name}: {PROC}"))
+        _fragment_caches[name] = cache
+
+    return cache
+
+
+# Private Functions
+def _asset_objects_from(texts: list, jobs: int) -> list:
+    """Parse the asset texts in the order, shared among the processes if many."""
+    assert isinstance(texts, list)
+    assert isinstance(jobs, int)
+
+    if jobs <= 1 or len(texts) < PARALLEL_MIN_ASSETS:
+        return [asset_object_from(text) for text in texts]
+
+    tmp = []
+    chunks = [(i, i + ASSETS_CHUNK_SIZE) for i in range(0, len(texts), ASSETS_CHUNK_SIZE)]
+
+    # NOTE: the logs of the workers are handled here in the order of the files
+    for objs, records in imap_forked(_asset_objects_in_chunk, chunks, texts, jobs):
+        replay_logs(records)
+        tmp.extend(objs)
+
+    return tmp
+
+
+def _asset_objects_in_chunk(texts: list, chunk: tuple) -> tuple:
+    assert isinstance(texts, list)
+    assert isinstance(chunk, tuple)
+
+    with logs_kept() as records:
+        objs = [asset_object_from(text) for text in texts[chunk[0]:chunk[1]]]
+
+    return objs, records
+
+
+_caches = {}
+"""dict: parse caches loaded in this process."""
+
+_fragment_caches = {}
+"""dict: fragment caches of the builders loaded in this process."""
+
+
+def _get_cache(fname: str) -> ParseCache:
+    assert isinstance(fname, str)
+
+    if fname not in _caches:
+        cache = ParseCache(os.path.join(PM.get_cache_dir_path(), fname))
+        if not cache.load():
+            logger.debug(msg.PROC_MESSAGE.format(proc=f"new parse cache {fname}: {PROC}"))
+        _caches[fname] = cache
+
+    return _caches[fname]
@@ -12,18 +12,20 @@ from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.action import Action
 from sms.objs.basecode import BaseCode
-from sms.objs.sceneend import SceneEnd
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.action import ActType
 from sms.utils import assertion
 from sms.utils.log import logger
+from sms.utils.slots import slotted
 from sms.utils.strings import just_string_of
+from sms.utils.strtranslate import TagTranslator
 from sms.utils.strtranslate import translate_tags_str, translate_tags_text_list
 
 
 __all__ = (
         'build_info',
+        'register_info_conv',
         )
 
 
@@ -41,6 +43,7 @@ class RecordType(Enum):
     FLAG_INFO = auto()
 
 
+@slotted
 @dataclass
 class InfoRecord(object):
     type: RecordType
@@ -51,6 +54,7 @@ class InfoRecord(object):
     note: Any = None
 
 
+@slotted
 @dataclass
 class TransitionInfo(object):
     title: str
@@ -70,22 +74,29 @@ class PersonInOut(Enum):
     WEAR = auto()
 
 
+@slotted
 @dataclass
 class PersonInfo(object):
     type: PersonInOut
 
 
+@slotted
 @dataclass
 class ItemInfo(object):
     have: str
 
 
+@slotted
 @dataclass
 class FlagInfo(object):
     foreshadow: str
     payoff: str
 
 
+INFO_CONVS = []
+"""list: converters of the info sections in the order of the output."""
+
+
 # Main
 def build_info(story_data: StoryData, tags: dict, callings: dict) -> OutputsData:
     assert isinstance(story_data, StoryData)
@@ -98,7 +109,9 @@ def build_info(story_data: StoryData, tags: dict, callings: dict) -> OutputsData
     if not infos:
         return None
 
-    updated_tags = TagConverter.conv_callings_and_tags(infos, tags, callings)
+    translator = TagTranslator(tags)
+
+    updated_tags = TagConverter.conv_callings_and_tags(infos, translator, callings)
     if not updated_tags:
         return None
 
@@ -106,51 +119,87 @@ def build_info(story_data: StoryData, tags: dict, callings: dict) -> OutputsData
     if not formatted:
         return None
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = translate_tags_text_list(formatted, translator)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
     return OutputsData(translated)
 
 
+def register_info_conv(conv: type) -> type:
+    """Register the converter of an info section, used as the class decorator."""
+    assert isinstance(conv, type)
+
+    INFO_CONVS.append(conv)
+
+    return conv
+
+
 # Processes
 class Converter(object):
 
     @classmethod
-    def infos_data_from(cls, story_data: StoryData) -> list:
+    def infos_data_from(cls, story_data: StoryData, convs: list = None) -> list:
+        """Return the records of the info sections, collected in one scan of the story data."""
         assert isinstance(story_data, StoryData)
 
-        tmp = []
+        convs = assertion.is_list(convs) if convs is not None else INFO_CONVS
+        sections = [[InfoRecord(RecordType.DATA_HEAD, 0, 0, conv.head, '')] for conv in convs]
+        by_act = {}
+        indices = [0]
+        cur_level = 0
+        cur_index = 0
 
-        transitions = TransitionInfoConv.transitions_data_from(story_data)
-        if not transitions:
-            return None
+        for conv, section in zip(convs, sections):
+            for act in conv.acts:
+                by_act.setdefault(act, []).append((conv, section))
 
-        persons = PersonInfoConv.personinfos_data_from(story_data)
-        if not persons:
-            return None
+        for record in story_data.get_data():
+            assert isinstance(record, BaseCode)
+            if isinstance(record, SceneInfo):
+                if record.level >= len(indices):
+                    indices.append(0)
+                cur_level = record.level
+                indices[record.level] += 1
+                cur_index = indices[record.level]
+                for conv, section in zip(convs, sections):
+                    ret = conv.scene_info_of(cur_index, record)
+                    if ret:
+                        section.append(ret)
+            elif isinstance(record, Action):
+                for conv, section in by_act.get(record.type, []):
+                    ret = conv.action_info_of(cur_level, cur_index, record)
+                    if ret:
+                        section.append(ret)
+            else:
+                continue
 
-        items = ItemInfoConv.iteminfos_data_from(story_data)
-        if not items:
-            return None
+        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted infos data: {PROC}"))
 
-        flags = FlagInfoConv.flags_data_from(story_data)
-        if not flags:
-            return None
+        return [record for section in sections for record in section]
 
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted infos data: {PROC}"))
 
-        tmp = transitions + persons + items + flags
+class InfoConv(object):
+    """Converter of an info section, fed with the scenes and the actions of its types."""
 
-        return tmp
+    head = ''
+    """str: head of the section."""
+    acts = ()
+    """tuple: action types fed to the converter."""
+
+    def scene_info_of(index: int, record: SceneInfo) -> InfoRecord:
+        return None
+
+    def action_info_of(level: int, index: int, record: Action) -> InfoRecord:
+        return None
 
 
 class TagConverter(object):
 
     @classmethod
-    def conv_callings_and_tags(cls, data: list, tags: dict, callings: dict) -> list:
+    def conv_callings_and_tags(cls, data: list, tags: TagTranslator, callings: dict) -> list:
         assert isinstance(data, list)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
         assert isinstance(callings, dict)
 
         tmp = []
@@ -172,10 +221,10 @@ class TagConverter(object):
 
         return tmp
 
-    def _conv_flag(record: InfoRecord, callings: dict, tags: dict) -> InfoRecord:
+    def _conv_flag(record: InfoRecord, callings: dict, tags: TagTranslator) -> InfoRecord:
         assert isinstance(record, InfoRecord)
         assert isinstance(callings, dict)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, FlagInfo)
         subject = record.subject
@@ -197,10 +246,10 @@ class TagConverter(object):
                     translate_tags_str(payoff, tags)
                 ))
 
-    def _conv_item(record: InfoRecord, callings: dict, tags: dict) -> InfoRecord:
+    def _conv_item(record: InfoRecord, callings: dict, tags: TagTranslator) -> InfoRecord:
         assert isinstance(record, InfoRecord)
         assert isinstance(callings, dict)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, ItemInfo)
         subject = record.subject
@@ -218,10 +267,10 @@ class TagConverter(object):
                     translate_tags_str(have, tags),
                     ))
 
-    def _conv_person(record: InfoRecord, callings: dict, tags: dict) -> InfoRecord:
+    def _conv_person(record: InfoRecord, callings: dict, tags: TagTranslator) -> InfoRecord:
         assert isinstance(record, InfoRecord)
         assert isinstance(callings, dict)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, PersonInfo)
         subject = record.subject
@@ -235,9 +284,9 @@ class TagConverter(object):
                 translate_tags_str(outline, tags),
                 info)
 
-    def _conv_transition(record: InfoRecord, tags: dict) -> InfoRecord:
+    def _conv_transition(record: InfoRecord, tags: TagTranslator) -> InfoRecord:
         assert isinstance(record, InfoRecord)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, TransitionInfo)
 
@@ -255,43 +304,17 @@ class TagConverter(object):
                     ))
 
 
-class TransitionInfoConv(object):
+@register_info_conv
+class TransitionInfoConv(InfoConv):
+    head = 'TRANSITION INFO'
 
-    @classmethod
-    def transitions_data_from(cls, story_data: StoryData) -> list:
-        assert isinstance(story_data, StoryData)
-
-        tmp = []
-        indices = [0]
-
-        tmp.append(InfoRecord(RecordType.DATA_HEAD, 0, 0, 'TRANSITION INFO', ''))
-
-        for record in story_data.get_data():
-            assert isinstance(record, BaseCode)
-            if isinstance(record, SceneInfo):
-                if record.level >= len(indices):
-                    indices.append(0)
-                indices[record.level] += 1
-                if 'nospin' in record.flags:
-                    continue
-                ret = cls._to_transition_info(indices[record.level], record)
-                if ret:
-                    tmp.append(ret)
-            elif isinstance(record, SceneEnd):
-                pass
-            elif isinstance(record, Action):
-                continue
-            else:
-                continue
-
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted transitions data: {PROC}"))
-
-        return tmp
-
-    def _to_transition_info(index: int, record: SceneInfo) -> InfoRecord:
+    def scene_info_of(index: int, record: SceneInfo) -> InfoRecord:
         assert isinstance(index, int)
         assert isinstance(record, SceneInfo)
 
+        if 'nospin' in record.flags:
+            return None
+
         return InfoRecord(RecordType.TRANSITION, record.level, index, '', '',
                 TransitionInfo(
                     record.title,
@@ -305,46 +328,16 @@ class TransitionInfoConv(object):
                     ))
 
 
-class PersonInfoConv(object):
+@register_info_conv
+class PersonInfoConv(InfoConv):
+    head = 'PERSON INFO'
+    acts = (ActType.BE, ActType.COME, ActType.GO, ActType.WEAR)
 
-    @classmethod
-    def personinfos_data_from(cls, story_data: StoryData) -> list:
-        assert isinstance(story_data, StoryData)
-
-        tmp = []
-        indices = [0]
-        cur_level = 0
-        cur_index = 0
-
-        tmp.append(InfoRecord(RecordType.DATA_HEAD, 0, 0, 'PERSON INFO', ''))
-
-        for record in story_data.get_data():
-            assert isinstance(record, BaseCode)
-            if isinstance(record, SceneInfo):
-                if record.level >= len(indices):
-                    indices.append(0)
-                cur_level = record.level
-                indices[record.level] += 1
-                cur_index = indices[record.level]
-            elif isinstance(record, SceneEnd):
-                continue
-            elif isinstance(record, Action):
-                ret = cls._to_person_info(cur_level, cur_index, record)
-                if ret:
-                    tmp.append(ret)
-            else:
-                continue
-
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted person infos data: {PROC}"))
-
-        return tmp
-
-    def _to_person_info(level: int, index: int, record: Action) -> InfoRecord:
+    def action_info_of(level: int, index: int, record: Action) -> InfoRecord:
         assert isinstance(level, int)
         assert isinstance(index, int)
         assert isinstance(record, Action)
 
-        into = outto = wear = ''
         type = PersonInOut.BE
 
         if ActType.BE is record.type:
@@ -363,40 +356,12 @@ class PersonInfoConv(object):
                 PersonInfo(type))
 
 
-class ItemInfoConv(object):
-
-    @classmethod
-    def iteminfos_data_from(cls, story_data: StoryData) -> list:
-        assert isinstance(story_data, StoryData)
-
-        tmp = []
-        indices = [0]
-        cur_level = 0
-        cur_index = 0
-        tmp.append(InfoRecord(RecordType.DATA_HEAD, 0, 0, 'ITEM INFO', ''))
-
-        for record in story_data.get_data():
-            assert isinstance(record, BaseCode)
-            if isinstance(record, SceneInfo):
-                if record.level >= len(indices):
-                    indices.append(0)
-                cur_level = record.level
-                indices[record.level] += 1
-                cur_index = indices[record.level]
-            elif isinstance(record, SceneEnd):
-                continue
-            elif isinstance(record, Action):
-                ret = cls._to_item_info(cur_level, cur_index, record)
-                if ret:
-                    tmp.append(ret)
-            else:
-                continue
-
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted item infos data: {PROC}"))
-
-        return tmp
+@register_info_conv
+class ItemInfoConv(InfoConv):
+    head = 'ITEM INFO'
+    acts = (ActType.HAVE,)
 
-    def _to_item_info(level: int, index: int, record: Action) -> InfoRecord:
+    def action_info_of(level: int, index: int, record: Action) -> InfoRecord:
         assert isinstance(record, Action)
 
         if ActType.HAVE is record.type:
@@ -407,40 +372,12 @@ class ItemInfoConv(object):
             return None
 
 
-class FlagInfoConv(object):
-
-    @classmethod
-    def flags_data_from(cls, story_data: StoryData) -> list:
-        assert isinstance(story_data, StoryData)
-
-        tmp = []
-        indices = [0]
-        cur_level = 0
-        cur_index = 0
-        tmp.append(InfoRecord(RecordType.DATA_HEAD, 0, 0, 'FLAG INFO', ''))
-
-        for record in story_data.get_data():
-            assert isinstance(record, BaseCode)
-            if isinstance(record, SceneInfo):
-                if record.level <= len(indices):
-                    indices.append(0)
-                cur_level = record.level
-                indices[record.level] += 1
-                cur_index = indices[record.level]
-            elif isinstance(record, SceneEnd):
-                continue
-            elif isinstance(record, Action):
-                ret = cls._to_flag_info(cur_level, cur_index, record)
-                if ret:
-                    tmp.append(ret)
-            else:
-                continue
-
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"converted flags data: {PROC}"))
-
-        return tmp
+@register_info_conv
+class FlagInfoConv(InfoConv):
+    head = 'FLAG INFO'
+    acts = (ActType.FORESHADOW, ActType.PAYOFF)
 
-    def _to_flag_info(level: int, index: int, record: Action) -> InfoRecord:
+    def action_info_of(level: int, index: int, record: Action) -> InfoRecord:
         assert isinstance(level, int)
         assert isinstance(index, int)
         assert isinstance(record, Action)
@@ -4,6 +4,7 @@
 
 
 # My Modules
+from sms.core.passmanager import CodePass, PassManager
 from sms.objs.basecode import BaseCode
 from sms.syss import messages as msg
 from sms.utils.log import logger
@@ -11,6 +12,7 @@ from sms.utils.log import logger
 
 __all__ = (
         'apply_instructions',
+        'InstructionPass',
         )
 
 
@@ -24,14 +26,19 @@ def apply_instructions(base_data: list) -> list:
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    tmp = []
-
-    for record in base_data:
-        assert isinstance(record, BaseCode)
-        tmp.append(record)
+    tmp = PassManager([InstructionPass()]).run(base_data)
 
     logger.debug(msg.MSG_UNIMPLEMENT_PROC.format(proc=PROC))
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
     return tmp
+
+
+class InstructionPass(CodePass):
+
+    name = 'instruction'
+
+    def step(self, record: BaseCode) -> BaseCode:
+        # NOTE: no instruction is run yet
+        return record
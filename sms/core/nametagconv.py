@@ -1,38 +1,35 @@
 """Name tag converter module."""
 
 # Official Libraries
-import yaml
 
 
 # My Modules
-from sms.db.assets import AssetsDB
+from sms.commons.projectconfig import ProjectConfig
+from sms.db.assetindex import AssetIndex
 from sms.objs.baseobject import SObject
 from sms.objs.item import Item
 from sms.objs.nametag import NameTag, NameTagType
 from sms.objs.person import Person
-from sms.objs.rubi import Rubi, RubiData
+from sms.objs.rubi import RubiData
 from sms.objs.stage import Stage
 from sms.syss import messages as msg
-from sms.syss.paths import FILE_CONFIG
 from sms.utils import assertion
-from sms.utils.fileio import read_file
+from sms.utils.dicts import dict_sorted
 from sms.utils.log import logger
 from sms.utils.strings import hankaku_to_zenkaku
+from sms.utils.strtranslate import TagTranslator
 
 __all__ = (
         'callingtags_from',
         'nametags_from',
         'rubitags_from',
+        'timeclocks_from',
         )
 
 
 # Define Constants
 PROC = 'NAME TAG CONV'
 
-ELM_CONFIG = 'config'
-
-ELM_MOBS = 'mobs'
-
 ELM_NAME = 'name'
 
 ELM_TYPE = 'type'
@@ -41,125 +38,33 @@ ELM_CLOCK = 'clock'
 
 
 # Main
-def callingtags_from(assets: AssetsDB) -> dict:
-    assert isinstance(assets, AssetsDB)
-
-    _PROC = f"{PROC}: calling tags"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
-
-    tmp = {}
-
-    for key, val in assets.data.items():
-        assert isinstance(key, str)
-        assert isinstance(val, SObject)
-        if isinstance(val, Person):
-            if not Converter.person_callings_of(tmp, val):
-                logger.warning(
-                        msg.ERR_FAIL_INVALID_DATA.format(
-                            data=f"person '{val.tag} calling: {_PROC}'"))
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return tmp
+def callingtags_from(assets: AssetIndex) -> dict:
+    """Return the calling translators of the persons, compiled once for the assets."""
+    assert isinstance(assets, AssetIndex)
 
+    return assets.table_of('callings', lambda: _callingtags_of(assets))
 
-def nametags_from(assets: AssetsDB) -> dict:
-    assert isinstance(assets, AssetsDB)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+def nametags_from(assets: AssetIndex, config: ProjectConfig) -> dict:
+    assert isinstance(assets, AssetIndex)
+    assert isinstance(config, ProjectConfig)
 
-    config = yaml.safe_load(read_file(FILE_CONFIG))
-    if not config:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"config file: {PROC}"))
-        return {}
+    return assets.table_of(('nametags', config.mobs),
+            lambda: _nametags_of(assets, config.mobs))
 
-    mob_num = config[ELM_CONFIG][ELM_MOBS]
 
-    tmp = {}
-
-    for key, val in assets.data.items():
-        assert isinstance(key, str)
-        assert isinstance(val, SObject)
-        if isinstance(val, Person):
-            if not Converter.person_names_of(tmp, val):
-                logger.warning(
-                        msg.ERR_FAIL_INVALID_DATA.format(
-                            data=f"person '{val.tag}' name: {PROC}"))
-        elif isinstance(val, Stage):
-            if not Converter.stage_names_of(tmp, val):
-                logger.warning(
-                        msg.ERR_FAIL_INVALID_DATA.format(
-                            data=f"stage '{val.tag}' name: {PROC}"))
-        elif isinstance(val, Item):
-            if not Converter.item_name_of(tmp, val):
-                logger.warning(
-                        msg.ERR_FAIL_INVALID_DATA.format(
-                            data=f"item '{val.tag}' name: {PROC}"))
-        elif isinstance(val, NameTag):
-            if NameTagType.MOB is val.type:
-                if not Converter.mob_name_of(tmp, val, mob_num):
-                    logger.warning(
-                            msg.ERR_FAIL_INVALID_DATA.format(
-                                data=f"mob names: {PROC}"))
-            elif NameTagType.TIME is val.type:
-                if not Converter.time_name_of(tmp, val):
-                    logger.warning(
-                            msg.ERR_FAIL_INVALID_DATA.format(
-                                data=f"time names: {PROC}"))
-            elif NameTagType.WORD is val.type:
-                if not Converter.word_name_of(tmp, val):
-                    logger.warning(
-                            msg.ERR_FAIL_INVALID_DATA.format(
-                                data=f"word names: {PROC}"))
-            else:
-                continue
-        elif isinstance(val, Rubi):
-            continue
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return tmp
-
-
-def rubitags_from(assets: AssetsDB) -> RubiData:
-    assert isinstance(assets, AssetsDB)
-
-    tmp = {}
-
-    for key, val in assets.data.items():
-        assert isinstance(key, str)
-        assert isinstance(val, SObject)
-        if isinstance(val, RubiData):
-            tmp = val
-            break
-        else:
-            continue
+def rubitags_from(assets: AssetIndex) -> RubiData:
+    assert isinstance(assets, AssetIndex)
 
     logger.debug(msg.PROC_MESSAGE.format(proc=f"conv rubi tags: {PROC}"))
 
-    return tmp
-
+    return assets.rubi if assets.rubi else {}
 
-def timeclocks_from(assets: AssetsDB) -> dict:
-    assert isinstance(assets, AssetsDB)
 
-    tmp = {}
-
-    for key, val in assets.data.items():
-        assert isinstance(key, str)
-        assert isinstance(val, SObject)
-        if isinstance(val, NameTag) and NameTagType.TIME is val.type:
-            for tag, timeval in val.data.items():
-                clock = timeval[ELM_CLOCK]
-                tmp[tag] = clock
-        else:
-            continue
+def timeclocks_from(assets: AssetIndex) -> dict:
+    assert isinstance(assets, AssetIndex)
 
-    logger.debug(msg.PROC_MESSAGE.format(proc=f"conv time clock tags: {PROC}"))
-
-    return tmp
+    return assets.table_of('timeclocks', lambda: _timeclocks_of(assets))
 
 
 # Processes
@@ -169,7 +74,8 @@ class Converter(object):
         assert isinstance(data, dict)
         assert isinstance(obj, Person)
 
-        calling = assertion.is_dict(obj.calling)
+        # NOTE: the person keeps its own calling
+        calling = dict(assertion.is_dict(obj.calling))
         calling['S'] = obj.name
         calling['M'] = calling['me'] if 'me' in calling else '私'
 
@@ -249,6 +155,84 @@ class Converter(object):
 
 
 # Private Functions
+def _callingtags_of(assets: AssetIndex) -> dict:
+    assert isinstance(assets, AssetIndex)
+
+    _PROC = f"{PROC}: calling tags"
+    logger.debug(msg.PROC_START.format(proc=_PROC))
+
+    tmp = {}
+
+    for val in assets.persons.values():
+        if not Converter.person_callings_of(tmp, val):
+            logger.warning(
+                    msg.ERR_FAIL_INVALID_DATA.format(
+                        data=f"person '{val.tag} calling: {_PROC}'"))
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    return {tag: TagTranslator(dict_sorted(calling, True)) for tag, calling in tmp.items()}
+
+
+def _nametags_of(assets: AssetIndex, mob_num: int) -> dict:
+    assert isinstance(assets, AssetIndex)
+    assert isinstance(mob_num, int)
+
+    logger.debug(msg.PROC_START.format(proc=PROC))
+
+    tmp = {}
+
+    # NOTE: the names in the order of the db, where the later name wins
+    for val in assets.named:
+        assert isinstance(val, SObject)
+        if isinstance(val, Person):
+            if not Converter.person_names_of(tmp, val):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"person '{val.tag}' name: {PROC}"))
+        elif isinstance(val, Stage):
+            if not Converter.stage_names_of(tmp, val):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"stage '{val.tag}' name: {PROC}"))
+        elif isinstance(val, Item):
+            if not Converter.item_name_of(tmp, val):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"item '{val.tag}' name: {PROC}"))
+        elif NameTagType.MOB is val.type:
+            if not Converter.mob_name_of(tmp, val, mob_num):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"mob names: {PROC}"))
+        elif NameTagType.TIME is val.type:
+            if not Converter.time_name_of(tmp, val):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"time names: {PROC}"))
+        elif NameTagType.WORD is val.type:
+            if not Converter.word_name_of(tmp, val):
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA.format(
+                            data=f"word names: {PROC}"))
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    return tmp
+
+
+def _timeclocks_of(assets: AssetIndex) -> dict:
+    assert isinstance(assets, AssetIndex)
+
+    tmp = {}
+
+    for val in assets.nametags[NameTagType.TIME]:
+        for tag, timeval in val.data.items():
+            tmp[tag] = timeval[ELM_CLOCK]
+
+    logger.debug(msg.PROC_MESSAGE.format(proc=f"conv time clock tags: {PROC}"))
+
+    return tmp
+
+
 def _add_prefix(base: str, prefix: str) -> str:
     assert isinstance(base, str)
     assert isinstance(prefix, str)
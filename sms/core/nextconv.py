@@ -4,6 +4,7 @@
 
 
 # My Modules
+from sms.core.passmanager import CodePass, PassManager
 from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
@@ -13,6 +14,7 @@ from sms.utils.log import logger
 
 __all__ = (
         'apply_scene_info_next',
+        'NextPass',
         )
 
 
@@ -27,26 +29,29 @@ def apply_scene_info_next(data: list) -> list:
     _PROC = f"{PROC}: scene info next conv"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
-    tmp = []
-    cache = None
-
-    for record in data:
-        assert isinstance(record, BaseCode)
-        if isinstance(record, SceneInfo):
-            ret = Converter.conv_next_day(record, cache)
-            if ret:
-                tmp.append(ret)
-                cache = ret
-            else:
-                tmp.append(record)
-        else:
-            tmp.append(record)
+    tmp = PassManager([NextPass()]).run(data)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
     return tmp
 
 
+class NextPass(CodePass):
+
+    name = 'info next'
+
+    def __init__(self):
+        self.cache = None
+
+    def step(self, record: BaseCode) -> BaseCode:
+        if isinstance(record, SceneInfo):
+            ret = Converter.conv_next_day(record, self.cache)
+            if ret:
+                self.cache = ret
+                return ret
+        return record
+
+
 # Processes
 class Converter(object):
 
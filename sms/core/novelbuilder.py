@@ -10,6 +10,8 @@ import re
 from sms.commons.format import get_br, get_indent
 from sms.commons.format import join_descs
 from sms.commons.format import markdown_comment_style_of
+from sms.core.charcounter import StatsRecorder, scene_stats_from
+from sms.db.fragmentcache import FragmentCache, digest_of
 from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.action import Action
@@ -19,9 +21,12 @@ from sms.objs.sceneend import SceneEnd
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.action import ActType
+from sms.types.build import BuildType
 from sms.types.instruction import InstType
 from sms.utils.dicts import dict_sorted
 from sms.utils.log import logger
+from sms.utils.slots import slotted
+from sms.utils.strtranslate import TagTranslator
 from sms.utils.strtranslate import translate_tags_str
 from sms.utils.strtranslate import translate_tags_text_list
 
@@ -59,6 +64,7 @@ NORMAL_DESCS = [
         ]
 
 
+@slotted
 @dataclass
 class NovelRecord(object):
     type: RecordType
@@ -67,9 +73,17 @@ class NovelRecord(object):
     note: Any = None
 
 
+@slotted
+@dataclass
+class NovelState(object):
+    indices: list = field(default_factory=lambda: [0])
+    is_nobr: bool = False
+    is_firstindent: bool = False
+
+
 # Main
 def build_novel(story_data: StoryData, tags: dict, callings: dict,
-        is_comment: bool) -> OutputsData:
+        is_comment: bool, cache: FragmentCache = None) -> OutputsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
     assert isinstance(callings, dict)
@@ -77,34 +91,41 @@ def build_novel(story_data: StoryData, tags: dict, callings: dict,
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    novels = Converter.novels_data_from(story_data)
-    if not novels:
-        return None
+    translator = TagTranslator(dict_sorted(tags, True))
 
-    updated_tags = TagConverter.conv_callings_and_tags(novels, tags, callings)
-    if not updated_tags:
-        return None
+    def _renderer(records: list, state: NovelState) -> tuple:
+        return _rendered(records, translator, callings, is_comment, state), state
 
-    formatted = Formatter.format_data(updated_tags, is_comment)
-    if not formatted:
-        return None
+    if cache:
+        # NOTE: the top-level scenes are rendered again only if their records,
+        #       the tables or the comment flag are changed
+        rendered = cache.render_fragments(story_data.get_data(),
+                digest_of(PROC, translator.tags, callings, is_comment),
+                NovelState(), _renderer)
+        logger.debug(msg.PROC_MESSAGE.format(
+            proc=f"rendered {cache.rendered} fragments, reused {cache.reused}: {PROC}"))
+    else:
+        rendered = [_renderer(story_data.get_data(), NovelState())[0]]
 
-    translated = translate_tags_text_list(formatted, dict_sorted(tags, True))
+    translated = [line for lines, _ in rendered for line in lines]
+    if not translated:
+        return None
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return OutputsData(translated)
+    return OutputsData(translated,
+            scene_stats_from([mark for _, marks in rendered for mark in marks]))
 
 
 # Processes
 class Converter(object):
 
     @classmethod
-    def novels_data_from(cls, story_data: StoryData) -> list:
+    def novels_data_from(cls, story_data: StoryData, state: NovelState = None) -> list:
         assert isinstance(story_data, StoryData)
 
         tmp = []
-        indices = [0]
+        indices = state.indices if state else [0]
 
         for record in story_data.get_data():
             assert isinstance(record, BaseCode)
@@ -184,9 +205,9 @@ class Converter(object):
 class TagConverter(object):
 
     @classmethod
-    def conv_callings_and_tags(cls, data: list, tags: dict, callings: dict) -> list:
+    def conv_callings_and_tags(cls, data: list, tags: TagTranslator, callings: dict) -> list:
         assert isinstance(data, list)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
         assert isinstance(callings, dict)
 
         tmp = []
@@ -207,7 +228,7 @@ class TagConverter(object):
         assert isinstance(callings, dict)
 
         if record.subject in callings:
-            calling = dict_sorted(callings[record.subject], True)
+            calling = callings[record.subject]
             return NovelRecord(record.type,
                     calling['S'],
                     [translate_tags_str(d, calling) for d in record.descs],
@@ -219,19 +240,25 @@ class TagConverter(object):
 class Formatter(object):
 
     @classmethod
-    def format_data(cls, data: list, is_comment: bool) -> list:
+    def format_data(cls, data: list, is_comment: bool, state: NovelState = None,
+            stats: StatsRecorder = None) -> list:
         assert isinstance(data, list)
         assert isinstance(is_comment, bool)
 
         tmp = []
-        is_nobr = False
-        is_firstindent = False
+        is_nobr = state.is_nobr if state else False
+        is_firstindent = state.is_firstindent if state else False
+        stats = stats if stats else StatsRecorder(BuildType.NOVEL)
 
         for record in data:
             assert isinstance(record, NovelRecord)
+            start = len(tmp)
             if RecordType.TITLE is record.type:
                 ret = cls._to_title(record)
                 if ret:
+                    if record.note != -1:
+                        stats.head(record.note + 1, len(tmp))
+                        start = len(tmp) + 1
                     tmp.append(ret)
                     tmp.append(get_br(2))
             elif RecordType.BR is record.type:
@@ -293,6 +320,10 @@ class Formatter(object):
                     tmp.append(get_br())
             else:
                 continue
+            stats.texts(start, len(tmp))
+
+        if state:
+            state.is_nobr, state.is_firstindent = is_nobr, is_firstindent
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"formatted novels data: {PROC}"))
 
@@ -344,6 +375,22 @@ class Formatter(object):
 
 
 # Private Functions
+def _rendered(records: list, translator: TagTranslator, callings: dict, is_comment: bool,
+        state: NovelState) -> tuple:
+    """Return the lines of the records and the marks of their scene stats."""
+    assert isinstance(records, list)
+    assert isinstance(translator, TagTranslator)
+    assert isinstance(state, NovelState)
+
+    recorder = StatsRecorder(BuildType.NOVEL)
+    novels = Converter.novels_data_from(StoryData(records), state)
+    updated_tags = TagConverter.conv_callings_and_tags(novels, translator, callings)
+    formatted = Formatter.format_data(updated_tags, is_comment, state, recorder)
+    translated = translate_tags_text_list(formatted, translator)
+
+    return translated, recorder.marks_of(translated)
+
+
 def _conv_dialogue_mark(data: list) -> list:
     assert isinstance(data, list)
 
@@ -6,13 +6,16 @@ from dataclasses import dataclass
 
 # My Modules
 from sms.commons.format import get_br, get_breakline
+from sms.core.charcounter import StatsRecorder, scene_stats_from
 from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
+from sms.types.build import BuildType
 from sms.utils.log import logger
 from sms.utils.dicts import dict_sorted
+from sms.utils.slots import slotted
 from sms.utils.strings import get_indent_text
 from sms.utils.strtranslate import translate_tags_text_list
 
@@ -26,6 +29,7 @@ __all__ = (
 PROC = 'BUILD OUTLINE'
 
 
+@slotted
 @dataclass
 class OutlineRecord(object):
     level: int
@@ -49,7 +53,8 @@ def build_outline(story_data: StoryData, tags: dict) -> OutputsData:
     if not reordered:
         return None
 
-    formatted = Formatter.format_data(reordered)
+    recorder = StatsRecorder(BuildType.OUTLINE)
+    formatted = Formatter.format_data(reordered, recorder)
     if not formatted:
         return None
 
@@ -57,7 +62,7 @@ def build_outline(story_data: StoryData, tags: dict) -> OutputsData:
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return OutputsData(translated)
+    return OutputsData(translated, scene_stats_from(recorder.marks_of(translated)))
 
 
 # Processes
@@ -136,11 +141,12 @@ class Converter(object):
 class Formatter(object):
 
     @classmethod
-    def format_data(cls, data: list) -> list:
+    def format_data(cls, data: list, stats: StatsRecorder = None) -> list:
         assert isinstance(data, list)
 
         tmp = []
         current = 0
+        stats = stats if stats else StatsRecorder(BuildType.OUTLINE)
 
         for record in data:
             assert isinstance(record, OutlineRecord)
@@ -149,7 +155,11 @@ class Formatter(object):
                 current = record.level
             ret = cls._to_output_record(record)
             if ret:
+                # NOTE: the title and the outline of each record are a scene
+                stats.head(record.level, len(tmp))
                 tmp.extend(ret)
+                stats.texts(len(tmp) - len(ret) + 1, len(tmp))
+                stats.end()
                 tmp.append(get_br(2))
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"formatted outlines data: {PROC}"))
@@ -0,0 +1,126 @@
+"""Compile pass manager module."""
+
+# Official Libraries
+import time
+
+
+# My Modules
+from sms.objs.basecode import BaseCode
+from sms.syss import messages as msg
+from sms.utils import assertion
+from sms.utils.log import logger
+from sms.utils.profiler import is_profiling, profiled, record_stage
+
+
+__all__ = (
+        'CodePass',
+        'PassManager',
+        )
+
+
+# Define Constants
+PROC = 'PASS MANAGER'
+
+TIMED_CHUNK_SIZE = 1024
+"""int: records run through the passes at once when the passes are timed."""
+
+
+# Main
+class CodePass(object):
+    """Base of compile passes.
+
+    A pass transforms the story records one by one in order, and keeps its
+    own state between the records. It returns one record for each record.
+    """
+
+    name = 'code pass'
+
+    def step(self, record: BaseCode) -> BaseCode:
+        raise NotImplementedError
+
+
+class PassManager(object):
+
+    def __init__(self, passes: list, is_fused: bool = True):
+        self.passes = assertion.is_list(passes)
+        self.is_fused = assertion.is_instance(is_fused, bool)
+
+    def run(self, data: list) -> list:
+        assert isinstance(data, list)
+
+        if self.is_fused and is_profiling():
+            return Runner.run_fused_timed(self.passes, data)
+        elif self.is_fused:
+            return Runner.run_fused(self.passes, data)
+        else:
+            return Runner.run_each(self.passes, data)
+
+
+# Processes
+class Runner(object):
+
+    def run_each(passes: list, data: list) -> list:
+        assert isinstance(passes, list)
+        assert isinstance(data, list)
+
+        tmp = data
+
+        for code_pass in passes:
+            assert isinstance(code_pass, CodePass)
+            logger.debug(msg.PROC_START.format(proc=f"{code_pass.name}: {PROC}"))
+            step = code_pass.step
+            with profiled(code_pass.name, 'pass') as stage:
+                tmp = [step(assertion.is_instance(record, BaseCode)) for record in tmp]
+                stage.records = len(tmp)
+            logger.debug(msg.PROC_SUCCESS.format(proc=f"{code_pass.name}: {PROC}"))
+
+        return tmp
+
+    def run_fused(passes: list, data: list) -> list:
+        assert isinstance(passes, list)
+        assert isinstance(data, list)
+
+        logger.debug(msg.PROC_START.format(proc=f"fused {len(passes)} passes: {PROC}"))
+
+        steps = [assertion.is_instance(code_pass, CodePass).step for code_pass in passes]
+        tmp = []
+
+        for record in data:
+            assert isinstance(record, BaseCode)
+            for step in steps:
+                record = step(record)
+            tmp.append(record)
+
+        logger.debug(msg.PROC_SUCCESS.format(proc=f"fused {len(passes)} passes: {PROC}"))
+
+        return tmp
+
+    def run_fused_timed(passes: list, data: list) -> list:
+        assert isinstance(passes, list)
+        assert isinstance(data, list)
+
+        logger.debug(msg.PROC_START.format(proc=f"fused {len(passes)} timed passes: {PROC}"))
+
+        steps = [assertion.is_instance(code_pass, CodePass).step for code_pass in passes]
+        walls = [0.0] * len(steps)
+        cpus = [0.0] * len(steps)
+        tmp = []
+
+        # NOTE: each pass runs on a chunk of records before the next pass, as the
+        #       passes keep their own states, so the clocks are read once a chunk
+        for start in range(0, len(data), TIMED_CHUNK_SIZE):
+            chunk = data[start:start + TIMED_CHUNK_SIZE]
+            for i, step in enumerate(steps):
+                wall = time.perf_counter()
+                cpu = time.process_time()
+                chunk = [step(assertion.is_instance(record, BaseCode)) for record in chunk]
+                cpus[i] += time.process_time() - cpu
+                walls[i] += time.perf_counter() - wall
+            tmp.extend(chunk)
+
+        for code_pass, wall, cpu in zip(passes, walls, cpus):
+            record_stage(code_pass.name, 'pass', wall, cpu, len(data))
+
+        logger.debug(msg.PROC_SUCCESS.format(proc=f"fused {len(passes)} timed passes: {PROC}"))
+
+        return tmp
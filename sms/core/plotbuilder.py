@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 
 # My Modules
 from sms.commons.format import get_br, get_breakline
+from sms.core.charcounter import StatsRecorder, scene_stats_from
 from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.action import Action
@@ -13,8 +14,10 @@ from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.action import ActType
+from sms.types.build import BuildType
 from sms.utils.log import logger
 from sms.utils.dicts import dict_sorted
+from sms.utils.slots import slotted
 from sms.utils.strings import get_indent_text
 from sms.utils.strtranslate import translate_tags_text_list
 
@@ -28,6 +31,7 @@ __all__ = (
 PROC = 'BUILD PLOT'
 
 
+@slotted
 @dataclass
 class PlotRecord(object):
     level: int
@@ -54,7 +58,8 @@ def build_plot(story_data: StoryData, tags: dict) -> OutputsData:
         logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"reordered plots: {PROC}"))
         return None
 
-    formatted = Formatter.format_data(reordered)
+    recorder = StatsRecorder(BuildType.PLOT)
+    formatted = Formatter.format_data(reordered, recorder)
     if not formatted:
         logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"formatted plots: {PROC}"))
         return None
@@ -63,7 +68,7 @@ def build_plot(story_data: StoryData, tags: dict) -> OutputsData:
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return OutputsData(translated)
+    return OutputsData(translated, scene_stats_from(recorder.marks_of(translated)))
 
 
 # Processes
@@ -149,11 +154,12 @@ class Converter(object):
 class Formatter(object):
 
     @classmethod
-    def format_data(cls, data: list) -> list:
+    def format_data(cls, data: list, stats: StatsRecorder = None) -> list:
         assert isinstance(data, list)
 
         tmp = []
         current = 0
+        stats = stats if stats else StatsRecorder(BuildType.PLOT)
 
         for record in data:
             assert isinstance(record, PlotRecord)
@@ -162,7 +168,11 @@ class Formatter(object):
                 current = record.level
             ret = cls._to_output_record(record)
             if ret:
+                # NOTE: the plot of each record is a scene, with the sub title
+                stats.head(record.level, len(tmp))
                 tmp.extend(ret)
+                stats.texts(len(tmp) - len(ret) + 1, len(tmp))
+                stats.end()
                 tmp.append(get_br(2))
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"fomatted plots data: {PROC}"))
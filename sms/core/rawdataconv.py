@@ -1,17 +1,23 @@
 """Raw source data convert module."""
 
 # Official Libraries
-import copy
+import mmap
+import os
+import re
 
 
 # My Modules
 from sms.objs.rawsrc import RawSrc
 from sms.syss import messages as msg
+from sms.utils.fileio import decoded_text, read_file
 from sms.utils.log import logger
 from sms.utils.strings import rid_rn
 
 
 __all__ = (
+        'IndexedRawSrc',
+        'raw_src_index_from',
+        'raw_src_index_restamped',
         'raw_src_objects_from',
         )
 
@@ -19,50 +25,152 @@ __all__ = (
 # Define Constants
 PROC = 'RAW DATA CONV'
 
+GLOBAL_TAG = 'global'
+"""str: tag of the lines before the first scene head."""
+
+SCENE_HEAD = re.compile(rb'^## ', re.MULTILINE)
+"""Pattern: scene head line in bytes."""
+
+TEXT_LINE = re.compile(rb'^(?!#!SMS)(?!# )[^\r\n]', re.MULTILINE)
+"""Pattern: line kept in the source data, in bytes."""
+
+SINGLE_CR = re.compile(rb'\r(?!\n)')
+"""Pattern: old style line end, which is not indexed."""
+
 
 # Main
-def raw_src_objects_from(data: str) -> list:
+class IndexedRawSrc(RawSrc):
+    """Raw source of a scene in a large file, read from the file when used.
+
+    The file is indexed by raw_src_index_from, and the lines are made on
+    each access without keeping them.
+    """
+
+    def __init__(self, tag: str, path: str, start: int, end: int, stamp: tuple,
+            lines: tuple = (0, 0)):
+        self.tag = tag
+        self.path = path
+        self.start = start
+        self.end = end
+        self.stamp = stamp
+        self.lines = lines
+
+    @property
+    def data(self) -> list:
+        if _stamp_of(self.path) != self.stamp:
+            # NOTE: the file is changed after indexing, so parse it again
+            logger.warning(msg.PROC_MESSAGE.format(proc=f"changed source {self.path}: {PROC}"))
+            for src in raw_src_objects_from(read_file(self.path), self.path):
+                if src.tag == self.tag:
+                    return src.data
+            return []
+
+        with open(self.path, 'rb') as file:
+            file.seek(self.start)
+            raw = file.read(self.end - self.start)
+
+        return _src_lines_from(decoded_text(raw).split('\n'))
+
+
+def raw_src_index_from(path: str) -> list:
+    """Index the scenes of the file by the byte offsets of the scene heads.
+
+    The file is memory mapped and scanned once, and the lines are not read.
+    """
+    assert isinstance(path, str)
+
+    logger.debug(msg.PROC_START.format(proc=f"index {path}: {PROC}"))
+
+    srcs = []
+    stamp = _stamp_of(path)
+
+    if not stamp[0]:
+        return srcs
+
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if SINGLE_CR.search(data):
+                logger.debug(msg.PROC_MESSAGE.format(proc=f"not indexed {path}: {PROC}"))
+                return raw_src_objects_from(read_file(path), path)
+
+            size = len(data)
+            heads = [m.start() for m in SCENE_HEAD.finditer(data)]
+            current = GLOBAL_TAG
+            start = 0
+            # NOTE: line numbers of the current head and of the start offset
+            first = line = 1
+
+            for head in heads + [size]:
+                head_line = line + data[start:head].count(b'\n')
+                if TEXT_LINE.search(data, start, head):
+                    last = head_line - 1 if head < size or data[size - 1:] == b'\n' else head_line
+                    srcs.append(IndexedRawSrc(current, path, start, head, stamp, (first, last)))
+                if head == size:
+                    break
+                eol = data.find(b'\n', head)
+                start = size if eol < 0 else eol + 1
+                first = head_line
+                line = head_line + (1 if eol >= 0 else 0)
+                current = _get_scene_tag(decoded_text(data[head:start]).rstrip('\n'))
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=f"index {path}: {PROC}"))
+
+    return srcs
+
+
+def raw_src_index_restamped(srcs: list, stamp: tuple) -> list:
+    """Set the stamp of the file touched without changes to the indexed sources."""
+    assert isinstance(srcs, list)
+    assert isinstance(stamp, tuple)
+
+    for src in srcs:
+        if isinstance(src, IndexedRawSrc):
+            src.stamp = stamp
+
+    return srcs
+
+
+def raw_src_objects_from(data: str, path: str = '') -> list:
     assert isinstance(data, str)
+    assert isinstance(path, str)
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
     srcs = []
     tmp = []
-    current = 'global'
+    current = GLOBAL_TAG
+    lines = data.split('\n')
+    first = 1
 
-    for line in data.split('\n'):
-        if line.startswith('#!SMS'):
-            # meta mark
-            continue
-        elif line.startswith('## '):
+    for num, line in enumerate(lines, 1):
+        if line.startswith('## '):
             if tmp:
-                srcs.append(Converter.to_src(current, copy.deepcopy(tmp)))
+                srcs.append(Converter.to_src(current, _src_lines_from(tmp), path, (first, num - 1)))
             current = _get_scene_tag(line)
+            first = num
             tmp = []
-        elif line.startswith('# '):
-            # source comment
-            continue
-        elif line:
-            tmp.append(line)
         else:
-            # break line
-            continue
+            tmp.append(line)
     if tmp:
-        srcs.append(Converter.to_src(current, copy.deepcopy(tmp)))
+        # NOTE: the empty string after the last line end is not a line
+        last = len(lines) - 1 if len(lines) > 1 and not lines[-1] else len(lines)
+        srcs.append(Converter.to_src(current, _src_lines_from(tmp), path, (first, last)))
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return srcs
+    return [src for src in srcs if src.data]
 
 
 # Processes
 class Converter(object):
 
-    def to_src(tag: str, data: list) -> RawSrc:
+    def to_src(tag: str, data: list, path: str, lines: tuple) -> RawSrc:
         assert isinstance(tag, str)
         assert isinstance(data, list)
+        assert isinstance(path, str)
+        assert isinstance(lines, tuple)
 
-        return RawSrc(tag, data)
+        return RawSrc(tag, data, path, lines)
 
 
 # Private Functions
@@ -71,3 +179,31 @@ def _get_scene_tag(line: str) -> str:
     assert line.startswith('## ')
 
     return rid_rn(line[3:])
+
+
+def _src_lines_from(lines: list) -> list:
+    assert isinstance(lines, list)
+
+    tmp = []
+
+    for line in lines:
+        if line.startswith('#!SMS'):
+            # meta mark
+            continue
+        elif line.startswith('# '):
+            # source comment
+            continue
+        elif line:
+            tmp.append(line)
+        else:
+            # break line
+            continue
+
+    return tmp
+
+
+def _stamp_of(path: str) -> tuple:
+    assert isinstance(path, str)
+
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
@@ -1,17 +1,23 @@
 """Rubi apply module."""
 
 # Official Libraries
+import bisect
 import re
+from dataclasses import dataclass, field
 
 
 # My Modules
 from sms.db.outputsdata import OutputsData
 from sms.objs.rubi import Rubi, RubiData
 from sms.syss import messages as msg
+from sms.types.rubi import RubiScope
+from sms.utils import assertion
 from sms.utils.log import logger
 
 
 __all__ = (
+        'RubiEngine',
+        'RubiState',
         'apply_rubi_in_novel_data',
         )
 
@@ -19,19 +25,43 @@ __all__ = (
 # Define Constants
 PROC = 'RUBI APPLYER'
 
+SCENE_HEAD = re.compile(r'^(#+) ')
+"""Pattern: title line of a scene in the novel, with its head."""
+
+
+@dataclass
+class RubiEntry(object):
+    pattern: re.Pattern
+    name: str
+    exclusion: re.Pattern
+    is_always: bool
+
+
+@dataclass
+class RubiState(object):
+    """Rubis applied in the scope, kept out of the shared rubi data."""
+    done: set = field(default_factory=set)
+
 
 # Main
-def apply_rubi_in_novel_data(outputs: OutputsData, rubis: RubiData) -> OutputsData:
+def apply_rubi_in_novel_data(outputs: OutputsData, rubis: RubiData,
+        scope: RubiScope = RubiScope.NOVEL) -> OutputsData:
     assert isinstance(outputs, OutputsData)
     assert isinstance(rubis, RubiData)
+    assert isinstance(scope, RubiScope)
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
     tmp = []
+    engine = RubiEngine(rubis)
+    state = RubiState()
+    chapter = _chapter_head_in(outputs) if RubiScope.CHAPTER is scope else None
 
-    for record in outputs.get_data():
+    for record in outputs:
         assert isinstance(record, str)
-        tmp.append(Converter.conv_rubi(record, rubis))
+        if chapter and record.startswith(chapter):
+            state = RubiState()
+        tmp.append(engine.apply(record, state))
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
@@ -39,26 +69,144 @@ def apply_rubi_in_novel_data(outputs: OutputsData, rubis: RubiData) -> OutputsDa
 
 
 # Processes
-class Converter(object):
+class RubiEngine(object):
+    """Rubi keys compiled into one pattern, scanned once for each text.
 
-    @classmethod
-    def conv_rubi(cls, text: str, rubis: RubiData) -> str:
-        assert isinstance(text, str)
+    The rubi is added to the first match of its key in the scope, or to all
+    the matches if always, unless the match is in an exclusion. When some keys
+    match at the same place, the one placed earlier in the rubi data wins,
+    and the later ones are tried when it is done or excluded.
+    """
+
+    def __init__(self, rubis: RubiData):
         assert isinstance(rubis, RubiData)
 
-        tmp = text
+        self.entries = [_entry_of(tag, rubi) for tag, rubi in rubis.data.items()]
+        # NOTE: without capturing groups, which slow down the alternation
+        self._matcher = re.compile('|'.join(f"(?:{entry.pattern.pattern})"
+            for entry in self.entries)) if self.entries else None
+        self._literals = {}
+        self._patterns = []
+        self._heads = {}
+        self._candidates = {}
+
+        for index, entry in enumerate(self.entries):
+            if re.escape(entry.pattern.pattern) == entry.pattern.pattern:
+                self._literals.setdefault(entry.pattern.pattern, index)
+                self._heads.setdefault(entry.pattern.pattern[:1], []).append(index)
+            else:
+                self._patterns.append(index)
+
+    def apply(self, text: str, state: RubiState) -> str:
+        assert isinstance(text, str)
+        assert isinstance(state, RubiState)
+
+        if not self._matcher:
+            return text
+
+        tmp = []
+        pos = 0
+        start = 0
+
+        while True:
+            matched = self._matcher.search(text, pos)
+            if not matched:
+                break
+            found = self._applied_at(text, matched, state)
+            if found:
+                index, key_matched = found
+                entry = self.entries[index]
+                tmp.append(text[start:matched.start()])
+                tmp.append(key_matched.expand(entry.name))
+                start = pos = key_matched.end()
+                if not entry.is_always:
+                    state.done.add(index)
+            else:
+                # NOTE: the other keys may match in the skipped one
+                pos = matched.start() + 1
+
+        if not tmp:
+            return text
+
+        tmp.append(text[start:])
+
+        return "".join(tmp)
+
+    def _applied_at(self, text: str, matched: re.Match, state: RubiState) -> tuple:
+        """Return the first key in the order to apply at the place and its match.
+
+        When the first key matching there is done or excluded, the later keys
+        matching at the same place are tried, as each key is applied in turn.
+        """
+        index = self._index_of(text, matched)
+        found = self._key_matched(index, text, matched.start(), state)
+        if found:
+            return index, found
+
+        head = text[matched.start()]
+        if head not in self._candidates:
+            self._candidates[head] = sorted(self._heads.get(head, []) + self._patterns)
+        candidates = self._candidates[head]
+
+        for candidate in candidates[bisect.bisect_right(candidates, index):]:
+            found = self._key_matched(candidate, text, matched.start(), state)
+            if found:
+                return candidate, found
+
+        return None
+
+    def _key_matched(self, index: int, text: str, pos: int, state: RubiState) -> re.Match:
+        entry = self.entries[index]
+        if not entry.is_always and index in state.done:
+            return None
+
+        # NOTE: matched again by the key itself to expand its own groups
+        matched = entry.pattern.match(text, pos)
+        if not matched or matched.end() == matched.start() or _is_excluded(entry, text, matched):
+            return None
+
+        return matched
+
+    def _index_of(self, text: str, matched: re.Match) -> int:
+        """Return the first key in the order matching at the place, as the alternation does."""
+        index = self._literals.get(matched.group(0), len(self.entries))
+
+        for pattern_index in self._patterns:
+            if pattern_index > index:
+                break
+            if self.entries[pattern_index].pattern.match(text, matched.start()):
+                return pattern_index
+
+        return index
+
+
+# Private Functions
+def _chapter_head_in(outputs: OutputsData) -> str:
+    """Return the head of the scenes called from the entrypoint, the shallowest after its title."""
+    assert isinstance(outputs, OutputsData)
+
+    depths = [len(matched.group(1)) for matched in (SCENE_HEAD.match(record) for record in outputs)
+            if matched]
+
+    return '#' * min(depths[1:]) + ' ' if len(depths) > 1 else None
+
+
+def _entry_of(tag: str, rubi: Rubi) -> RubiEntry:
+    assert isinstance(tag, str)
+    assert isinstance(rubi, Rubi)
+
+    exclusions = assertion.is_list(rubi.exclusions) if rubi.exclusions else []
+
+    return RubiEntry(
+            re.compile(tag),
+            rubi.name,
+            re.compile('|'.join(f"(?:{val})" for val in exclusions)) if exclusions else None,
+            bool(rubi.is_always))
 
-        for tag, rubi in rubis.data.items():
-            assert isinstance(tag, str)
-            assert isinstance(rubi, Rubi)
-            # match test
-            if re.search(r'{}'.format(tag), tmp):
-                if rubi.is_done():
-                    continue
-                tmp = cls._add_rubi(tmp, tag, rubi.name)
-                rubi.done()
 
-        return tmp
+def _is_excluded(entry: RubiEntry, text: str, matched: re.Match) -> bool:
+    if not entry.exclusion:
+        return False
 
-    def _add_rubi(src: str, key: str, rubi: str, num: int = 1) -> str:
-        return re.sub(r'{}'.format(key), r'{}'.format(rubi), src, num)
+    return any(val.start() <= matched.start() and matched.end() <= val.end()
+            for val in entry.exclusion.finditer(text))
@@ -4,6 +4,7 @@
 
 
 # My Modules
+from sms.core.passmanager import CodePass, PassManager
 from sms.objs.action import Action
 from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
@@ -15,6 +16,8 @@ from sms.utils.log import logger
 __all__ = (
         'apply_scene_action_same',
         'apply_scene_info_same',
+        'SameActionPass',
+        'SameInfoPass',
         )
 
 
@@ -29,17 +32,7 @@ def apply_scene_action_same(data: list) -> list:
     _PROC = f"{PROC}: scene action same conv"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
-    tmp = []
-    cache = None
-
-    for record in data:
-        assert isinstance(record, BaseCode)
-        if isinstance(record, Action):
-            ret = Converter.conv_same_action(record, cache)
-            tmp.append(ret)
-            cache = ret
-        else:
-            tmp.append(record)
+    tmp = PassManager([SameActionPass()]).run(data)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
@@ -52,27 +45,45 @@ def apply_scene_info_same(data: list) -> list:
     _PROC = f"{PROC}: scene info same conv"
     logger.debug(msg.PROC_START.format(proc=_PROC))
 
-    tmp = []
-    cache = None
-
-    for record in data:
-        assert isinstance(record, BaseCode)
-        if isinstance(record, SceneInfo):
-            ret = Converter.conv_same_info(record, cache)
-            if ret:
-                tmp.append(ret)
-                cache = ret
-            else:
-                # nospin
-                tmp.append(record)
-        else:
-            tmp.append(record)
+    tmp = PassManager([SameInfoPass()]).run(data)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
 
     return tmp
 
 
+class SameActionPass(CodePass):
+
+    name = 'action same'
+
+    def __init__(self):
+        self.cache = None
+
+    def step(self, record: BaseCode) -> BaseCode:
+        if isinstance(record, Action):
+            ret = Converter.conv_same_action(record, self.cache)
+            self.cache = ret
+            return ret
+        return record
+
+
+class SameInfoPass(CodePass):
+
+    name = 'info same'
+
+    def __init__(self):
+        self.cache = None
+
+    def step(self, record: BaseCode) -> BaseCode:
+        if isinstance(record, SceneInfo):
+            ret = Converter.conv_same_info(record, self.cache)
+            if ret:
+                self.cache = ret
+                return ret
+            # nospin
+        return record
+
+
 # Processes
 class Converter(object):
 
@@ -85,6 +96,9 @@ class Converter(object):
         else:
             return act
 
+        if ActType.SAME is not act.type and not cls._is_same(act.subject):
+            return act
+
         return Action(
                 cache.type if ActType.SAME is act.type else act.type,
                 cache.subject if cls._is_same(act.subject) else act.subject,
@@ -106,6 +120,9 @@ class Converter(object):
         else:
             return info
 
+        if not any(cls._is_same(text) for text in (info.camera, info.stage, info.year, info.date, info.time)):
+            return info
+
         clock = info.clock
 
         if cls._is_same(info.time):
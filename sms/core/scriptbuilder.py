@@ -9,6 +9,8 @@ from typing import Any
 # My Modules
 from sms.commons.format import get_br, get_indent
 from sms.commons.format import join_descs, markdown_comment_style_of
+from sms.core.charcounter import StatsRecorder, scene_stats_from
+from sms.db.fragmentcache import FragmentCache, digest_of
 from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.action import Action
@@ -18,10 +20,13 @@ from sms.objs.sceneend import SceneEnd
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.action import ActType
+from sms.types.build import BuildType
 from sms.types.instruction import InstType
 from sms.utils import assertion
 from sms.utils.dicts import dict_sorted
 from sms.utils.log import logger
+from sms.utils.slots import slotted
+from sms.utils.strtranslate import TagTranslator
 from sms.utils.strtranslate import translate_tags_str
 from sms.utils.strtranslate import translate_tags_text_list
 
@@ -63,6 +68,7 @@ NORMAL_DESCS = [
         ]
 
 
+@slotted
 @dataclass
 class SpinInfo(object):
     subject: str
@@ -73,6 +79,7 @@ class SpinInfo(object):
     clock: str
 
 
+@slotted
 @dataclass
 class ScriptRecord(object):
     type: RecordType
@@ -81,9 +88,15 @@ class ScriptRecord(object):
     note: Any = None
 
 
+@slotted
+@dataclass
+class ScriptState(object):
+    indices: list = field(default_factory=lambda: [0])
+
+
 # Main
 def build_script(story_data: StoryData, tags: dict, callings: dict,
-        is_comment: bool) -> OutputsData:
+        is_comment: bool, cache: FragmentCache = None) -> OutputsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
     assert isinstance(callings, dict)
@@ -91,34 +104,39 @@ def build_script(story_data: StoryData, tags: dict, callings: dict,
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    scripts = Converter.scripts_data_from(story_data)
-    if not scripts:
-        return None
+    translator = TagTranslator(dict_sorted(tags, True))
 
-    updated_tags = TagConverter.conv_callings_and_tags(scripts, dict_sorted(tags, True), callings)
-    if not updated_tags:
-        return None
+    def _renderer(records: list, state: ScriptState) -> tuple:
+        return _rendered(records, translator, callings, is_comment, state), state
 
-    formatted = Formatter.format_data(updated_tags, is_comment)
-    if not formatted:
-        return None
+    if cache:
+        rendered = cache.render_fragments(story_data.get_data(),
+                digest_of(PROC, translator.tags, callings, is_comment),
+                ScriptState(), _renderer)
+        logger.debug(msg.PROC_MESSAGE.format(
+            proc=f"rendered {cache.rendered} fragments, reused {cache.reused}: {PROC}"))
+    else:
+        rendered = [_renderer(story_data.get_data(), ScriptState())[0]]
 
-    translated = translate_tags_text_list(formatted, dict_sorted(tags, True))
+    translated = [line for lines, _ in rendered for line in lines]
+    if not translated:
+        return None
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return OutputsData(translated)
+    return OutputsData(translated,
+            scene_stats_from([mark for _, marks in rendered for mark in marks]))
 
 
 # Processes
 class Converter(object):
 
     @classmethod
-    def scripts_data_from(cls, story_data: StoryData) -> list:
+    def scripts_data_from(cls, story_data: StoryData, state: ScriptState = None) -> list:
         assert isinstance(story_data, StoryData)
 
         tmp = []
-        indices = [0]
+        indices = state.indices if state else [0]
 
         for record in story_data.get_data():
             assert isinstance(record, BaseCode)
@@ -215,9 +233,9 @@ class Converter(object):
 class TagConverter(object):
 
     @classmethod
-    def conv_callings_and_tags(cls, data: list, tags: dict, callings: dict) -> list:
+    def conv_callings_and_tags(cls, data: list, tags: TagTranslator, callings: dict) -> list:
         assert isinstance(data, list)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
         assert isinstance(callings, dict)
 
         tmp = []
@@ -240,7 +258,7 @@ class TagConverter(object):
         assert isinstance(callings, dict)
 
         if record.subject in callings:
-            calling = dict_sorted(callings[record.subject], True)
+            calling = callings[record.subject]
             return ScriptRecord(record.type,
                     calling['S'],
                     [translate_tags_str(d, calling) for d in record.descs],
@@ -248,9 +266,9 @@ class TagConverter(object):
         else:
             return record
 
-    def _conv_spin(record: ScriptRecord, tags: dict) -> ScriptRecord:
+    def _conv_spin(record: ScriptRecord, tags: TagTranslator) -> ScriptRecord:
         assert isinstance(record, ScriptRecord)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, SpinInfo)
 
@@ -268,17 +286,22 @@ class TagConverter(object):
 class Formatter(object):
 
     @classmethod
-    def format_data(cls, data: list, is_comment: bool) -> list:
+    def format_data(cls, data: list, is_comment: bool, stats: StatsRecorder = None) -> list:
         assert isinstance(data, list)
         assert isinstance(is_comment, bool)
 
         tmp = []
+        stats = stats if stats else StatsRecorder(BuildType.SCRIPT)
 
         for record in data:
             assert isinstance(record, ScriptRecord)
+            start = len(tmp)
             if RecordType.TITLE is record.type:
                 ret = cls._to_title(record)
                 if ret:
+                    if record.note != -1:
+                        stats.head(record.note + 1, len(tmp))
+                        start = len(tmp) + 1
                     tmp.append(ret)
                     tmp.append(get_br(2))
             elif RecordType.BR is record.type:
@@ -326,6 +349,7 @@ class Formatter(object):
                     tmp.append(get_br())
             else:
                 continue
+            stats.texts(start, len(tmp))
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"formatted script data: {PROC}"))
 
@@ -377,3 +401,20 @@ class Formatter(object):
         head = '#' + '#' * int(record.note) if record.note != -1 else ''
         index = record.descs[0]
         return f"{head} {index}. {record.subject}"
+
+
+# Private Functions
+def _rendered(records: list, translator: TagTranslator, callings: dict, is_comment: bool,
+        state: ScriptState) -> tuple:
+    """Return the lines of the records and the marks of their scene stats."""
+    assert isinstance(records, list)
+    assert isinstance(translator, TagTranslator)
+    assert isinstance(state, ScriptState)
+
+    recorder = StatsRecorder(BuildType.SCRIPT)
+    scripts = Converter.scripts_data_from(StoryData(records), state)
+    updated_tags = TagConverter.conv_callings_and_tags(scripts, translator, callings)
+    formatted = Formatter.format_data(updated_tags, is_comment, recorder)
+    translated = translate_tags_text_list(formatted, translator)
+
+    return translated, recorder.marks_of(translated)
@@ -1,6 +1,7 @@
 """Serialize module."""
 
 # Official Libraries
+from dataclasses import dataclass
 
 
 # My Modules
@@ -25,6 +26,15 @@ __all__ = (
 PROC = 'SERIALIZER'
 
 
+@dataclass
+class CallFrame(object):
+    tag: str
+    level: int
+    scode: SceneCode
+    index: int
+    data: list
+
+
 # Main
 def call_scene(level: int, tag: str, scenes: ScenesDB) -> list:
     assert isinstance(level, int)
@@ -37,39 +47,141 @@ def call_scene(level: int, tag: str, scenes: ScenesDB) -> list:
                 tag)
         return []
 
-    tmp = []
-
-    scode = assertion.is_instance(scenes.get(tag), SceneCode)
-    tmp.append(Converter.conv_scene_info_from(level, scode))
-
-    for obj in scode.data:
-        if isinstance(obj, Action):
-            tmp.append(obj)
-        elif isinstance(obj, Instruction):
-            if InstType.CALL is obj.type:
-                call_tag = obj.args[0]
-                # TODO: 親タグも取得して相互呼び出しを禁止する
-                if tag == call_tag:
-                    logger.error(
-                            msg.ERR_FAIL_MUSTBE_WITH_DATA.format(data=f"not self calling: {PROC}"),
-                            tag)
-                    raise ValueError('invalid self calling', tag)
-                ret = call_scene(level + 1, obj.args[0], scenes)
-                if ret:
-                    tmp.extend(ret)
-            else:
-                tmp.append(obj)
-        else:
-            logger.warning(
-                    msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"scene code object: {PROC}"),
-                    obj)
-            continue
-    tmp.append(_get_scene_end(scode))
+    graph = CallGraph.calls_from(tag, scenes)
 
-    return tmp
+    cycle = CallGraph.cycle_in(graph, tag)
+    if cycle:
+        logger.error(
+                msg.ERR_FAIL_MUSTBE_WITH_DATA.format(data=f"not cyclic calling: {PROC}"),
+                ' -> '.join(cycle))
+        raise ValueError('invalid cyclic calling', cycle)
+
+    return Expander.expand(level, tag, scenes, CallGraph.shared_in(graph))
 
 
 # Processes
+class CallGraph(object):
+
+    def calls_from(tag: str, scenes: ScenesDB) -> dict:
+        assert isinstance(tag, str)
+        assert isinstance(scenes, ScenesDB)
+
+        tmp = {}
+        rests = [tag]
+
+        while rests:
+            current = rests.pop()
+            if current in tmp:
+                continue
+            scode = assertion.is_instance(scenes.get(current), SceneCode)
+            tmp[current] = [obj.args[0] for obj in scode.data
+                    if isinstance(obj, Instruction) and InstType.CALL is obj.type
+                    and scenes.has(obj.args[0])]
+            rests.extend(tmp[current])
+
+        return tmp
+
+    def cycle_in(graph: dict, tag: str) -> list:
+        assert isinstance(graph, dict)
+        assert isinstance(tag, str)
+
+        path = [tag]
+        callees = [iter(graph[tag])]
+        visiting = {tag}
+        done = set()
+
+        while callees:
+            for callee in callees[-1]:
+                if callee in visiting:
+                    return path[path.index(callee):] + [callee]
+                if callee not in done:
+                    path.append(callee)
+                    callees.append(iter(graph[callee]))
+                    visiting.add(callee)
+                    break
+            else:
+                current = path.pop()
+                callees.pop()
+                visiting.remove(current)
+                done.add(current)
+
+        return []
+
+    def shared_in(graph: dict) -> set:
+        assert isinstance(graph, dict)
+
+        counts = {}
+        for callees in graph.values():
+            for callee in callees:
+                counts[callee] = counts.get(callee, 0) + 1
+
+        return {tag for tag, count in counts.items() if count > 1}
+
+
+class Expander(object):
+
+    @classmethod
+    def expand(cls, level: int, tag: str, scenes: ScenesDB, shared: set) -> list:
+        assert isinstance(level, int)
+        assert isinstance(tag, str)
+        assert isinstance(scenes, ScenesDB)
+        assert isinstance(shared, set)
+
+        # NOTE: the body of a scene called from some places is expanded once for each level,
+        #   other scenes are expanded into the list of the caller directly
+        expanded = {}
+        stack = [cls._frame_of(level, tag, scenes, [])]
+
+        while stack:
+            frame = stack[-1]
+            if frame.index >= len(frame.scode.data):
+                frame.data.append(_get_scene_end(frame.scode))
+                stack.pop()
+                if not stack:
+                    return frame.data
+                if frame.data is not stack[-1].data:
+                    expanded[(frame.tag, frame.level)] = frame.data
+                    stack[-1].data.extend(frame.data)
+                continue
+
+            obj = frame.scode.data[frame.index]
+            frame.index += 1
+
+            if isinstance(obj, Action):
+                frame.data.append(obj)
+            elif isinstance(obj, Instruction):
+                if InstType.CALL is obj.type:
+                    call_tag = obj.args[0]
+                    if not scenes.has(call_tag):
+                        logger.warning(
+                                msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"call tag: {PROC}"),
+                                call_tag)
+                    elif (call_tag, frame.level + 1) in expanded:
+                        frame.data.extend(expanded[(call_tag, frame.level + 1)])
+                    else:
+                        stack.append(cls._frame_of(frame.level + 1, call_tag, scenes,
+                            [] if call_tag in shared else frame.data))
+                else:
+                    frame.data.append(obj)
+            else:
+                logger.warning(
+                        msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"scene code object: {PROC}"),
+                        obj)
+
+        return []
+
+    def _frame_of(level: int, tag: str, scenes: ScenesDB, data: list) -> CallFrame:
+        assert isinstance(level, int)
+        assert isinstance(tag, str)
+        assert isinstance(scenes, ScenesDB)
+        assert isinstance(data, list)
+
+        scode = assertion.is_instance(scenes.get(tag), SceneCode)
+        data.append(Converter.conv_scene_info_from(level, scode))
+
+        return CallFrame(tag, level, scode, 0, data)
+
+
 class Converter(object):
 
     @classmethod
@@ -10,6 +10,7 @@ from typing import Any
 # My Modules
 from sms.commons.format import get_br, get_indent
 from sms.commons.format import markdown_comment_style_of
+from sms.core.charcounter import StatsRecorder, scene_stats_from
 from sms.db.outputsdata import OutputsData
 from sms.db.storydata import StoryData
 from sms.objs.action import Action
@@ -19,9 +20,12 @@ from sms.objs.sceneend import SceneEnd
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
 from sms.types.action import ActType, NORMAL_ACTS, OBJECT_ACTS
+from sms.types.build import BuildType
 from sms.utils.dicts import dict_sorted
 from sms.utils import assertion
 from sms.utils.log import logger
+from sms.utils.slots import slotted
+from sms.utils.strtranslate import TagTranslator
 from sms.utils.strtranslate import translate_tags_str, translate_tags_text_list
 
 
@@ -108,6 +112,7 @@ THINKING_ACTS = [
         ]
 
 
+@slotted
 @dataclass
 class SpinInfo(object):
     subject: str
@@ -119,6 +124,7 @@ class SpinInfo(object):
     clock: str
 
 
+@slotted
 @dataclass
 class StructRecord(object):
     type: RecordType
@@ -142,7 +148,9 @@ def build_struct(story_data: StoryData, tags: dict, callings: dict,
     if not structs:
         return None
 
-    updated_tags = TagConverter.conv_callings_and_tags(structs, tags, callings)
+    translator = TagTranslator(dict_sorted(tags, True))
+
+    updated_tags = TagConverter.conv_callings_and_tags(structs, translator, callings)
     if not updated_tags:
         return None
 
@@ -150,15 +158,16 @@ def build_struct(story_data: StoryData, tags: dict, callings: dict,
     if not reordered:
         return None
 
-    formatted = Formatter.format_data(reordered, is_comment)
+    recorder = StatsRecorder(BuildType.STRUCT)
+    formatted = Formatter.format_data(reordered, is_comment, recorder)
     if not formatted:
         return None
 
-    translated = translate_tags_text_list(formatted, dict_sorted(tags, True))
+    translated = translate_tags_text_list(formatted, translator)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
-    return OutputsData(translated)
+    return OutputsData(translated, scene_stats_from(recorder.marks_of(translated)))
 
 
 # Processes
@@ -268,20 +277,19 @@ class Converter(object):
 class TagConverter(object):
 
     @classmethod
-    def conv_callings_and_tags(cls, data: list, tags: dict, callings: dict) -> list:
+    def conv_callings_and_tags(cls, data: list, tags: TagTranslator, callings: dict) -> list:
         assert isinstance(data, list)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
         assert isinstance(callings, dict)
 
         tmp = []
-        _tags = dict_sorted(tags)
 
         for record in data:
             assert isinstance(record, StructRecord)
             if RecordType.SPIN is record.type:
-                tmp.append(cls._conv_spin(record, _tags))
+                tmp.append(cls._conv_spin(record, tags))
             elif record.type in [RecordType.ACT, RecordType.OBJECT, RecordType.PERSON]:
-                tmp.append(cls._conv_act(record, _tags, callings))
+                tmp.append(cls._conv_act(record, tags, callings))
             else:
                 tmp.append(record)
 
@@ -289,13 +297,13 @@ class TagConverter(object):
 
         return tmp
 
-    def _conv_act(record: StructRecord, tags: dict, callings: dict) -> StructRecord:
+    def _conv_act(record: StructRecord, tags: TagTranslator, callings: dict) -> StructRecord:
         assert isinstance(record, StructRecord)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
         assert isinstance(callings, dict)
 
         if record.subject in callings:
-            calling = dict_sorted(callings[record.subject], True)
+            calling = callings[record.subject]
             return StructRecord(record.type, record.act,
                     calling['S'],
                     translate_tags_str(record.outline, calling),
@@ -308,9 +316,9 @@ class TagConverter(object):
         else:
             return record
 
-    def _conv_spin(record: StructRecord, tags: dict) -> StructRecord:
+    def _conv_spin(record: StructRecord, tags: TagTranslator) -> StructRecord:
         assert isinstance(record, StructRecord)
-        assert isinstance(tags, dict)
+        assert isinstance(tags, TagTranslator)
 
         info = assertion.is_instance(record.note, SpinInfo)
 
@@ -431,17 +439,22 @@ class Reorder(object):
 class Formatter(object):
 
     @classmethod
-    def format_data(cls, data: list, is_comment: bool) -> list:
+    def format_data(cls, data: list, is_comment: bool, stats: StatsRecorder = None) -> list:
         assert isinstance(data, list)
         assert isinstance(is_comment, bool)
 
         tmp = []
+        stats = stats if stats else StatsRecorder(BuildType.STRUCT)
 
         for record in data:
             assert isinstance(record, StructRecord)
+            start = len(tmp)
             if RecordType.TITLE is record.type:
                 ret = cls._to_title(record)
                 if ret:
+                    if record.note != -1:
+                        stats.head(record.note + 1, len(tmp))
+                        start = len(tmp) + 1
                     tmp.append(ret)
                     tmp.append(get_br(2))
             elif RecordType.SCENE_END is record.type:
@@ -492,6 +505,7 @@ class Formatter(object):
                     tmp.append(get_br())
             else:
                 continue
+            stats.texts(start, len(tmp))
 
         logger.debug(msg.PROC_MESSAGE.format(proc=f"formatted structs data: {PROC}"))
 
@@ -0,0 +1,108 @@
+"""Tag resolve module."""
+
+# Official Libraries
+import copy
+
+
+# My Modules
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.basecode import BaseCode
+from sms.objs.sceneinfo import SceneInfo
+from sms.syss import messages as msg
+from sms.utils.dicts import dict_sorted
+from sms.utils.log import logger
+from sms.utils.strtranslate import TagTranslator
+
+
+__all__ = (
+        'tags_resolved_story_data',
+        )
+
+
+# Define Constants
+PROC = 'TAG RESOLVER'
+
+
+# Main
+def tags_resolved_story_data(story_data: StoryData, tags: dict, callings: dict) -> StoryData:
+    """Return the story data with the name tags translated in the texts, shared by the builders.
+
+    The tags matched by the calling keys are left, as the builders translate
+    them by the callings of the subjects before the name tags. The result is
+    kept for the same story data and tables.
+    """
+    assert isinstance(story_data, StoryData)
+    assert isinstance(tags, dict)
+    assert isinstance(callings, dict)
+
+    cached = _resolved.get(id(story_data))
+    if cached and cached[0] is story_data and cached[1] is tags and cached[2] is callings:
+        return cached[3]
+
+    logger.debug(msg.PROC_START.format(proc=PROC))
+
+    translator = TagTranslator(dict_sorted(tags, True))
+    deferred = TagTranslator({key: key for calling in callings.values() for key in calling.keys()})
+
+    resolved = StoryData([Resolver.resolved(record, translator, deferred)
+        for record in story_data.get_data()])
+
+    # NOTE: only the story data of the last build is kept
+    _resolved.clear()
+    _resolved[id(story_data)] = (story_data, tags, callings, resolved)
+
+    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+
+    return resolved
+
+
+# Processes
+class Resolver(object):
+
+    @classmethod
+    def resolved(cls, record: BaseCode, tags: TagTranslator, deferred: TagTranslator) -> BaseCode:
+        assert isinstance(record, BaseCode)
+
+        if isinstance(record, Action):
+            return cls._resolved_action(record, tags, deferred)
+        elif isinstance(record, SceneInfo):
+            return cls._resolved_scene_info(record, tags, deferred)
+        else:
+            return record
+
+    def _resolved_action(record: Action, tags: TagTranslator, deferred: TagTranslator) -> Action:
+        assert isinstance(record, Action)
+
+        outline = tags.translate_deferring(record.outline, deferred)
+        descs = [tags.translate_deferring(desc, deferred) for desc in record.descs]
+        note = tags.translate_deferring(record.note, deferred)
+
+        if outline == record.outline and descs == record.descs and note == record.note:
+            return record
+
+        tmp = copy.copy(record)
+        tmp.outline, tmp.descs, tmp.note = outline, descs, note
+
+        return tmp
+
+    def _resolved_scene_info(record: SceneInfo, tags: TagTranslator,
+            deferred: TagTranslator) -> SceneInfo:
+        assert isinstance(record, SceneInfo)
+
+        title = tags.translate_deferring(record.title, deferred)
+        outline = tags.translate_deferring(record.outline, deferred)
+        note = tags.translate_deferring(record.note, deferred)
+
+        if title == record.title and outline == record.outline and note == record.note:
+            return record
+
+        tmp = copy.copy(record)
+        tmp.title, tmp.outline, tmp.note = title, outline, note
+
+        return tmp
+
+
+# Private Functions
+_resolved = {}
+"""dict: story data resolved in this process by the id of the source."""
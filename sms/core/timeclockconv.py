@@ -4,14 +4,17 @@
 
 
 # My Modules
+from sms.core.passmanager import CodePass, PassManager
 from sms.objs.basecode import BaseCode
 from sms.objs.sceneinfo import SceneInfo
 from sms.syss import messages as msg
+from sms.utils import assertion
 from sms.utils.log import logger
 
 
 __all__ = (
         'apply_scene_time_to_clock',
+        'TimeClockPass',
         )
 
 
@@ -26,24 +29,28 @@ def apply_scene_time_to_clock(data: list, timeclocks: dict) -> list:
 
     logger.debug(msg.PROC_START.format(proc=PROC))
 
-    tmp = []
-
-    for record in data:
-        assert isinstance(record, BaseCode)
-        if isinstance(record, SceneInfo):
-            ret = Converter.time_to_clock_in_scene(record, timeclocks)
-            if ret:
-                tmp.append(ret)
-            else:
-                tmp.append(record)
-        else:
-            tmp.append(record)
+    tmp = PassManager([TimeClockPass(timeclocks)]).run(data)
 
     logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
 
     return tmp
 
 
+class TimeClockPass(CodePass):
+
+    name = 'time clock'
+
+    def __init__(self, timeclocks: dict):
+        self.timeclocks = assertion.is_dict(timeclocks)
+
+    def step(self, record: BaseCode) -> BaseCode:
+        if isinstance(record, SceneInfo):
+            ret = Converter.time_to_clock_in_scene(record, self.timeclocks)
+            if ret:
+                return ret
+        return record
+
+
 # Processes
 class Converter(object):
 
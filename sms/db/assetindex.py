@@ -0,0 +1,69 @@
+"""Define asset index."""
+
+# Official Libraries
+from typing import Any, Callable, Hashable
+
+
+# My Modules
+from sms.db.assets import AssetsDB
+from sms.objs.item import Item
+from sms.objs.nametag import NameTag, NameTagType
+from sms.objs.person import Person
+from sms.objs.rubi import RubiData
+from sms.objs.stage import Stage
+from sms.utils import assertion
+
+
+__all__ = (
+        'AssetIndex',
+        )
+
+
+# Main
+class AssetIndex(object):
+    """Assets indexed by the types in one scan of the assets db.
+
+    named keeps the objects with names in the order of the db, for the
+    tables where the later name wins. The tables made from the index are
+    kept by table_of, so they are shared and must not be changed.
+    """
+
+    def __init__(self, assets: AssetsDB):
+        self.assets = assertion.is_instance(assets, AssetsDB)
+        self.persons = {}
+        self.stages = {}
+        self.items = {}
+        self.nametags = {NameTagType.MOB: [], NameTagType.TIME: [], NameTagType.WORD: []}
+        self.named = []
+        self.rubi = None
+        self._tables = {}
+
+        for val in assets.data.values():
+            if isinstance(val, Person):
+                self.persons[val.tag] = val
+                self.named.append(val)
+            elif isinstance(val, Stage):
+                self.stages[val.tag] = val
+                self.named.append(val)
+            elif isinstance(val, Item):
+                self.items[val.tag] = val
+                self.named.append(val)
+            elif isinstance(val, NameTag):
+                if val.type in self.nametags:
+                    self.nametags[val.type].append(val)
+                    self.named.append(val)
+            elif isinstance(val, RubiData):
+                if self.rubi is None:
+                    self.rubi = val
+
+    def is_empty(self) -> bool:
+        return self.assets.is_empty()
+
+    def table_of(self, key: Hashable, maker: Callable[[], Any]) -> Any:
+        """Return the table of the key, made by maker at the first time."""
+        assert callable(maker)
+
+        if key not in self._tables:
+            self._tables[key] = maker()
+
+        return self._tables[key]
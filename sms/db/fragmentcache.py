@@ -0,0 +1,178 @@
+"""Define fragment cache db."""
+
+# Official Libraries
+import copy
+import hashlib
+import os
+import pickle
+from typing import Any, Callable
+
+
+# My Modules
+from sms import __version__
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.utils import assertion
+
+
+__all__ = (
+        'FragmentCache',
+        'digest_of',
+        'fragments_of',
+        )
+
+
+# Define Constants
+FRAGMENT_FORMAT = 3
+"""int: version of the fragment cache file layout."""
+
+TOP_LEVEL = 1
+"""int: depth of the scenes called from the entrypoint, rendered as a fragment."""
+
+
+# Main
+class FragmentCache(object):
+    """Rendered outputs of the top-level scenes, keyed by the digests of their inputs.
+
+    The renderer carries its state from a fragment to the next one, so the
+    state before a fragment is in its key and the state after it is cached
+    with the outputs.
+    """
+
+    def __init__(self, path: str):
+        self.path = assertion.is_str(path)
+        self.data = {}
+        self.rendered = 0
+        self.reused = 0
+        self._used = set()
+        self._stamp = None
+        self._is_dirty = False
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, 'rb') as file:
+                cached = pickle.load(file)
+        except Exception:
+            # NOTE: broken cache file only renders all fragments again
+            return False
+
+        if not isinstance(cached, dict) or cached.get('version') != (__version__, FRAGMENT_FORMAT):
+            return False
+
+        self.data = assertion.is_dict(cached['data'])
+        self._stamp = _stamp_of(self.path)
+
+        return True
+
+    def is_stale(self) -> bool:
+        """Return True if the file was saved by another process after loading."""
+        return os.path.exists(self.path) and _stamp_of(self.path) != self._stamp
+
+    def render_fragments(self, records: list, key: str, state: Any,
+            renderer: Callable[[list, Any], tuple]) -> list:
+        """Return the outputs of the fragments, rendering only the changed ones.
+
+        The renderer takes the records of a fragment and the state, and returns
+        the outputs and the state for the next fragment.
+        """
+        assert isinstance(records, list)
+        assert isinstance(key, str)
+        assert callable(renderer)
+
+        tmp = []
+        self.rendered = self.reused = 0
+
+        for fragment in fragments_of(records):
+            fragment_key = digest_of(key, state, fragment)
+            self._used.add(fragment_key)
+            entry = self.data.get(fragment_key)
+            if entry:
+                self.reused += 1
+            else:
+                # NOTE: the renderer changes its own copy, not the cached state
+                entry = renderer(fragment, copy.deepcopy(state))
+                self.data[fragment_key] = entry
+                self.rendered += 1
+                self._is_dirty = True
+            outputs, state = entry
+            tmp.append(outputs)
+
+        return tmp
+
+    def save(self) -> bool:
+        unused = [key for key in self.data.keys() if key not in self._used]
+        for key in unused:
+            del self.data[key]
+        # NOTE: the cache is kept for the next builds, which mark their own keys
+        self._used = set()
+
+        if not self._is_dirty and not unused:
+            return True
+
+        dirname = os.path.dirname(self.path)
+        tmp_path = f"{self.path}.tmp"
+
+        try:
+            if dirname and not os.path.exists(dirname):
+                os.makedirs(dirname)
+            with open(tmp_path, 'wb') as file:
+                pickle.dump({'version': (__version__, FRAGMENT_FORMAT), 'data': self.data},
+                        file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # NOTE: the build goes on without saving, and the cache is saved next time
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self._stamp = _stamp_of(self.path)
+        self._is_dirty = False
+
+        return True
+
+
+def digest_of(*values: Any) -> str:
+    """Return the digest of the pickled values, for the keys of the fragments."""
+    return hashlib.sha1(pickle.dumps(values, pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def fragments_of(records: list) -> list:
+    """Split the story records into the top-level scenes and the records between them."""
+    assert isinstance(records, list)
+
+    tmp = []
+    current = []
+    depth = 0
+
+    for record in records:
+        if isinstance(record, SceneInfo):
+            if depth == TOP_LEVEL and current:
+                tmp.append(current)
+                current = []
+            depth += 1
+            current.append(record)
+        elif isinstance(record, SceneEnd):
+            depth -= 1
+            current.append(record)
+            if depth == TOP_LEVEL:
+                tmp.append(current)
+                current = []
+        else:
+            current.append(record)
+
+    if current:
+        tmp.append(current)
+
+    return tmp
+
+
+# Private Functions
+def _stamp_of(path: str) -> tuple:
+    assert isinstance(path, str)
+
+    stat = os.stat(path)
+
+    return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,169 @@
+"""Define output manifest db."""
+
+# Official Libraries
+import hashlib
+import itertools
+import json
+import os
+from dataclasses import asdict, dataclass
+
+
+# My Modules
+from sms.utils import assertion
+from sms.utils.fileio import read_file, write_chunks_atomically
+
+
+__all__ = (
+        'OutputManifest',
+        )
+
+
+# Define Constants
+MANIFEST_FORMAT = 1
+"""int: version of the manifest file layout."""
+
+DEFAULT_ENCODING = 'utf-8'
+
+
+@dataclass
+class ManifestEntry(object):
+    digest: str
+    size: int
+    mtime: int
+
+
+# Main
+class OutputManifest(object):
+    """Digests of the output files, to write only the changed outputs.
+
+    The updates are kept until saving, and the ones made on the forked
+    workers are taken out there and added to the manifest of the main process.
+    """
+
+    def __init__(self, path: str):
+        self.path = assertion.is_str(path)
+        self.data = {}
+        self._updates = []
+        self._is_dirty = False
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            manifest = json.loads(read_file(self.path))
+            if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_FORMAT:
+                return False
+            data = {key: ManifestEntry(**val) for key, val in manifest['data'].items()}
+        except (ValueError, TypeError, KeyError):
+            # NOTE: broken manifest only rewrites all outputs
+            return False
+
+        self.data = data
+        return True
+
+    def write(self, path: str, *parts: list, encoding: str = DEFAULT_ENCODING) -> bool:
+        """Write the chunks of the parts unless the file is the same as written last time.
+
+        The chunks are read twice, to digest them and to write them, and are
+        never joined.
+        """
+        assert isinstance(path, str)
+        assert all(isinstance(part, list) for part in parts)
+
+        key = self._key_of(path)
+        digest = hashlib.sha1()
+        for chunk in itertools.chain.from_iterable(parts):
+            digest.update(chunk.encode(encoding))
+        digest = digest.hexdigest()
+        entry = self.data.get(key)
+
+        if entry and entry.digest == digest and _stamp_of(path) == (entry.size, entry.mtime):
+            self._updates.append((key, None))
+            return True
+
+        if not write_chunks_atomically(path, itertools.chain.from_iterable(parts), encoding):
+            return False
+
+        size, mtime = _stamp_of(path)
+        entry = ManifestEntry(digest, size, mtime)
+        self.data[key] = entry
+        self._updates.append((key, entry))
+        self._is_dirty = True
+
+        return True
+
+    def remove(self, path: str) -> bool:
+        assert isinstance(path, str)
+
+        if os.path.exists(path):
+            os.remove(path)
+        if self.data.pop(self._key_of(path), None):
+            self._is_dirty = True
+
+        return True
+
+    def updates_count(self) -> int:
+        return len(self._updates)
+
+    def updates_since(self, index: int) -> list:
+        """Take the updates from the index out, to return them from the workers."""
+        assert isinstance(index, int)
+
+        tmp = self._updates[index:]
+        del self._updates[index:]
+
+        return tmp
+
+    def add_updates(self, updates: list) -> bool:
+        assert isinstance(updates, list)
+
+        for key, entry in updates:
+            if entry:
+                self.data[key] = entry
+                self._is_dirty = True
+            self._updates.append((key, entry))
+
+        return True
+
+    def summary(self) -> tuple:
+        """Return the written and the skipped files since the last save."""
+        written = [key for key, entry in self._updates if entry]
+        skipped = [key for key, entry in self._updates if not entry]
+
+        return written, skipped
+
+    def save(self) -> bool:
+        if not self._is_dirty:
+            self._updates = []
+            return True
+
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        data = {key: asdict(entry) for key, entry in sorted(self.data.items())}
+        if not write_chunks_atomically(self.path,
+                [json.dumps({'version': MANIFEST_FORMAT, 'data': data}, indent=2)]):
+            return False
+
+        self._updates = []
+        self._is_dirty = False
+
+        return True
+
+    def _key_of(self, path: str) -> str:
+        assert isinstance(path, str)
+
+        return os.path.relpath(path, os.path.dirname(self.path) or os.curdir)
+
+
+# Private Functions
+def _stamp_of(path: str) -> tuple:
+    assert isinstance(path, str)
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
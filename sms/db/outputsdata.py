@@ -2,6 +2,8 @@
 
 # Official Libraries
 from __future__ import annotations
+import itertools
+from typing import Iterator
 
 
 # My Modules
@@ -15,25 +17,53 @@ __all__ = (
 
 # Main
 class OutputsData(object):
+    """Outputs kept as the segments of the chunk lists.
 
-    def __init__(self, data: list):
-        self.data = assertion.is_list(data)
+    The segments are shared by the cloned and the added outputs, so they are
+    not changed after adding. The chunks are joined only to serialize them.
+    """
+
+    def __init__(self, data: list, stats: list = None):
+        self.segments = [assertion.is_list(data)] if data else []
+        # NOTE: scene stats of the char counts, made by the builders
+        self.stats = assertion.is_list(stats) if stats is not None else None
 
     def cloned(self) -> OutputsData:
-        return OutputsData([d for d in self.data])
+        return self._with_segments(list(self.segments))
 
     def get_data(self) -> list:
-        return self.data
+        if len(self.segments) == 1:
+            return self.segments[0]
+        return list(self)
 
     def get_serialized_data(self) -> str:
-        return "".join(self.data)
+        return "".join(self)
 
     def is_empty(self) -> bool:
-        return True if not self.data else False
+        return not self.segments
 
     def __add__(self, another: OutputsData) -> OutputsData:
         assert isinstance(another, OutputsData)
 
-        self.data = self.data + another.data
+        return self._with_segments(self.segments + another.segments)
+
+    def __iadd__(self, another: OutputsData) -> OutputsData:
+        assert isinstance(another, OutputsData)
+
+        self.segments.extend(another.segments)
 
         return self
+
+    def __iter__(self) -> Iterator[str]:
+        return itertools.chain.from_iterable(self.segments)
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments)
+
+    def _with_segments(self, segments: list) -> OutputsData:
+        assert isinstance(segments, list)
+
+        tmp = OutputsData([], self.stats)
+        tmp.segments = segments
+
+        return tmp
@@ -0,0 +1,212 @@
+"""Define parse cache db."""
+
+# Official Libraries
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+# My Modules
+from sms import __version__
+from sms.utils import assertion
+from sms.utils.fileio import decoded_text
+
+
+__all__ = (
+        'ParseCache',
+        )
+
+
+# Define Constants
+CACHE_FORMAT = 2
+"""int: version of the cache file layout."""
+
+DEFAULT_ENCODING = 'utf-8'
+
+DIGEST_CHUNK_SIZE = 1 << 20
+"""int: bytes read at once to digest the files not read by the parser."""
+
+
+@dataclass
+class CacheEntry(object):
+    size: int
+    mtime: int
+    digest: str
+    value: Any
+
+
+# Main
+class ParseCache(object):
+
+    def __init__(self, path: str):
+        self.path = assertion.is_str(path)
+        self.data = {}
+        self._used = set()
+        self._is_dirty = False
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, 'rb') as file:
+                cached = pickle.load(file)
+        except Exception:
+            # NOTE: broken cache file is rebuilt transparently
+            return False
+
+        if not isinstance(cached, dict) or cached.get('version') != (__version__, CACHE_FORMAT):
+            return False
+
+        self.data = assertion.is_dict(cached['data'])
+        return True
+
+    def fetch(self, path: str, parser: Callable[[str], Any],
+            encoding: str = DEFAULT_ENCODING) -> Any:
+        assert isinstance(path, str)
+        assert callable(parser)
+
+        return self._fetch(path, lambda raw: parser(decoded_text(raw, encoding)), True)
+
+    def fetch_by_path(self, path: str, parser: Callable[[str], Any],
+            restamp: Callable[[Any, tuple], Any] = None) -> Any:
+        """Fetch the value parsed from the path, for the parser reading large files itself.
+
+        The restamp takes the cached value and the new size and mtime of the file
+        touched without changes, for the value checking the file by them.
+        """
+        assert isinstance(path, str)
+        assert callable(parser)
+        assert restamp is None or callable(restamp)
+
+        return self._fetch(path, lambda _: parser(path), False, restamp)
+
+    def fetch_all(self, paths: list, parser: Callable[[list], list],
+            encoding: str = DEFAULT_ENCODING) -> list:
+        """Fetch the values of the paths, parsing the missed ones at once.
+
+        The parser takes the texts of the missed files and returns their values
+        in the same order, so it can share the work among processes.
+        """
+        assert isinstance(paths, list)
+        assert callable(parser)
+
+        values = []
+        missed = []
+
+        for path in paths:
+            value, pending = self._lookup(path, True)
+            values.append(value)
+            if pending:
+                missed.append((len(values) - 1, path, pending))
+
+        parsed = parser([decoded_text(pending[2], encoding) for _, _, pending in missed])
+        assert len(parsed) == len(missed)
+
+        for (index, path, pending), value in zip(missed, parsed):
+            values[index] = self._store(path, pending, value)
+
+        return values
+
+    def _fetch(self, path: str, parser: Callable[[bytes], Any], is_read: bool,
+            restamp: Callable[[Any, tuple], Any] = None) -> Any:
+        assert isinstance(path, str)
+        assert callable(parser)
+        assert isinstance(is_read, bool)
+
+        value, pending = self._lookup(path, is_read, restamp)
+        if not pending:
+            return value
+
+        return self._store(path, pending, parser(pending[2]))
+
+    def _lookup(self, path: str, is_read: bool,
+            restamp: Callable[[Any, tuple], Any] = None) -> tuple:
+        """Return the cached value, or None and the stat, digest and raw data to store."""
+        assert isinstance(path, str)
+        assert isinstance(is_read, bool)
+
+        # NOTE: same size and mtime reuse the entry without reading the file
+        stat = os.stat(path)
+        self._used.add(path)
+        entry = self.data.get(path)
+
+        if entry and entry.size == stat.st_size and entry.mtime == stat.st_mtime_ns:
+            return entry.value, None
+
+        if is_read:
+            with open(path, 'rb') as file:
+                raw = file.read()
+            digest = hashlib.sha1(raw).hexdigest()
+        else:
+            raw = None
+            digest = _digest_of(path)
+
+        if entry and entry.digest == digest:
+            entry.size, entry.mtime = stat.st_size, stat.st_mtime_ns
+            if restamp:
+                entry.value = restamp(entry.value, (entry.size, entry.mtime))
+            self._is_dirty = True
+            return entry.value, None
+
+        return None, (stat, digest, raw)
+
+    def _store(self, path: str, pending: tuple, value: Any) -> Any:
+        assert isinstance(path, str)
+        assert isinstance(pending, tuple)
+
+        stat, digest, _ = pending
+
+        if value is None:
+            # NOTE: invalid data is parsed again to keep its warnings
+            self.data.pop(path, None)
+        else:
+            self.data[path] = CacheEntry(stat.st_size, stat.st_mtime_ns, digest, value)
+        self._is_dirty = True
+
+        return value
+
+    def save(self) -> bool:
+        unused = [path for path in self.data.keys() if path not in self._used]
+        for path in unused:
+            del self.data[path]
+        # NOTE: the cache is kept for the next builds, which mark their own paths
+        self._used = set()
+
+        if not self._is_dirty and not unused:
+            return True
+
+        dirname = os.path.dirname(self.path)
+        tmp_path = f"{self.path}.tmp"
+
+        try:
+            if dirname and not os.path.exists(dirname):
+                os.makedirs(dirname)
+            with open(tmp_path, 'wb') as file:
+                pickle.dump({'version': (__version__, CACHE_FORMAT), 'data': self.data},
+                        file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # NOTE: the build goes on without saving, and the cache is saved next time
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self._is_dirty = False
+
+        return True
+
+
+# Private Functions
+def _digest_of(path: str) -> str:
+    assert isinstance(path, str)
+
+    digest = hashlib.sha1()
+
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
@@ -0,0 +1,206 @@
+"""Define scene graph db."""
+
+# Official Libraries
+from __future__ import annotations
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+
+# My Modules
+from sms.db.storydata import StoryData
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.utils import assertion
+from sms.utils.fileio import read_file, write_chunks_atomically
+
+
+__all__ = (
+        'SceneGraph',
+        'SceneImpact',
+        'SceneNode',
+        )
+
+
+# Define Constants
+GRAPH_FORMAT = 1
+"""int: version of the graph file layout."""
+
+
+@dataclass
+class SceneNode(object):
+    tag: str
+    path: str
+    lines: tuple
+    digest: str
+    callees: list = field(default_factory=list)
+
+
+@dataclass
+class SceneImpact(object):
+    changed: list
+    """list: tags of the scenes added, edited or removed."""
+    affected: list
+    """list: tags of the changed scenes and their callers up to the entrypoint."""
+    ranges: list = field(default_factory=list)
+    """list: tag, start and end of the changed scenes expanded in the story data."""
+
+    def is_empty(self) -> bool:
+        return not self.changed and not self.affected
+
+
+# Main
+class SceneGraph(object):
+    """Calls among the scenes reachable from the entrypoint, with their sources.
+
+    The digests of the scene sources tell the changed scenes from the graph
+    of the last build, and the callers tell which of the expanded scenes
+    include them.
+    """
+
+    def __init__(self, entry: str = ''):
+        self.entry = assertion.is_str(entry)
+        self.nodes = {}
+
+    def add(self, node: SceneNode) -> bool:
+        assert isinstance(node, SceneNode)
+
+        self.nodes[node.tag] = node
+
+        return True
+
+    def is_empty(self) -> bool:
+        return not self.nodes
+
+    def callers_of(self, tag: str) -> list:
+        assert isinstance(tag, str)
+
+        return [node.tag for node in self.nodes.values() if tag in node.callees]
+
+    def tags_in(self, path: str) -> list:
+        assert isinstance(path, str)
+
+        return [node.tag for node in self.nodes.values() if node.path == path]
+
+    def entry_paths_of(self, tag: str) -> list:
+        """Return the call paths from the entrypoint to the scene."""
+        assert isinstance(tag, str)
+
+        if tag not in self.nodes or self.entry not in self.nodes:
+            return []
+
+        tmp = []
+        stack = [[self.entry]]
+
+        while stack:
+            path = stack.pop()
+            if path[-1] == tag:
+                tmp.append(path)
+                continue
+            for callee in reversed(self.nodes[path[-1]].callees):
+                if callee in self.nodes and callee not in path:
+                    stack.append(path + [callee])
+
+        return tmp
+
+    def impact_from(self, old: SceneGraph, codes: StoryData = None) -> SceneImpact:
+        """Return the scenes changed from the old graph, and their ranges in the codes."""
+        assert isinstance(old, SceneGraph)
+
+        if self.entry != old.entry:
+            changed = sorted(set(self.nodes.keys()) | set(old.nodes.keys()))
+        else:
+            changed = sorted(tag for tag in set(self.nodes.keys()) | set(old.nodes.keys())
+                    if tag not in self.nodes or tag not in old.nodes
+                    or self.nodes[tag].digest != old.nodes[tag].digest)
+
+        callers = self._callers_by_tag()
+        old_callers = old._callers_by_tag()
+
+        # NOTE: the callers of the removed scenes are found in the old graph
+        affected = set()
+        rests = [tag for tag in changed if tag in self.nodes]
+        for tag in changed:
+            if tag not in self.nodes:
+                rests.extend(caller for caller in old_callers.get(tag, []) if caller in self.nodes)
+
+        while rests:
+            current = rests.pop()
+            if current in affected:
+                continue
+            affected.add(current)
+            rests.extend(callers.get(current, []))
+
+        ranges = self.ranges_in(codes, changed) if codes else []
+
+        return SceneImpact(changed, sorted(affected), ranges)
+
+    def ranges_in(self, codes: StoryData, tags: list) -> list:
+        """Return the tag, start and end of the scenes expanded in the codes.
+
+        The end is the index after the scene end, and a scene called from
+        some places has a range for each of them.
+        """
+        assert isinstance(codes, StoryData)
+        assert isinstance(tags, list)
+
+        tmp = []
+        targets = set(tags)
+        starts = []
+
+        for index, record in enumerate(codes.get_data()):
+            if isinstance(record, SceneInfo):
+                starts.append((record.tag, index))
+            elif isinstance(record, SceneEnd) and starts:
+                tag, start = starts.pop()
+                if tag in targets:
+                    tmp.append((tag, start, index + 1))
+
+        return sorted(tmp, key=lambda x: x[1])
+
+    def load(self, path: str) -> bool:
+        assert isinstance(path, str)
+
+        if not os.path.exists(path):
+            return False
+
+        try:
+            graph = json.loads(read_file(path))
+            if not isinstance(graph, dict) or graph.get('version') != GRAPH_FORMAT:
+                return False
+            nodes = {}
+            for val in graph['nodes']:
+                val['lines'] = tuple(val['lines'])
+                nodes[val['tag']] = SceneNode(**val)
+        except (ValueError, TypeError, KeyError):
+            # NOTE: broken graph is made again as all scenes changed
+            return False
+
+        self.entry = assertion.is_str(graph['entry'])
+        self.nodes = nodes
+
+        return True
+
+    def save(self, path: str) -> bool:
+        assert isinstance(path, str)
+
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        data = {
+                'version': GRAPH_FORMAT,
+                'entry': self.entry,
+                'nodes': [asdict(node) for node in self.nodes.values()],
+                }
+
+        return write_chunks_atomically(path, [json.dumps(data, ensure_ascii=False, indent=1)])
+
+    def _callers_by_tag(self) -> dict:
+        tmp = {}
+
+        for node in self.nodes.values():
+            for callee in node.callees:
+                tmp.setdefault(callee, []).append(node.tag)
+
+        return tmp
@@ -1,14 +1,19 @@
 """Define scene codes db."""
 
 # Official Libraries
+from typing import Callable
 
 
 # My Modules
 from sms.db.base import BaseDB
+from sms.db.srcs import SrcsDB
+from sms.objs.rawsrc import RawSrc
 from sms.objs.scenecode import SceneCode
+from sms.utils import assertion
 
 
 __all__ = (
+        'LazyScenesDB',
         'ScenesDB',
         )
 
@@ -18,3 +23,62 @@ class ScenesDB(BaseDB):
 
     def __init__(self):
         super().__init__(SceneCode)
+
+
+class LazyScenesDB(ScenesDB):
+    """Scene codes db converting the sources on the first use.
+
+    converted keeps the pairs of source and scene code by tag over the dbs,
+    and the code is reused while the source is the same object.
+    """
+
+    def __init__(self, srcs: SrcsDB, converter: Callable[[RawSrc], SceneCode],
+            converted: dict = None):
+        super().__init__()
+        self.srcs = assertion.is_instance(srcs, SrcsDB)
+        self._converter = converter
+        self._converted = converted if converted is not None else {}
+        self._failed = set()
+
+    def get(self, key: str) -> SceneCode:
+        assert isinstance(key, str)
+
+        if key not in self.data:
+            self._convert(key)
+
+        return self.data[key]
+
+    def has(self, key: str) -> bool:
+        assert isinstance(key, str)
+
+        return key in self.data or self._convert(key)
+
+    def is_empty(self) -> bool:
+        return self.srcs.is_empty()
+
+    def unused_tags(self) -> list:
+        """Return the tags of the sources not used yet, in the order of sources."""
+        return [tag for tag in self.srcs.data.keys()
+                if tag not in self.data and tag not in self._failed]
+
+    def _convert(self, key: str) -> bool:
+        assert isinstance(key, str)
+
+        if key in self._failed or not self.srcs.has(key):
+            return False
+
+        src = self.srcs.get(key)
+        cached = self._converted.get(key)
+        if cached and cached[0] is src:
+            code = cached[1]
+        else:
+            code = self._converter(src)
+            self._converted[key] = (src, code)
+
+        if not code:
+            self._failed.add(key)
+            return False
+
+        self.add(code.tag, code)
+
+        return True
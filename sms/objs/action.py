@@ -18,6 +18,8 @@ __all__ = (
 # Main
 class Action(BaseCode):
 
+    __slots__ = ('type', 'subject', 'outline', 'descs', 'note')
+
     def __init__(self, type: ActType, subject: str, outline: str,
             descs: list = None, note: str = None):
         self.type = assertion.is_instance(type, ActType)
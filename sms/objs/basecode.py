@@ -13,4 +13,5 @@ __all__ = (
 
 # Main
 class BaseCode(object):
-    pass
+
+    __slots__ = ()
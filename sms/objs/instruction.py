@@ -19,6 +19,8 @@ __all__ = (
 # Main
 class Instruction(BaseCode):
 
+    __slots__ = ('type', 'args', 'note')
+
     def __init__(self, type: InstType, args: list = None, note: str = None):
         self.type = assertion.is_instance(type, InstType)
         self.args = assertion.is_list(args) if args else []
@@ -18,3 +18,6 @@ __all__ = (
 class RawSrc(object):
     tag: str
     data: list = field(default_factory=list)
+    path: str = ''
+    lines: tuple = (0, 0)
+    """tuple: first and last line numbers in the source file."""
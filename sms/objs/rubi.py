@@ -21,13 +21,6 @@ class Rubi(SObject):
         super().__init__(tag, name)
         self.exclusions = []
         self.is_always = False
-        self._done = False
-
-    def done(self):
-        self._done = True
-
-    def is_done(self) -> bool:
-        return self._done
 
 
 class RubiData(SObject):
@@ -16,5 +16,7 @@ __all__ = (
 # Main
 class SceneEnd(BaseCode):
 
+    __slots__ = ('tag',)
+
     def __init__(self, tag: str):
         self.tag = assertion.is_str(tag)
@@ -16,6 +16,9 @@ __all__ = (
 # Main
 class SceneInfo(BaseCode):
 
+    __slots__ = ('level', 'tag', 'title', 'camera', 'stage', 'location',
+            'year', 'date', 'time', 'clock', 'outline', 'flags', 'note')
+
     def __init__(self, level: int, tag: str,
             title: str,
             camera: str, stage: str, location: (int, str),
@@ -10,10 +10,18 @@ from sms import __project_path__
 
 
 # Main
+EXT_JSON = 'json'
+"""str: extention of json file."""
+
+
 EXT_MARKDOWN = 'md'
 """str: extention of markdown file."""
 
 
+EXT_PROFILE = 'prof'
+"""str: extention of cProfile stats file."""
+
+
 EXT_TEXT = 'txt'
 """str: extention of text file."""
 
@@ -0,0 +1,18 @@
+"""Define rubi scope type."""
+
+# Official Libraries
+from enum import Enum
+
+
+__all__ = (
+        'RubiScope',
+        )
+
+
+# Main
+class RubiScope(Enum):
+    NOVEL = 'novel'
+    CHAPTER = 'chapter'
+
+    def __str__(self) -> str:
+        return self.value
@@ -1,18 +1,71 @@
 """Count utility."""
 
 # Official Libraries
+from __future__ import annotations
 
 
 # My Modules
 
 
 __all__ = (
+        'CharStats',
         'count_lines_by_columns',
         'count_white_space',
         )
 
 
 # Main
+class CharStats(object):
+    """Char counts of a text, which are summed without the text.
+
+    The lengths of the lines are kept to count the lines by any columns
+    as the joined text.
+    """
+
+    __slots__ = ('chars', 'spaces', 'segments')
+
+    def __init__(self, chars: int = 0, spaces: int = 0, segments: tuple = (0,)):
+        self.chars = chars
+        self.spaces = spaces
+        self.segments = segments
+
+    @classmethod
+    def of(cls, text: str) -> CharStats:
+        assert isinstance(text, str)
+
+        return cls(len(text), count_white_space(text),
+                tuple(len(line) for line in text.split('\n')))
+
+    def lines_by_columns(self, columns: int) -> float:
+        assert isinstance(columns, int)
+
+        num = 0.0
+        for length in self.segments:
+            if length > columns:
+                num += length / columns
+            else:
+                num += 1
+        return num
+
+    def __add__(self, another: CharStats) -> CharStats:
+        assert isinstance(another, CharStats)
+
+        # NOTE: the last line continues to the first line of another
+        segments = self.segments[:-1] + (self.segments[-1] + another.segments[0],) \
+                + another.segments[1:]
+
+        return CharStats(self.chars + another.chars, self.spaces + another.spaces, segments)
+
+    def __eq__(self, another: object) -> bool:
+        if not isinstance(another, CharStats):
+            return NotImplemented
+        return (self.chars, self.spaces, self.segments) \
+                == (another.chars, another.spaces, another.segments)
+
+    def __repr__(self) -> str:
+        return f"CharStats({self.chars}, {self.spaces}, {self.segments})"
+
+
 def count_lines_by_columns(text: str, columns: int) -> int:
     assert isinstance(text, str)
     assert isinstance(columns, int)
@@ -5,9 +5,6 @@
 import datetime
 from typing import Union
 
-# Thirdparty Libraries
-from dateutil.relativedelta import relativedelta
-
 
 # My Modules
 
@@ -32,6 +29,9 @@ def after_day_str_from(year: INT_STR, mon: INT_STR, day: INT_STR,
     assert isinstance(aftermon, int)
     assert isinstance(afterday, int)
 
+    # NOTE: imported here not to load dateutil on startup
+    from dateutil.relativedelta import relativedelta
+
     basedate = datetime.date(int(year), int(mon), int(day))
     elapsed = basedate + relativedelta(months=aftermon, days=afterday)
 
@@ -1,10 +1,16 @@
 """Utility module for file IO."""
 
 # Official Libraries
+import io
+import os
+from typing import Iterable
 
 
 __all__ = (
+        'decoded_text',
         'read_file',
+        'write_chunks',
+        'write_chunks_atomically',
         'write_file',
         )
 
@@ -12,8 +18,19 @@ __all__ = (
 # Define Constants
 DEFAULT_ENCODING = 'utf-8'
 
+WRITE_BUFFER_SIZE = 1 << 16
+"""int: bytes buffered in writing the chunks to the file."""
+
 
 # Main
+def decoded_text(raw: bytes, encoding: str = DEFAULT_ENCODING) -> str:
+    assert isinstance(raw, bytes)
+    assert isinstance(encoding, str)
+
+    # NOTE: same newline handling as reading the file in text mode
+    return io.TextIOWrapper(io.BytesIO(raw), encoding=encoding).read()
+
+
 def read_file(fname: str, encoding: str = DEFAULT_ENCODING) -> str:
     assert isinstance(fname, str)
     assert isinstance(encoding, str)
@@ -36,3 +53,34 @@ def write_file(fname: str, contents: str,
         file.write(contents)
 
     return True
+
+
+def write_chunks(fname: str, chunks: Iterable[str],
+        encoding: str = DEFAULT_ENCODING) -> bool:
+    """Write the chunks in order through the bounded buffer, without joining them."""
+    assert isinstance(fname, str)
+    assert isinstance(encoding, str)
+
+    with open(fname, 'w', encoding=encoding, buffering=WRITE_BUFFER_SIZE) as file:
+        file.writelines(chunks)
+
+    return True
+
+
+def write_chunks_atomically(fname: str, chunks: Iterable[str],
+        encoding: str = DEFAULT_ENCODING) -> bool:
+    """Write the chunks to a temporary file and replace the file, not to leave it half written."""
+    assert isinstance(fname, str)
+    assert isinstance(encoding, str)
+
+    tmp_name = f"{fname}.tmp"
+
+    try:
+        write_chunks(tmp_name, chunks, encoding)
+        os.replace(tmp_name, fname)
+    except OSError:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        return False
+
+    return True
@@ -5,6 +5,8 @@ import logging
 import logging.handlers
 import os
 import sys
+from contextlib import contextmanager
+from typing import Iterator
 
 
 # Define Constants
@@ -72,3 +74,42 @@ def set_for_debug(is_detail: bool = False) -> bool:
     logger.debug(f"> Start Logging. set level: {logger.getEffectiveLevel()}.")
 
     return True
+
+
+@contextmanager
+def logs_kept() -> Iterator[list]:
+    """Keep the log records in the list instead of handling them.
+
+    The records are formatted to be sent from the worker processes, and
+    handled later by replay_logs.
+    """
+    handler = _KeepingHandler()
+    handlers = logger.handlers
+    logger.handlers = [handler]
+
+    try:
+        yield handler.records
+    finally:
+        logger.handlers = handlers
+
+
+def replay_logs(records: list) -> bool:
+    assert isinstance(records, list)
+
+    for record in records:
+        logger.handle(record)
+
+    return True
+
+
+class _KeepingHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
@@ -0,0 +1,69 @@
+"""Utility module for process pool."""
+
+# Official Libraries
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator
+
+
+__all__ = (
+        'imap_forked',
+        'jobs_count_of',
+        )
+
+
+# Define Constants
+START_METHOD = 'fork'
+"""str: start method to share data with workers without pickling."""
+
+
+_shared = None
+"""Any: shared data inherited by the forked workers."""
+
+
+# Main
+def imap_forked(func: Callable[[Any, Any], Any], items: list, shared: Any,
+        jobs: int = 1) -> Iterator[Any]:
+    """Yield func(shared, item) for each item in the order of items.
+
+    The shared data is not pickled, the forked workers inherit it. Without
+    fork or with one job, items are run lazily in this process.
+    """
+    assert callable(func)
+    assert isinstance(items, list)
+    assert isinstance(jobs, int)
+
+    if jobs <= 1 or len(items) <= 1 or not _can_fork():
+        for item in items:
+            yield func(shared, item)
+        return
+
+    global _shared
+    _shared = shared
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(items)),
+                mp_context=multiprocessing.get_context(START_METHOD)) as executor:
+            futures = [executor.submit(_call_with_shared, func, item) for item in items]
+            for future in futures:
+                yield future.result()
+    finally:
+        _shared = None
+
+
+def jobs_count_of(jobs: int) -> int:
+    assert isinstance(jobs, int)
+
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+# Private Functions
+def _call_with_shared(func: Callable[[Any, Any], Any], item: Any) -> Any:
+    return func(_shared, item)
+
+
+def _can_fork() -> bool:
+    return START_METHOD in multiprocessing.get_all_start_methods()
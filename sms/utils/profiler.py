@@ -0,0 +1,274 @@
+"""Utility module for profiling the build stages."""
+
+# Official Libraries
+import cProfile
+import json
+import marshal
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+
+__all__ = (
+        'StageRecord',
+        'add_records',
+        'disable_profiling',
+        'dump_stats',
+        'enable_profiling',
+        'is_profiling',
+        'json_of',
+        'markdown_of',
+        'profiled',
+        'record_stage',
+        'records_count',
+        'records_since',
+        'slowest_of',
+        )
+
+
+# Define Constants
+_is_enabled = False
+"""bool: profile the stages or not."""
+
+_is_cprofile = False
+"""bool: run cProfile on the top level stages or not."""
+
+_is_memory = False
+"""bool: trace the memory of the stages or not, which slows down the stages."""
+
+_records = []
+"""list: stage records in the order of starting."""
+
+_stack = []
+"""list: running stages as [record, start memory, peak memory]."""
+
+
+@dataclass
+class StageRecord(object):
+    name: str
+    group: str
+    depth: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    records: int = 0
+    memory: int = None
+    peak: int = None
+    stats: dict = None
+
+    def to_dict(self) -> dict:
+        return {
+                'name': self.name,
+                'group': self.group,
+                'depth': self.depth,
+                'wall': self.wall,
+                'cpu': self.cpu,
+                'records': self.records,
+                'memory': self.memory,
+                'peak': self.peak,
+                }
+
+
+# Main
+def enable_profiling(is_cprofile: bool = False, is_memory: bool = False) -> bool:
+    assert isinstance(is_cprofile, bool)
+    assert isinstance(is_memory, bool)
+
+    global _is_enabled, _is_cprofile, _is_memory
+    _is_enabled = True
+    _is_cprofile = is_cprofile
+    _is_memory = is_memory
+    _records.clear()
+    _stack.clear()
+
+    if is_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    return True
+
+
+def disable_profiling() -> list:
+    """Stop profiling and return the stage records."""
+    global _is_enabled, _is_memory
+    _is_enabled = False
+
+    if _is_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _is_memory = False
+
+    tmp = list(_records)
+    _records.clear()
+    _stack.clear()
+
+    return tmp
+
+
+def is_profiling() -> bool:
+    return _is_enabled
+
+
+@contextmanager
+def profiled(name: str, group: str = '') -> Iterator[StageRecord]:
+    """Measure the wall and CPU time and the traced memory of the stage.
+
+    Set the number of processed records to the yielded record. Without
+    profiling, the record is a dummy one and nothing is measured, and the
+    memory is measured only when it is traced.
+    """
+    assert isinstance(name, str)
+    assert isinstance(group, str)
+
+    record = StageRecord(name, group, len(_stack))
+    if not _is_enabled:
+        yield record
+        return
+
+    _records.append(record)
+    profile = cProfile.Profile() if _is_cprofile and not _stack else None
+
+    current = 0
+    if _is_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            _stack[-1][2] = max(_stack[-1][2], peak)
+        _reset_peak()
+    frame = [record, current, current]
+    _stack.append(frame)
+
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    if profile:
+        profile.enable()
+    try:
+        yield record
+    finally:
+        if profile:
+            profile.disable()
+        record.wall = time.perf_counter() - wall
+        record.cpu = time.process_time() - cpu
+
+        _stack.pop()
+        if _is_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame[2])
+            record.memory = current - frame[1]
+            if _can_reset_peak():
+                record.peak = peak - frame[1]
+            if _stack:
+                _stack[-1][2] = max(_stack[-1][2], peak)
+
+        if profile:
+            profile.create_stats()
+            record.stats = profile.stats
+
+
+def record_stage(name: str, group: str, wall: float, cpu: float, records: int) -> StageRecord:
+    """Add a stage measured by the caller, without the memory."""
+    assert isinstance(name, str)
+    assert isinstance(group, str)
+
+    record = StageRecord(name, group, len(_stack), wall, cpu, records)
+    if _is_enabled:
+        _records.append(record)
+
+    return record
+
+
+def records_since(index: int) -> list:
+    """Take the records from the index out, to return them from the workers."""
+    assert isinstance(index, int)
+
+    tmp = _records[index:]
+    del _records[index:]
+
+    return tmp
+
+
+def add_records(records: list) -> bool:
+    assert isinstance(records, list)
+
+    if _is_enabled:
+        _records.extend(records)
+
+    return True
+
+
+def records_count() -> int:
+    return len(_records)
+
+
+def slowest_of(records: list) -> StageRecord:
+    """Return the slowest stage which has the cProfile stats."""
+    assert isinstance(records, list)
+
+    profiled_records = [record for record in records if record.stats]
+    if not profiled_records:
+        return None
+
+    return max(profiled_records, key=lambda x: x.wall)
+
+
+def dump_stats(fname: str, record: StageRecord) -> bool:
+    """Write the cProfile stats in the format read by pstats."""
+    assert isinstance(fname, str)
+    assert isinstance(record, StageRecord)
+
+    with open(fname, 'wb') as file:
+        marshal.dump(record.stats, file)
+
+    return True
+
+
+def json_of(records: list) -> str:
+    assert isinstance(records, list)
+
+    return json.dumps({
+        'total': {
+            'wall': sum(record.wall for record in records if not record.depth),
+            'cpu': sum(record.cpu for record in records if not record.depth),
+            },
+        'stages': [record.to_dict() for record in records],
+        }, indent=2, ensure_ascii=False) + '\n'
+
+
+def markdown_of(records: list) -> str:
+    assert isinstance(records, list)
+
+    tops = [record for record in records if not record.depth]
+    total = sum(record.wall for record in tops)
+    tmp = ['PROFILE\n===\n\n',
+            f"- total of stages: {total:.3f}s wall, {sum(record.cpu for record in tops):.3f}s cpu\n",
+            ]
+
+    slowest = max(tops, key=lambda x: x.wall) if tops else None
+    if slowest:
+        tmp.append(f"- slowest: {slowest.name} ({slowest.wall:.3f}s)\n")
+
+    tmp.append('\n| stage | group | wall (s) | % | cpu (s) | records | memory (KiB) | peak (KiB) |\n')
+    tmp.append('| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |\n')
+
+    for record in records:
+        name = '　' * record.depth + record.name
+        rate = record.wall / total * 100 if total else 0
+        tmp.append(f"| {name} | {record.group} | {record.wall:.3f} | {rate:.1f} | {record.cpu:.3f}"
+                f" | {record.records} | {_kib_of(record.memory)} | {_kib_of(record.peak)} |\n")
+
+    return ''.join(tmp)
+
+
+# Private Functions
+def _can_reset_peak() -> bool:
+    # NOTE: tracemalloc.reset_peak is from Python 3.9
+    return hasattr(tracemalloc, 'reset_peak')
+
+
+def _kib_of(size: int) -> str:
+    if size is None:
+        return '-'
+    return f"{size / 1024:.1f}"
+
+
+def _reset_peak() -> None:
+    if _can_reset_peak():
+        tracemalloc.reset_peak()
@@ -0,0 +1,28 @@
+"""Utility module for slotted classes."""
+
+# Official Libraries
+import dataclasses
+from typing import T
+
+
+__all__ = (
+        'slotted',
+        )
+
+
+# Main
+def slotted(cls: T) -> T:
+    """Remake a dataclass with __slots__ of its fields.
+
+    Put it above @dataclass. The defaults are kept in the generated __init__.
+    """
+    assert dataclasses.is_dataclass(cls)
+
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    attrs = dict(cls.__dict__)
+
+    for name in names + ('__dict__', '__weakref__'):
+        attrs.pop(name, None)
+    attrs['__slots__'] = names
+
+    return type(cls)(cls.__name__, cls.__bases__, attrs)
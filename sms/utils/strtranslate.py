@@ -1,67 +1,166 @@
 """String translate utility."""
 
 # Official Libraries
+from __future__ import annotations
 import re
+from typing import Union
 
 
 __all__ = (
+        'TagTranslator',
         'translate_tags_str',
         'translate_tags_text_list',
         )
 
 
 # Main
-def translate_tags_str(text: str, tags: dict, is_fullmatch: bool = False,
-        prefix: str = '$') -> str:
-    assert isinstance(text, str)
-    assert isinstance(tags, dict)
-    assert isinstance(is_fullmatch, bool)
-
-    if prefix:
+class TagTranslator(object):
+    """Compiled tag table to translate tags in one scan of each text.
+
+    When several tags match at the same place, the one placed earlier in the
+    table wins, as it did with the per-tag replacement. So a reverse sorted
+    table gives the longest match.
+    """
+
+    def __init__(self, tags: dict):
+        assert isinstance(tags, dict)
+
+        self.tags = tags
+        self._ranks = {key: i for i, key in enumerate(tags.keys())}
+        self._lengths = sorted(set(len(key) for key in tags.keys()), reverse=True)
+        self._pattern = None
+
+    def translate(self, text: str, is_fullmatch: bool = False,
+            prefix: str = '$') -> str:
+        assert isinstance(text, str)
+        assert isinstance(is_fullmatch, bool)
+
+        if not self.tags:
+            return text
+
+        if prefix:
+            assert isinstance(prefix, str)
+            if is_fullmatch:
+                if text.startswith(prefix) and text[len(prefix):] in self.tags:
+                    return self.tags[text[len(prefix):]]
+                return text
+            return self._translate_with_prefix(text, prefix)
+        else:
+            if is_fullmatch:
+                return self.tags[text] if text in self.tags else text
+            return self._translate_without_prefix(text)
+
+    def translate_deferring(self, text: str, deferred: TagTranslator, prefix: str = '$') -> str:
+        """Translate the tags with the prefix, except the ones the deferred table matches.
+
+        The deferred tags are left as they are, to be translated with the other
+        table first.
+        """
+        assert isinstance(text, str)
+        assert isinstance(deferred, TagTranslator)
         assert isinstance(prefix, str)
-        return _conv_text_by_tag_with_prefix(text, tags, is_fullmatch, prefix)
-    else:
-        return _conv_text_by_tag(text, tags, is_fullmatch)
 
+        if not self.tags:
+            return text
 
-def translate_tags_text_list(textlist: list, tags: dict) -> list:
-    assert isinstance(textlist, list)
-    assert isinstance(tags, dict)
+        return self._translate_with_prefix(text, prefix, deferred)
 
-    tmp = []
+    def translate_list(self, textlist: list, prefix: str = '$') -> list:
+        assert isinstance(textlist, list)
 
-    for line in textlist:
-        assert isinstance(line, str)
-        tmp.append(_conv_text_by_tag_with_prefix(line, tags))
+        return [self.translate(line, False, prefix) for line in textlist]
 
-    return tmp
+    def __reduce__(self) -> tuple:
+        # NOTE: pickled as the table, so the digests do not depend on the compiled state
+        return (TagTranslator, (self.tags,))
 
+    def __contains__(self, key: str) -> bool:
+        return key in self.tags
 
-# Private Functions
-def _conv_text_by_tag(text: str, tags: dict, is_fullmatch: bool = False) -> str:
-    assert isinstance(text, str)
-    assert isinstance(tags, dict)
-    assert isinstance(is_fullmatch, bool)
+    def __getitem__(self, key: str) -> str:
+        return self.tags[key]
 
-    tmp = text
+    def keys(self):
+        return self.tags.keys()
 
-    for key, val in tags.items():
-        if is_fullmatch and key == tmp or not is_fullmatch and key in tmp:
-            tmp = re.sub(r'{}'.format(key), val, tmp)
-    return tmp
+    def _match_at(self, text: str, pos: int) -> str:
+        found = None
+        rank = -1
+
+        for length in self._lengths:
+            key = text[pos:pos + length]
+            if len(key) == length and key in self._ranks:
+                if found is None or self._ranks[key] < rank:
+                    found = key
+                    rank = self._ranks[key]
+        return found
+
+    def _translate_with_prefix(self, text: str, prefix: str,
+            deferred: TagTranslator = None) -> str:
+        idx = text.find(prefix)
+        if idx < 0:
+            return text
+
+        tmp = []
+        start = 0
+        size = len(prefix)
+
+        while idx >= 0:
+            if deferred and deferred._match_at(text, idx + size) is not None:
+                idx = text.find(prefix, idx + 1)
+                continue
+            key = self._match_at(text, idx + size)
+            if key is None:
+                idx = text.find(prefix, idx + 1)
+                continue
+            tmp.append(text[start:idx])
+            tmp.append(self.tags[key])
+            start = idx + size + len(key)
+            idx = text.find(prefix, start)
+
+        if not tmp:
+            return text
 
+        tmp.append(text[start:])
+        return "".join(tmp)
 
-def _conv_text_by_tag_with_prefix(text: str, tags: dict, is_fullmatch: bool = False, prefix: str = '$') -> str:
+    def _translate_without_prefix(self, text: str) -> str:
+        if not self._pattern:
+            self._pattern = re.compile('|'.join(re.escape(key) for key in self.tags.keys()))
+
+        return self._pattern.sub(lambda m: self.tags[m.group(0)], text)
+
+
+TAGS = Union[dict, TagTranslator]
+
+
+def translate_tags_str(text: str, tags: TAGS, is_fullmatch: bool = False,
+        prefix: str = '$') -> str:
     assert isinstance(text, str)
-    assert isinstance(tags, dict)
+    assert isinstance(tags, (dict, TagTranslator))
     assert isinstance(is_fullmatch, bool)
-    assert isinstance(prefix, str)
 
-    tmp = text
+    return _translator_of(tags).translate(text, is_fullmatch, prefix)
+
+
+def translate_tags_text_list(textlist: list, tags: TAGS) -> list:
+    assert isinstance(textlist, list)
+    assert isinstance(tags, (dict, TagTranslator))
+
+    translator = _translator_of(tags)
+    tmp = []
+
+    # NOTE: most lines have no tags after the story data is resolved
+    for line in textlist:
+        assert isinstance(line, str)
+        tmp.append(translator.translate(line) if '$' in line else line)
 
-    for key, val in tags.items():
-        if prefix in tmp:
-            tag_key = f"{prefix}{key}"
-            if is_fullmatch and tag_key == tmp or not is_fullmatch and tag_key in tmp:
-                tmp = re.sub(r'\{}'.format(tag_key), val, tmp)
     return tmp
+
+
+# Private Functions
+def _translator_of(tags: TAGS) -> TagTranslator:
+    if isinstance(tags, TagTranslator):
+        return tags
+    else:
+        return TagTranslator(tags)
@@ -0,0 +1,22 @@
+"""Utility module for yaml."""
+
+# Official Libraries
+import yaml
+from typing import Any
+
+
+__all__ = (
+        'yaml_data_from',
+        )
+
+
+# Define Constants
+SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+"""type: safe loader backed by libyaml if it is built, or the pure python one."""
+
+
+# Main
+def yaml_data_from(data: str) -> Any:
+    assert isinstance(data, str)
+
+    return yaml.load(data, Loader=SAFE_LOADER)
@@ -0,0 +1,13 @@
+"""Shared setup for tests."""
+
+# Official Libraries
+import tempfile
+
+
+# My Modules
+from sms import __app_name__
+from sms.utils.log import init_logger
+
+
+# NOTE: modules bind the logger on import, so it is made before collecting tests
+init_logger(__app_name__, tempfile.mkdtemp())
@@ -0,0 +1,32 @@
+"""Test for lazy imports on startup."""
+
+# Official Libraries
+import os
+import subprocess
+import sys
+import pytest
+
+
+# Define Constants
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modules_after_import(module: str) -> list:
+    code = f"import sys; import {module}; print('\\n'.join(sorted(sys.modules)))"
+    ret = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+            stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    return ret.stdout.split()
+
+
+# test "import"
+@pytest.mark.parametrize(
+        ['module', 'unexpected'],
+        [
+            ['sms.application', ('sms.cmds.builder', 'sms.core', 'yaml', 'dateutil')],
+            ['sms.cmds.builder', ('sms.core.novelbuilder', 'sms.core.rubiapplyer', 'dateutil')],
+            ])
+def test_import_is_lazy(module, unexpected):
+
+    loaded = _modules_after_import(module)
+
+    assert [name for name in loaded if name.startswith(unexpected)] == []
@@ -0,0 +1,52 @@
+"""Test for builder."""
+
+# Official Libraries
+import pytest
+
+
+# My Modules
+from sms.cmds import builder
+from sms.cmds.builder import BuildData, BuildFailure
+from sms.db.outputsdata import OutputsData
+from sms.db.storydata import StoryData
+from sms.types.build import BuildType
+from sms.types.rubi import RubiScope
+from sms.utils import pools
+
+
+# Define Constants
+TYPES = [BuildType.OUTLINE, BuildType.PLOT, BuildType.STRUCT, BuildType.SCRIPT,
+        BuildType.NOVEL, BuildType.INFO]
+
+FAILURES = {
+        BuildType.STRUCT: BuildFailure.CANNOT_WRITE,
+        BuildType.NOVEL: BuildFailure.MISSING,
+        }
+
+
+def _build_and_write(data: BuildData, type: BuildType) -> tuple:
+    if type in FAILURES:
+        return None, FAILURES[type]
+    return OutputsData([type.name]), None
+
+
+# test "_build_and_output"
+@pytest.mark.skipif(not pools._can_fork(), reason='no fork start method')
+def test_build_and_output__same_failures_in_pool(monkeypatch):
+
+    monkeypatch.setattr(builder, '_build_and_write', _build_and_write)
+    monkeypatch.setattr(builder, '_manifests', {})
+    data = BuildData(StoryData([]), StoryData([]), {}, {}, OutputsData([]), False, False,
+            None, RubiScope.NOVEL, False)
+
+    def _results(jobs: int) -> list:
+        return [(outputs.get_data() if outputs else None, failure)
+                for outputs, failure, _, _ in pools.imap_forked(builder._build_and_output,
+                    TYPES, data, jobs)]
+
+    serial = _results(1)
+
+    assert _results(4) == serial
+    assert [failure for _, failure in serial if failure] == [
+            BuildFailure.CANNOT_WRITE, BuildFailure.MISSING]
+    assert serial[0] == (['OUTLINE'], None)
@@ -0,0 +1,82 @@
+"""Test for watcher."""
+
+# Official Libraries
+import logging
+from argparse import Namespace
+
+
+# My Modules
+from sms.cmds import watcher
+from sms.utils import log
+
+
+# Define Constants
+def _stamps_in_turn(monkeypatch, stamps: list) -> list:
+    """Make the project stamps in turn, and stop watching after the last ones."""
+    calls = []
+
+    def _stamps():
+        calls.append(len(calls))
+        if len(calls) > len(stamps):
+            raise KeyboardInterrupt
+        return stamps[len(calls) - 1]
+
+    monkeypatch.setattr(watcher, '_stamps_of_project', _stamps)
+    monkeypatch.setattr(watcher.time, 'sleep', lambda _: None)
+
+    return calls
+
+
+# test "_changed_paths"
+def test_changed_paths():
+
+    old = {'a.md': (1, 1), 'b.md': (2, 2), 'c.md': (3, 3)}
+    new = {'a.md': (1, 1), 'b.md': (2, 5), 'd.md': (4, 4)}
+
+    assert watcher._changed_paths(old, new) == ['b.md', 'c.md', 'd.md']
+    assert watcher._changed_paths(old, dict(old)) == []
+
+
+# test "_stamps_debounced"
+def test_stamps_debounced__waits_until_unchanged(monkeypatch):
+
+    first = {'a.md': (1, 1)}
+    second = {'a.md': (2, 2)}
+    calls = _stamps_in_turn(monkeypatch, [second, second])
+
+    assert watcher._stamps_debounced(first) == second
+    assert len(calls) == 2
+
+
+def test_stamps_debounced__unchanged(monkeypatch):
+
+    stamps = {'a.md': (1, 1)}
+    calls = _stamps_in_turn(monkeypatch, [dict(stamps)])
+
+    assert watcher._stamps_debounced(stamps) == stamps
+    assert len(calls) == 1
+
+
+# test "watch_project"
+def test_watch_project__keeps_watching_after_error(monkeypatch, tmp_path, caplog):
+
+    first = {'a.md': (1, 1)}
+    cyclic = {'a.md': (2, 2)}
+    fixed = {'a.md': (3, 3)}
+    _stamps_in_turn(monkeypatch, [first, first, cyclic, cyclic, fixed, fixed])
+    monkeypatch.setattr(watcher, 'DIR_PROJECT', str(tmp_path))
+    rebuilt = []
+
+    def _rebuild(args, state, changed):
+        rebuilt.append(changed)
+        if len(rebuilt) == 2:
+            raise ValueError('invalid cyclic calling', ['main', 'main'])
+        return True
+
+    monkeypatch.setattr(watcher.Rebuilder, 'rebuild', _rebuild)
+
+    with caplog.at_level(logging.ERROR, logger=log.logger.name):
+        assert watcher.watch_project(Namespace())
+
+    assert rebuilt == [['a.md'], ['a.md'], ['a.md']]
+    assert any('invalid cyclic calling' in r.getMessage() for r in caplog.records)
@@ -0,0 +1,21 @@
+"""Test for path manager."""
+
+# Official Libraries
+import os
+
+
+# My Modules
+from sms.commons.pathmanager import PathManager
+from sms.syss.paths import DIR_PROJECT
+
+
+# test "PathManager.set_project_dirs"
+def test_PathManager_set_project_dirs(monkeypatch):
+
+    monkeypatch.setattr(PathManager, 'asset_dir', PathManager.asset_dir)
+    monkeypatch.setattr(PathManager, 'src_dir', PathManager.src_dir)
+
+    PathManager.set_project_dirs('data', 'story')
+
+    assert PathManager.get_asset_dir_path() == os.path.join(DIR_PROJECT, 'data')
+    assert PathManager.get_src_dir_path() == os.path.join(DIR_PROJECT, 'story')
@@ -0,0 +1,44 @@
+"""Test for project config."""
+
+# Official Libraries
+import os
+
+
+# My Modules
+from sms.commons.projectconfig import ProjectConfig, get_project_config
+from sms.types.rubi import RubiScope
+
+
+# test "get_project_config"
+def test_get_project_config(tmp_path):
+
+    path = tmp_path / 'config.yml'
+    path.write_text('#!SMSdata\nconfig:\n  entrypoint: top\n  columns: 40\n', encoding='utf-8')
+
+    config = get_project_config(str(path))
+
+    assert config == ProjectConfig('top', 40, 20, 20)
+    assert get_project_config(str(path)) is config
+
+    path.write_text('#!SMSdata\nconfig:\n  entrypoint: top\n  mobs: 3\n', encoding='utf-8')
+    os.utime(str(path), ns=(0, 0))
+
+    assert get_project_config(str(path)) == ProjectConfig('top', mobs=3)
+
+
+def test_get_project_config__invalid(tmp_path):
+
+    path = tmp_path / 'config.yml'
+    path.write_text('#!SMSdata\n', encoding='utf-8')
+
+    assert get_project_config(str(path)) is None
+    assert get_project_config(str(tmp_path / 'missing.yml')) is None
+
+
+def test_get_project_config__rubi_scope(tmp_path):
+
+    path = tmp_path / 'config.yml'
+    path.write_text('#!SMSdata\nconfig:\n  rubi: chapter\n', encoding='utf-8')
+
+    assert get_project_config(str(path)).rubi is RubiScope.CHAPTER
+    assert ProjectConfig().rubi is RubiScope.NOVEL
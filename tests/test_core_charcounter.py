@@ -0,0 +1,177 @@
+"""Test for char counter."""
+
+# Official Libraries
+import pytest
+
+
+# My Modules
+from sms.core.charcounter import CharCounter, CountRecord, StatsRecorder, scene_stats_from
+from sms.core.novelbuilder import build_novel
+from sms.core.outlinebuilder import build_outline
+from sms.core.plotbuilder import build_plot
+from sms.core.scriptbuilder import build_script
+from sms.core.structbuilder import build_struct
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+from sms.types.build import BuildType
+from sms.utils.counts import CharStats, count_lines_by_columns, count_white_space
+
+
+# Define Constants
+def _info(level: int, tag: str, title: str, outline: str) -> SceneInfo:
+    return SceneInfo(level, tag, title, 'taro', 'room', 'INT', '-', '-', 'noon', '12:00',
+            outline, [], '')
+
+
+STORY = StoryData([
+        _info(0, 'main', '長編', 'main outline'),
+        _info(1, 'ch1', '第一章', 'first chapter'),
+        Action(ActType.PLOT, 'taro', 'start', ['$taroが旅に出る']),
+        _info(2, 'memory', '回想', 'old days'),
+        Action(ActType.BE, 'taro', '', ['$taroがいる']),
+        Action(ActType.TALK, 'taro', '', ['こんにちは', 'また明日']),
+        SceneEnd('memory'),
+        Action(ActType.DO, 'taro', '', ['2.5秒待つ']),
+        Action(ActType.NOTE, 'taro', '', ['memo']),
+        Action(ActType.COME, 'taro', '', ['戻ってきた']),
+        SceneEnd('ch1'),
+        _info(1, 'ch2', '第二章', 'second'),
+        Action(ActType.VOICE, 'taro', '', ['声だけ']),
+        Action(ActType.THINK, 'taro', '', ['考える']),
+        SceneEnd('ch2'),
+        SceneEnd('main'),
+        ])
+
+
+# test "CharStats"
+@pytest.mark.parametrize('first, second', [
+        ('', ''),
+        ('abc', 'de f'),
+        ('ab\ncd', 'ef'),
+        ('ab', 'c\nd\ne'),
+        ('long line here\n', '\nnext　line'),
+        ])
+def test_charstats__add(first, second):
+
+    text = first + second
+    stats = CharStats.of(first) + CharStats.of(second)
+
+    assert stats == CharStats.of(text)
+    assert stats.chars == len(text)
+    assert stats.spaces == count_white_space(text)
+    assert stats.lines_by_columns(4) == count_lines_by_columns(text, 4)
+
+
+# test "scene_stats_from"
+def test_scene_stats_from__text_until_next_head_of_level():
+
+    lines = ['# 1. part', '\n', 'intro\n',
+            '## 1. scene a', '\n', '　', 'text a\n', '<!-- note -->',
+            '## 2. scene b', '\n', 'in 2.5 sec\n', '\n',
+            'after b\n',
+            '# 2. next', '\n', 'last\n']
+    recorder = StatsRecorder(BuildType.NOVEL)
+    recorder.head(1, 0)
+    recorder.texts(1, 3)
+    recorder.head(2, 3)
+    recorder.texts(4, 8)
+    recorder.head(2, 8)
+    recorder.texts(9, 13)
+    recorder.head(1, 13)
+    recorder.texts(14, 16)
+
+    stats = scene_stats_from(recorder.marks_of(lines))
+
+    assert [(r.level, r.title, r.stats.chars, r.stats.spaces) for r in stats] == [
+            (1, '1. part', 19, 3),
+            (2, '1. scene a', 7, 2),
+            (2, '2. scene b', 11, 1),
+            (1, '2. next', 4, 0),
+            ]
+    assert stats[0].stats == CharStats.of('intro　text aafter b')
+    assert stats[2].stats == CharStats.of('after blast')
+
+
+def test_scene_stats_from__ended_scene():
+
+    lines = ['1. main\n', 'main text', '\n\n', '----', '1. ch1\n', 'ch1 text']
+    recorder = StatsRecorder(BuildType.OUTLINE)
+    recorder.head(0, 0)
+    recorder.texts(1, 2)
+    recorder.end()
+    recorder.head(1, 4)
+    recorder.texts(5, 6)
+    recorder.end()
+
+    stats = scene_stats_from(recorder.marks_of(lines))
+
+    assert [(r.level, r.title, r.stats.chars) for r in stats] == [
+            (0, '1. main', 9), (1, '1. ch1', 8)]
+
+
+# test "counts_data_from"
+def test_counts_data_from__novel():
+
+    story = StoryData([
+            SceneInfo(0, 'main', '長編', 'taro', '', '', '', '', '', '', '', [], ''),
+            SceneInfo(1, 'ch1', '第一章', 'taro', '', '', '', '', '', '', '', [], ''),
+            Action(ActType.BE, 'taro', '', ['$taroがいる']),
+            SceneEnd('ch1'),
+            Action(ActType.BE, 'taro', '', ['終わり']),
+            SceneEnd('main'),
+            ])
+    outputs = build_novel(story, {'taro': '太郎'}, {}, False)
+
+    counts = CharCounter.counts_data_from(BuildType.NOVEL, outputs.stats, 20, 20)
+
+    assert [(r.level, r.title, r.total, r.space) for r in counts] == [
+            (1, '1. 長編', 12, 2),
+            (2, '1. 第一章', 12, 2),
+            ]
+
+
+def test_counts_data_from__outline():
+
+    story = StoryData([
+            SceneInfo(0, 'main', 'main', '', '', '', '', '', '', '', 'main outline', [], ''),
+            SceneInfo(1, 'ch1', 'ch1', '', '', '', '', '', '', '', 'first', [], ''),
+            SceneEnd('ch1'),
+            SceneInfo(1, 'ch2', 'ch2', '', '', '', '', '', '', '', 'second', [], ''),
+            SceneEnd('ch2'),
+            SceneEnd('main'),
+            ])
+    outputs = build_outline(story, {})
+
+    counts = CharCounter.counts_data_from(BuildType.OUTLINE, outputs.stats, 5, 10)
+
+    assert counts == [
+            CountRecord(0, '1. main', 16, 5, 16 / 5, 16 / 5 / 10),
+            CountRecord(1, '1. ch1', 9, 4, 9 / 5, 9 / 5 / 10),
+            CountRecord(1, '2. ch2', 10, 4, 2, 0.2),
+            ]
+
+
+@pytest.mark.parametrize('type, builder, expected', [
+        (BuildType.OUTLINE, lambda tags: build_outline(STORY, tags), [
+            (0, '1. 長編', 16, 5), (1, '1. 第一章', 17, 5), (1, '2. 第二章', 10, 4),
+            (2, '1. 回想', 12, 5)]),
+        (BuildType.PLOT, lambda tags: build_plot(STORY, tags), [
+            (1, '1. 第一章', 20, 4)]),
+        (BuildType.SCRIPT, lambda tags: build_script(STORY, tags, {}, True), [
+            (1, '1. 長編', 98, 12), (2, '1. 第一章', 59, 9), (2, '2. 第二章', 28, 3),
+            (3, '1. 回想', 76, 12)]),
+        (BuildType.NOVEL, lambda tags: build_novel(STORY, tags, {}, True), [
+            (1, '1. 長編', 37, 4), (2, '1. 第一章', 27, 3), (2, '2. 第二章', 10, 1),
+            (3, '1. 回想', 37, 4)]),
+        (BuildType.STRUCT, lambda tags: build_struct(STORY, tags, {}, True), [
+            (1, '1. 長編', 200, 24), (2, '1. 第一章', 86, 10), (2, '2. 第二章', 80, 10),
+            (3, '1. 回想', 132, 16)]),
+        ])
+def test_counts_data_from__same_as_before(type, builder, expected):
+
+    counts = CharCounter.counts_data_from(type, builder({'taro': '太郎'}).stats, 20, 20)
+
+    assert [(r.level, r.title, r.total, r.space) for r in counts] == expected
@@ -0,0 +1,44 @@
+"""Test for db manager."""
+
+# Official Libraries
+import logging
+
+
+# My Modules
+from sms.core import dbmanager
+from sms.utils import log
+
+
+# Define Constants
+def _texts() -> list:
+    tmp = []
+
+    for i in range(300):
+        if i % 100 == 7:
+            tmp.append(f"bogus{i}:\n  a: 1\n")
+        else:
+            tmp.append(f"person:\n  tag: p{i}\n  name: 名{i}\n")
+
+    return tmp
+
+
+def _warnings_of(caplog) -> list:
+    return [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+
+
+# test "_asset_objects_from"
+def test_asset_objects_from__same_in_processes(caplog):
+
+    with caplog.at_level(logging.WARNING, logger=log.logger.name):
+        serial = dbmanager._asset_objects_from(_texts(), 1)
+        serial_warnings = _warnings_of(caplog)
+        caplog.clear()
+        shared = dbmanager._asset_objects_from(_texts(), 4)
+        shared_warnings = _warnings_of(caplog)
+
+    assert [obj.tag if obj else None for obj in serial] \
+            == [obj.tag if obj else None for obj in shared]
+    assert serial.count(None) == 3
+    assert len(serial_warnings) == 3
+    assert serial_warnings == shared_warnings
+    assert 'bogus107' in shared_warnings[1]
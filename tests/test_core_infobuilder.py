@@ -0,0 +1,72 @@
+"""Test for info builder."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.core.infobuilder import Converter, InfoConv, InfoRecord, RecordType
+from sms.core.infobuilder import INFO_CONVS, build_info
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+
+
+# Define Constants
+def _scene(level: int, tag: str, flags: list = None) -> SceneInfo:
+    return SceneInfo(level, tag, tag, 'taro', 'room', 'INT', '-', '-', 'noon', '12:00',
+            '', flags or [], '')
+
+
+STORY = StoryData([
+        _scene(0, 'main'),
+        _scene(1, 'ch1'),
+        Action(ActType.COME, 'taro', 'door'),
+        Action(ActType.HAVE, 'taro', 'key'),
+        SceneEnd('ch1'),
+        _scene(1, 'ch2', ['nospin']),
+        Action(ActType.FORESHADOW, 'taro', 'letter'),
+        SceneEnd('ch2'),
+        SceneEnd('main'),
+        ])
+
+
+# test "Converter.infos_data_from"
+def test_Converter_infos_data_from__sections_in_order():
+
+    infos = Converter.infos_data_from(STORY)
+
+    heads = [record.subject for record in infos if RecordType.DATA_HEAD is record.type]
+    assert heads == ['TRANSITION INFO', 'PERSON INFO', 'ITEM INFO', 'FLAG INFO']
+    assert [(record.type, record.level, record.index) for record in infos
+            if RecordType.DATA_HEAD is not record.type] == [
+                    (RecordType.TRANSITION, 0, 1),
+                    (RecordType.TRANSITION, 1, 1),
+                    (RecordType.PERSON_INFO, 1, 1),
+                    (RecordType.ITEM_INFO, 1, 1),
+                    (RecordType.FLAG_INFO, 1, 2),
+                    ]
+
+
+def test_Converter_infos_data_from__added_conv():
+
+    class StageConv(InfoConv):
+        head = 'STAGE INFO'
+
+        def scene_info_of(index: int, record: SceneInfo) -> InfoRecord:
+            return InfoRecord(RecordType.TITLE, record.level, index, record.stage, '')
+
+    infos = Converter.infos_data_from(STORY, INFO_CONVS[:1] + [StageConv])
+
+    assert [record.subject for record in infos if RecordType.TITLE is record.type] == ['room'] * 3
+    assert len(INFO_CONVS) == 4
+
+
+# test "build_info"
+def test_build_info():
+
+    outputs = build_info(STORY, {}, {})
+
+    assert outputs.get_data()[0] == 'SCENE INFO DATA\n===\n\n'
+    assert sum(1 for line in outputs if line.startswith('## ')) == 4
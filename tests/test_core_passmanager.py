@@ -0,0 +1,109 @@
+"""Test for pass manager."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.core.aliasconv import AliasPass
+from sms.core.instrunner import InstructionPass
+from sms.core.nextconv import NextPass
+from sms.core.passmanager import CodePass, PassManager, TIMED_CHUNK_SIZE
+from sms.core.sameconv import SameActionPass, SameInfoPass
+from sms.core.timeclockconv import TimeClockPass
+from sms.objs.action import Action
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+from sms.utils import profiler
+
+
+# Define Constants
+class _CountPass(CodePass):
+
+    name = 'count'
+
+    def __init__(self):
+        self.count = 0
+
+    def step(self, record: SceneEnd) -> SceneEnd:
+        self.count += 1
+        return SceneEnd(f"{record.tag}-{self.count}")
+
+
+class _PrevPass(CodePass):
+
+    name = 'prev'
+
+    def __init__(self):
+        self.prev = ''
+
+    def step(self, record: SceneEnd) -> SceneEnd:
+        tmp = SceneEnd(f"{record.tag}:{self.prev}")
+        self.prev = record.tag
+        return tmp
+
+
+def _compile_passes() -> list:
+    return [AliasPass(), TimeClockPass({'morning': '08:00'}), SameInfoPass(),
+            SameActionPass(), NextPass(), InstructionPass()]
+
+
+def _info(tag: str, stage: str, year: str, date: str, time: str) -> SceneInfo:
+    return SceneInfo(1, tag, tag, 'taro', stage, 'INT', year, date, time, '', '', [], '')
+
+
+def _values_of(records: list) -> list:
+    return [(type(record).__name__,
+        [getattr(record, name) for name in type(record).__slots__])
+        for record in records]
+
+
+# test "PassManager.run"
+def test_PassManager_run__fused_same_as_each():
+
+    data = [SceneEnd(str(i)) for i in range(10)]
+
+    fused = PassManager([_CountPass(), _PrevPass()]).run(data)
+    each = PassManager([_CountPass(), _PrevPass()], False).run(data)
+
+    assert [record.tag for record in fused] == [record.tag for record in each]
+    assert fused[1].tag == '1-2:0-1'
+
+
+def test_PassManager_run__compile_fused_same_as_each():
+
+    data = [
+            _info('s1', 'home', '2020', '4/1', 'morning'),
+            Action(ActType.TALK, 'taro', 'hello'),
+            Action(ActType.SAME, '-', 'again'),
+            SceneEnd('s1'),
+            _info('s2', '-', '-', 'nextday', '-'),
+            Action(ActType.DO, 'hanako', 'run'),
+            Action(ActType.SAME, '-', 'walk'),
+            SceneEnd('s2'),
+            ]
+
+    fused = PassManager(_compile_passes()).run(data)
+    each = PassManager(_compile_passes(), False).run(data)
+
+    assert _values_of(fused) == _values_of(each)
+    assert (fused[4].stage, fused[4].date, fused[4].clock) == ('home', '4/2', '08:00')
+    assert (fused[6].type, fused[6].subject) == (ActType.DO, 'hanako')
+
+
+def test_PassManager_run__timed_same_as_fused():
+
+    data = [SceneEnd(str(i)) for i in range(TIMED_CHUNK_SIZE * 2 + 3)]
+
+    fused = PassManager([_CountPass(), _PrevPass()]).run(data)
+
+    profiler.enable_profiling()
+    try:
+        timed = PassManager([_CountPass(), _PrevPass()]).run(data)
+    finally:
+        records = profiler.disable_profiling()
+
+    assert [record.tag for record in timed] == [record.tag for record in fused]
+    assert fused[1].tag == '1-2:0-1'
+    assert [(r.name, r.records) for r in records] == [
+            ('count', len(data)), ('prev', len(data))]
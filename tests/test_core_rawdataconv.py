@@ -0,0 +1,92 @@
+"""Test for raw data converter."""
+
+# Official Libraries
+import os
+import pickle
+import pytest
+
+
+# My Modules
+from sms.core import rawdataconv
+from sms.core.rawdataconv import IndexedRawSrc, raw_src_index_from, raw_src_index_restamped, raw_src_objects_from
+from sms.db.parsecache import ParseCache
+from sms.utils.fileio import read_file
+
+
+# Define Constants
+SOURCE = '\n'.join([
+        '#!SMSscript',
+        'global text',
+        '## main',
+        '# comment',
+        '',
+        '::title = main',
+        '<scene1>',
+        '## empty',
+        '',
+        '# only comment',
+        '## scene1',
+        '[taro:talk]',
+        'こんにちは',
+        '## scene2',
+        'last',
+        ])
+
+
+# test "raw_src_index_from"
+@pytest.mark.parametrize('newline', ['\n', '\r\n', '\r'])
+def test_raw_src_index_from(tmp_path, newline):
+
+    path = str(tmp_path / 'a.md')
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        file.write(SOURCE.replace('\n', newline))
+
+    indexed = raw_src_index_from(path)
+    expected = raw_src_objects_from(read_file(path), path)
+
+    assert [src.tag for src in expected] == ['global', 'main', 'scene1', 'scene2']
+    assert [(src.tag, src.data) for src in indexed] == [(src.tag, src.data) for src in expected]
+    assert [src.lines for src in indexed] == [src.lines for src in expected]
+    assert [src.lines for src in expected] == [(1, 2), (3, 7), (11, 13), (14, 15)]
+    assert all(src.path == path for src in indexed)
+
+
+def test_raw_src_index_from__reads_changed_file(tmp_path):
+
+    src = tmp_path / 'a.md'
+    src.write_text(SOURCE, encoding='utf-8')
+
+    indexed = pickle.loads(pickle.dumps(raw_src_index_from(str(src))))
+    src.write_text(SOURCE.replace('last', 'updated last'), encoding='utf-8')
+    os.utime(str(src), ns=(0, 0))
+
+    assert all(isinstance(raw, IndexedRawSrc) for raw in indexed)
+    assert indexed[-1].data == ['updated last']
+
+
+# test "raw_src_index_restamped"
+def test_raw_src_index_restamped__touched_file_in_cache(tmp_path, monkeypatch):
+
+    src = tmp_path / 'a.md'
+    src.write_text(SOURCE, encoding='utf-8')
+    cache = ParseCache(str(tmp_path / 'srcs.pickle'))
+    cache.fetch_by_path(str(src), raw_src_index_from, raw_src_index_restamped)
+    os.utime(str(src), ns=(0, 0))
+    parsed = []
+    monkeypatch.setattr(rawdataconv, 'raw_src_objects_from',
+            lambda *args: parsed.append(args) or raw_src_objects_from(*args))
+
+    indexed = cache.fetch_by_path(str(src), raw_src_index_from, raw_src_index_restamped)
+
+    assert all(src.stamp == (len(SOURCE.encode('utf-8')), 0) for src in indexed)
+    assert indexed[-1].data == ['last']
+    assert parsed == []
+
+
+# test "raw_src_objects_from"
+def test_raw_src_objects_from__lines_with_last_line_end():
+
+    srcs = raw_src_objects_from(SOURCE + '\n', 'a.md')
+
+    assert [src.lines for src in srcs] == [(1, 2), (3, 7), (11, 13), (14, 15)]
+    assert srcs[0].path == 'a.md'
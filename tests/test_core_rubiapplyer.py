@@ -0,0 +1,86 @@
+"""Test for rubi applyer."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.core.rubiapplyer import RubiEngine, RubiState, apply_rubi_in_novel_data
+from sms.db.outputsdata import OutputsData
+from sms.objs.rubi import Rubi, RubiData
+from sms.types.rubi import RubiScope
+
+
+# Define Constants
+def _rubis(exclusions: list = None, is_always: bool = False) -> RubiData:
+    tmp = RubiData()
+
+    taro = Rubi('太郎', '太郎《たろう》')
+    taro.exclusions = exclusions or []
+    taro.is_always = is_always
+    tmp.append('太郎', taro)
+    tmp.append('所為', Rubi('所為', '所為《せい》'))
+
+    return tmp
+
+
+LINES = ['## 1. 第一章', '太郎の所為だ。', '太郎が来た。', '## 2. 第二章', '太郎の所為だ。']
+
+
+# test "apply_rubi_in_novel_data"
+def test_apply_rubi_in_novel_data__first_occurrence():
+
+    rubis = _rubis()
+    outputs = apply_rubi_in_novel_data(OutputsData(LINES), rubis)
+
+    assert outputs.get_data() == [
+            '## 1. 第一章', '太郎《たろう》の所為《せい》だ。', '太郎が来た。', '## 2. 第二章', '太郎の所為だ。']
+    assert apply_rubi_in_novel_data(OutputsData(LINES), rubis).get_data() == outputs.get_data()
+
+
+def test_apply_rubi_in_novel_data__chapter_scope():
+
+    outputs = apply_rubi_in_novel_data(OutputsData(LINES), _rubis(), RubiScope.CHAPTER)
+
+    assert outputs.get_data()[4] == '太郎《たろう》の所為《せい》だ。'
+
+
+def test_apply_rubi_in_novel_data__chapter_scope_by_entry_callees():
+
+    lines = ['## 1. 本編', '### 1. 第一章', '太郎の所為だ。', '#### 1. 回想', '太郎が来た。',
+            '### 2. 第二章', '太郎が来た。']
+    outputs = apply_rubi_in_novel_data(OutputsData(lines), _rubis(), RubiScope.CHAPTER)
+
+    assert outputs.get_data()[4] == '太郎が来た。'
+    assert outputs.get_data()[6] == '太郎《たろう》が来た。'
+
+
+def test_apply_rubi_in_novel_data__overlapping_keys():
+
+    rubis = _rubis()
+    rubis.append('太郎丸', Rubi('太郎丸', '太郎丸《たろうまる》'))
+    outputs = apply_rubi_in_novel_data(OutputsData(['太郎が来た。', '太郎丸が来た。', '太郎丸と太郎']), rubis)
+
+    assert outputs.get_data() == ['太郎《たろう》が来た。', '太郎丸《たろうまる》が来た。', '太郎丸と太郎']
+
+
+# test "RubiEngine.apply"
+def test_RubiEngine_apply__always_and_exclusions():
+
+    engine = RubiEngine(_rubis(['太郎丸'], True))
+    state = RubiState()
+
+    assert engine.apply('太郎丸と太郎', state) == '太郎丸と太郎《たろう》'
+    assert engine.apply('太郎と太郎', state) == '太郎《たろう》と太郎《たろう》'
+    assert state.done == set()
+
+
+def test_RubiEngine_apply__key_in_done_one():
+
+    rubis = RubiData()
+    rubis.append('山田太郎', Rubi('山田太郎', '山田太郎《やまだたろう》'))
+    rubis.append('太郎', Rubi('太郎', '太郎《たろう》'))
+    engine = RubiEngine(rubis)
+    state = RubiState()
+
+    assert engine.apply('山田太郎', state) == '山田太郎《やまだたろう》'
+    assert engine.apply('山田太郎', state) == '山田太郎《たろう》'
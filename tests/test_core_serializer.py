@@ -0,0 +1,93 @@
+"""Test for serializer."""
+
+# Official Libraries
+import pytest
+
+
+# My Modules
+from sms.core.serializer import call_scene
+from sms.db.scenes import ScenesDB
+from sms.objs.action import Action
+from sms.objs.instruction import Instruction
+from sms.objs.scenecode import SceneCode
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+from sms.types.instruction import InstType
+
+
+# Define Constants
+def _scenes_of(calls: dict) -> ScenesDB:
+    db = ScenesDB()
+
+    for tag, callees in calls.items():
+        scode = SceneCode(tag)
+        scode.add(Action(ActType.DO, tag, f"{tag} outline"))
+        for callee in callees:
+            scode.add(Instruction(InstType.CALL, [callee]))
+        db.add(tag, scode)
+
+    return db
+
+
+def _outline_of(data: list) -> list:
+    tmp = []
+
+    for record in data:
+        if isinstance(record, SceneInfo):
+            tmp.append(f"{record.level}:{record.tag}")
+        elif isinstance(record, SceneEnd):
+            tmp.append('end')
+        else:
+            tmp.append(record.outline)
+
+    return tmp
+
+
+# test "call_scene"
+def test_call_scene_expands_shared_scene_each_time():
+
+    scenes = _scenes_of({'main': ['a', 'b'], 'a': ['c'], 'b': ['c'], 'c': []})
+
+    assert _outline_of(call_scene(0, 'main', scenes)) == [
+            '0:main', 'main outline',
+            '1:a', 'a outline', '2:c', 'c outline', 'end', 'end',
+            '1:b', 'b outline', '2:c', 'c outline', 'end', 'end',
+            'end',
+            ]
+
+
+def test_call_scene_skips_missing_scene():
+
+    scenes = _scenes_of({'main': ['none', 'a'], 'a': []})
+
+    assert _outline_of(call_scene(0, 'main', scenes)) == [
+            '0:main', 'main outline', '1:a', 'a outline', 'end', 'end',
+            ]
+
+
+@pytest.mark.parametrize(
+        ['calls', 'expect'],
+        [
+            [{'main': ['main']}, ['main', 'main']],
+            [{'main': ['a'], 'a': ['b'], 'b': ['a']}, ['a', 'b', 'a']],
+            ])
+def test_call_scene_rejects_cycle(calls, expect):
+
+    with pytest.raises(ValueError) as err:
+        call_scene(0, 'main', _scenes_of(calls))
+
+    assert err.value.args[1] == expect
+
+
+def test_call_scene_deep_calls():
+
+    depth = 5000
+    calls = {f"s{i}": [f"s{i + 1}"] for i in range(depth)}
+    calls[f"s{depth}"] = []
+
+    data = call_scene(0, 's0', _scenes_of(calls))
+
+    assert len(data) == (depth + 1) * 3
+    assert data[(depth + 1) * 2].tag == f"s{depth}"
+    assert data[-1].tag == 's0'
@@ -0,0 +1,55 @@
+"""Test for tag resolver."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.core.novelbuilder import build_novel
+from sms.core.outlinebuilder import build_outline
+from sms.core.tagresolver import tags_resolved_story_data
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+
+
+# Define Constants
+TAGS = {'taro': '太郎', 'hana': '花子', 'me': '自分'}
+
+CALLINGS = {'taro': {'S': '太郎', 'me': '俺'}}
+
+
+def _story() -> StoryData:
+    return StoryData([
+            SceneInfo(0, 'main', '$taroの話', '', '', '', '', '', '', '', '$hanaと会う', [], ''),
+            Action(ActType.TALK, 'taro', '$hana', ['$meは$hanaと会う']),
+            Action(ActType.BE, 'hana', '', ['$meは$taroを見た']),
+            SceneEnd('main'),
+            ])
+
+
+# test "tags_resolved_story_data"
+def test_tags_resolved_story_data__defers_calling_keys():
+
+    story = _story()
+    resolved = tags_resolved_story_data(story, TAGS, CALLINGS)
+    records = resolved.get_data()
+
+    assert records[0].title == '太郎の話'
+    assert records[1].descs == ['$meは花子と会う']
+    assert records[1].outline == '花子'
+    assert records[1].subject == 'taro'
+    assert story.get_data()[1].descs == ['$meは$hanaと会う']
+    assert records[3] is story.get_data()[3]
+    assert tags_resolved_story_data(story, TAGS, CALLINGS) is resolved
+
+
+def test_tags_resolved_story_data__same_outputs():
+
+    story = _story()
+    resolved = tags_resolved_story_data(story, TAGS, CALLINGS)
+
+    assert build_novel(resolved, TAGS, CALLINGS, False).get_data() \
+            == build_novel(story, TAGS, CALLINGS, False).get_data()
+    assert build_outline(resolved, TAGS).get_data() == build_outline(story, TAGS).get_data()
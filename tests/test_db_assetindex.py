@@ -0,0 +1,71 @@
+"""Test for asset index."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.commons.projectconfig import ProjectConfig
+from sms.core.nametagconv import callingtags_from, nametags_from
+from sms.core.nametagconv import rubitags_from, timeclocks_from
+from sms.db.assetindex import AssetIndex
+from sms.db.assets import AssetsDB
+from sms.objs.item import Item
+from sms.objs.nametag import NameTag, NameTagType
+from sms.objs.person import Person
+from sms.objs.rubi import RubiData
+from sms.objs.stage import Stage
+from sms.utils.strtranslate import TagTranslator
+
+
+# Define Constants
+def _assets() -> AssetsDB:
+    db = AssetsDB()
+
+    taro = Person('taro', '太郎')
+    taro.fullname = '山田,太郎'
+    taro.calling = {'me': '僕'}
+    db.add('taro', taro)
+    db.add('town', Stage('town', '町'))
+    db.add('__mob', NameTag(NameTagType.MOB, {'man': {'name': '男', 'type': 'mob'}}))
+    db.add('__time', NameTag(NameTagType.TIME, {'noon': {'name': '昼', 'clock': '12:00'}}))
+    db.add('__RUBI', RubiData())
+    db.add('town_item', Item('town', '町の鍵'))
+
+    return db
+
+
+# test "AssetIndex"
+def test_assetindex__indexes_by_types():
+
+    index = AssetIndex(_assets())
+
+    assert list(index.persons.keys()) == ['taro']
+    assert list(index.stages.keys()) == ['town']
+    assert list(index.items.keys()) == ['town']
+    assert [len(tags) for tags in index.nametags.values()] == [1, 1, 0]
+    assert isinstance(index.rubi, RubiData)
+    assert [obj.tag for obj in index.named] == ['taro', 'town', '__mob', '__time', 'town']
+
+
+def test_assetindex__tables_made_once():
+
+    index = AssetIndex(_assets())
+    config = ProjectConfig(mobs=2)
+
+    tags = nametags_from(index, config)
+    assert tags['town'] == '町の鍵'
+    assert tags['t_town'] == '町'
+    assert tags['man1'] == '男１'
+    assert 'man2' not in tags
+    assert nametags_from(index, config) is tags
+    assert nametags_from(index, ProjectConfig(mobs=3))['man2'] == '男２'
+
+    callings = callingtags_from(index)
+    assert callings['taro']['S'] == '太郎'
+    assert callings['taro']['M'] == '僕'
+    assert isinstance(callings['taro'], TagTranslator)
+    assert callings['taro'].translate('$Sと$M') == '太郎と僕'
+    assert callingtags_from(index) is callings
+
+    assert timeclocks_from(index) == {'noon': '12:00'}
+    assert rubitags_from(index) is index.rubi
@@ -0,0 +1,133 @@
+"""Test for fragment cache db."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.core.novelbuilder import build_novel
+from sms.core.scriptbuilder import build_script
+from sms.db.fragmentcache import FragmentCache, fragments_of
+from sms.db.storydata import StoryData
+from sms.objs.action import Action
+from sms.objs.instruction import Instruction
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+from sms.types.action import ActType
+from sms.types.instruction import InstType
+
+
+# Define Constants
+def _scene(level: int, tag: str) -> SceneInfo:
+    return SceneInfo(level, tag, tag, 'taro', 'room', 'INT', '-', '-', 'noon', '12:00',
+            '', [], '')
+
+
+def _story(word: str = 'apple') -> list:
+    return [
+            _scene(0, 'main'),
+            _scene(1, 'ch1'),
+            Instruction(InstType.PARAGRAPH_START),
+            Action(ActType.BE, 'taro', '', ['$taro is here']),
+            SceneEnd('ch1'),
+            _scene(1, 'ch2'),
+            _scene(2, 'sc1'),
+            Action(ActType.TALK, 'taro', '', [word]),
+            SceneEnd('sc1'),
+            Instruction(InstType.PARAGRAPH_END),
+            SceneEnd('ch2'),
+            Action(ActType.BE, 'taro', '', ['end']),
+            SceneEnd('main'),
+            ]
+
+
+# test "fragments_of"
+def test_fragments_of__top_level_scenes():
+
+    fragments = fragments_of(_story())
+
+    assert [len(fragment) for fragment in fragments] == [1, 4, 6, 2]
+    assert fragments[2][0].tag == 'ch2'
+
+
+# test "FragmentCache.render_fragments"
+def test_FragmentCache_render_fragments__renders_changed_only(tmp_path):
+
+    path = str(tmp_path / 'novel.fragments.pickle')
+    tags = {'taro': '太郎'}
+    callings = {'taro': {'S': '太郎', 'M': '俺'}}
+
+    cache = FragmentCache(path)
+    outputs = build_novel(StoryData(_story()), tags, callings, False, cache)
+    assert (cache.rendered, cache.reused) == (4, 0)
+    assert outputs.get_data() == build_novel(StoryData(_story()), tags, callings, False).get_data()
+    assert cache.save()
+
+    reloaded = FragmentCache(path)
+    assert reloaded.load()
+    changed = build_novel(StoryData(_story('orange')), tags, callings, False, reloaded)
+    assert (reloaded.rendered, reloaded.reused) == (1, 3)
+    assert changed.get_data() == build_novel(
+            StoryData(_story('orange')), tags, callings, False).get_data()
+
+    build_novel(StoryData(_story('orange')), {'taro': '次郎'}, callings, False, reloaded)
+    assert (reloaded.rendered, reloaded.reused) == (4, 0)
+
+
+def test_FragmentCache_render_fragments__script(tmp_path):
+
+    cache = FragmentCache(str(tmp_path / 'script.fragments.pickle'))
+    tags = {'taro': '太郎'}
+
+    outputs = build_script(StoryData(_story()), tags, {}, True, cache)
+    assert outputs.get_data() == build_script(StoryData(_story()), tags, {}, True).get_data()
+
+    build_script(StoryData(_story()), tags, {}, False, cache)
+    assert (cache.rendered, cache.reused) == (4, 0)
+
+
+# test "FragmentCache.save"
+def test_FragmentCache_save_drops_unused_fragments(tmp_path):
+
+    path = str(tmp_path / 'novel.fragments.pickle')
+
+    cache = FragmentCache(path)
+    build_novel(StoryData(_story()), {}, {}, False, cache)
+    assert cache.save()
+    assert len(cache.data) == 4
+
+    build_novel(StoryData(_story('orange')), {}, {}, False, cache)
+    assert cache.save()
+    assert len(cache.data) == 4
+
+    other = FragmentCache(path)
+    assert other.load()
+    assert not other.is_stale()
+
+    build_novel(StoryData(_story('melon')), {}, {}, False, cache)
+    assert cache.save()
+    assert other.is_stale()
+
+
+def test_FragmentCache_save_resets_used_without_changes(tmp_path):
+
+    cache = FragmentCache(str(tmp_path / 'novel.fragments.pickle'))
+    build_novel(StoryData(_story()), {}, {}, False, cache)
+    assert cache.save()
+    build_novel(StoryData(_story()), {}, {}, False, cache)
+    assert cache.reused == 4
+    assert cache.save()
+    assert len(cache.data) == 4
+
+    assert cache.save()
+    assert not cache.data
+
+
+def test_FragmentCache_save_in_unwritable_dir(tmp_path):
+
+    (tmp_path / '.cache').write_text('not a dir', encoding='utf-8')
+
+    cache = FragmentCache(str(tmp_path / '.cache' / 'novel.fragments.pickle'))
+    build_novel(StoryData(_story()), {}, {}, False, cache)
+
+    assert not cache.save()
+    assert len(cache.data) == 4
@@ -0,0 +1,68 @@
+"""Test for output manifest db."""
+
+# Official Libraries
+import os
+
+
+# My Modules
+from sms.db.outputmanifest import OutputManifest
+
+
+# test "OutputManifest.write"
+def test_OutputManifest_write_skips_unchanged(tmp_path):
+
+    out = str(tmp_path / 'novel.md')
+    path = str(tmp_path / '.manifest.json')
+
+    manifest = OutputManifest(path)
+    assert manifest.write(out, ['apple\n'])
+    assert manifest.write(out, ['apple\n'])
+    assert manifest.summary() == (['novel.md'], ['novel.md'])
+    assert manifest.save()
+    mtime = os.stat(out).st_mtime_ns
+
+    reloaded = OutputManifest(path)
+    assert reloaded.load()
+    assert reloaded.write(out, ['apple\n'])
+    assert os.stat(out).st_mtime_ns == mtime
+    assert reloaded.summary() == ([], ['novel.md'])
+
+    with open(out, 'w') as file:
+        file.write('edited\n')
+    assert reloaded.write(out, ['apple\n'])
+    assert reloaded.write(out, ['orange\n'])
+    assert reloaded.summary() == (['novel.md', 'novel.md'], ['novel.md'])
+    with open(out) as file:
+        assert file.read() == 'orange\n'
+    assert not os.path.exists(f"{out}.tmp")
+
+
+def test_OutputManifest_updates_from_workers(tmp_path):
+
+    out = str(tmp_path / 'plot.md')
+    manifest = OutputManifest(str(tmp_path / '.manifest.json'))
+    worker = OutputManifest(manifest.path)
+
+    start = worker.updates_count()
+    worker.write(out, ['plot\n'])
+    manifest.add_updates(worker.updates_since(start))
+
+    assert worker.updates_count() == 0
+    assert manifest.summary() == (['plot.md'], [])
+    assert manifest.save()
+
+    manifest.remove(out)
+    assert not os.path.exists(out)
+    assert not manifest.data
+
+
+def test_OutputManifest_write_parts_in_order(tmp_path):
+
+    out = str(tmp_path / 'novel.md')
+    manifest = OutputManifest(str(tmp_path / '.manifest.json'))
+
+    assert manifest.write(out, ['HEAD\n', '===\n'], ['body1\n', 'body2\n'])
+    assert manifest.write(out, ['HEAD\n===\n'], ['body1\nbody2\n'])
+    assert manifest.summary() == (['novel.md'], ['novel.md'])
+    with open(out) as file:
+        assert file.read() == 'HEAD\n===\nbody1\nbody2\n'
@@ -0,0 +1,38 @@
+"""Test for outputs data."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.db.outputsdata import OutputsData
+
+
+# test "OutputsData"
+def test_outputsdata__adds_segments_without_copy():
+
+    head = OutputsData(['HEAD\n'])
+    body = OutputsData(['a\n', 'b\n'], ['stats'])
+
+    joined = head + body
+    assert joined.segments[1] is body.segments[0]
+    assert joined.get_serialized_data() == 'HEAD\na\nb\n'
+    assert len(joined) == 3
+    assert head.get_data() == ['HEAD\n']
+
+    head += body
+    head += OutputsData([])
+    assert list(head) == ['HEAD\n', 'a\n', 'b\n']
+    assert len(head.segments) == 2
+
+
+def test_outputsdata__cloned_shares_segments():
+
+    base = OutputsData(['a\n'], ['stats'])
+    cloned = base.cloned()
+    cloned += OutputsData(['b\n'])
+
+    assert cloned.segments[0] is base.segments[0]
+    assert base.get_data() == ['a\n']
+    assert cloned.get_data() == ['a\n', 'b\n']
+    assert cloned.stats is base.stats
+    assert OutputsData([]).is_empty()
@@ -0,0 +1,133 @@
+"""Test for parse cache db."""
+
+# Official Libraries
+import os
+
+
+# My Modules
+from sms.db.parsecache import ParseCache
+
+
+# test "ParseCache.fetch"
+def test_ParseCache_fetch_parses_only_changed_file(tmp_path):
+
+    src = tmp_path / 'a.md'
+    src.write_text('apple\r\norange\n', encoding='utf-8')
+    called = []
+
+    def _parser(text):
+        called.append(text)
+        return text.split('\n')
+
+    cache_path = str(tmp_path / 'cache' / 'srcs.pickle')
+    cache = ParseCache(cache_path)
+    assert cache.fetch(str(src), _parser) == ['apple', 'orange', '']
+    assert cache.save()
+
+    reloaded = ParseCache(cache_path)
+    assert reloaded.load()
+    assert reloaded.fetch(str(src), _parser) == ['apple', 'orange', '']
+    assert len(called) == 1
+
+    src.write_text('melon\n', encoding='utf-8')
+    os.utime(str(src), ns=(0, 0))
+    assert reloaded.fetch(str(src), _parser) == ['melon', '']
+    assert len(called) == 2
+
+
+def test_ParseCache_save_drops_unused_entries(tmp_path):
+
+    src = tmp_path / 'a.yml'
+    src.write_text('a', encoding='utf-8')
+    cache_path = str(tmp_path / 'assets.pickle')
+
+    cache = ParseCache(cache_path)
+    cache.fetch(str(src), lambda x: x)
+    cache.save()
+    assert str(src) in cache.data
+
+    cache.save()
+    assert not cache.data
+
+
+def test_ParseCache_save_resets_used_without_changes(tmp_path):
+
+    src = tmp_path / 'a.yml'
+    src.write_text('a', encoding='utf-8')
+
+    cache = ParseCache(str(tmp_path / 'assets.pickle'))
+    cache.fetch(str(src), lambda x: x)
+    cache.save()
+    cache.fetch(str(src), lambda x: x)
+    cache.save()
+    assert str(src) in cache.data
+
+    cache.save()
+    assert not cache.data
+
+
+def test_ParseCache_save_in_unwritable_dir(tmp_path):
+
+    src = tmp_path / 'a.yml'
+    src.write_text('a', encoding='utf-8')
+    (tmp_path / 'build').write_text('not a dir', encoding='utf-8')
+
+    cache = ParseCache(str(tmp_path / 'build' / '.cache' / 'assets.pickle'))
+    cache.fetch(str(src), lambda x: x)
+
+    assert not cache.save()
+    assert str(src) in cache.data
+
+
+def test_ParseCache_save_removes_tmp_file(tmp_path):
+
+    src = tmp_path / 'a.yml'
+    src.write_text('a', encoding='utf-8')
+    (tmp_path / 'assets.pickle').mkdir()
+
+    cache = ParseCache(str(tmp_path / 'assets.pickle'))
+    cache.fetch(str(src), lambda x: x)
+
+    assert not cache.save()
+    assert not os.path.exists(str(tmp_path / 'assets.pickle.tmp'))
+
+
+# test "ParseCache.fetch_by_path"
+def test_ParseCache_fetch_by_path(tmp_path):
+
+    src = tmp_path / 'a.md'
+    src.write_text('apple\n', encoding='utf-8')
+    called = []
+
+    def _parser(path):
+        called.append(path)
+        return os.path.getsize(path)
+
+    cache = ParseCache(str(tmp_path / 'srcs.pickle'))
+    assert cache.fetch_by_path(str(src), _parser) == 6
+    assert cache.fetch_by_path(str(src), _parser) == 6
+
+    os.utime(str(src), ns=(0, 0))
+    assert cache.fetch_by_path(str(src), _parser) == 6
+    assert called == [str(src)]
+
+
+# test "ParseCache.fetch_all"
+def test_ParseCache_fetch_all_parses_missed_at_once(tmp_path):
+
+    srcs = []
+    for name in ('a', 'b', 'c'):
+        src = tmp_path / f"{name}.yml"
+        src.write_text(name, encoding='utf-8')
+        srcs.append(str(src))
+    called = []
+
+    def _parser(texts):
+        called.append(texts)
+        return [text.upper() if text != 'c' else None for text in texts]
+
+    cache = ParseCache(str(tmp_path / 'assets.pickle'))
+    assert cache.fetch(srcs[1], lambda x: 'cached') == 'cached'
+    assert cache.fetch_all(srcs, _parser) == ['A', 'cached', None]
+    assert cache.fetch_all(srcs, _parser) == ['A', 'cached', None]
+    assert called == [['a', 'c'], ['c']]
@@ -0,0 +1,71 @@
+"""Test for scene graph db."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.db.scenegraph import SceneGraph, SceneNode
+from sms.db.storydata import StoryData
+from sms.objs.sceneend import SceneEnd
+from sms.objs.sceneinfo import SceneInfo
+
+
+# Define Constants
+def _graph(digests: dict, calls: dict) -> SceneGraph:
+    graph = SceneGraph('main')
+
+    for i, (tag, digest) in enumerate(digests.items()):
+        graph.add(SceneNode(tag, 'src/main.md', (i * 10 + 1, i * 10 + 9), digest, calls.get(tag, [])))
+
+    return graph
+
+
+CALLS = {'main': ['ch1', 'ch2'], 'ch1': ['sc'], 'ch2': ['sc']}
+
+
+def _info(tag: str) -> SceneInfo:
+    return SceneInfo(0, tag, tag, '', '', '', '', '', '', '', '', '', '')
+
+
+# test "SceneGraph"
+def test_scenegraph__entry_paths_of():
+
+    graph = _graph({'main': 'a', 'ch1': 'b', 'ch2': 'c', 'sc': 'd'}, CALLS)
+
+    assert graph.entry_paths_of('sc') == [['main', 'ch1', 'sc'], ['main', 'ch2', 'sc']]
+    assert graph.entry_paths_of('missing') == []
+    assert sorted(graph.callers_of('sc')) == ['ch1', 'ch2']
+    assert graph.tags_in('src/main.md') == ['main', 'ch1', 'ch2', 'sc']
+
+
+def test_scenegraph__impact_from():
+
+    old = _graph({'main': 'a', 'ch1': 'b', 'ch2': 'c', 'sc': 'd'}, CALLS)
+    new = _graph({'main': 'a', 'ch1': 'b', 'ch2': 'c', 'sc': 'edited'}, CALLS)
+    codes = StoryData([_info('main'), _info('ch1'), _info('sc'), SceneEnd('sc'), SceneEnd('ch1'),
+        _info('ch2'), _info('sc'), SceneEnd('sc'), SceneEnd('ch2'), SceneEnd('main')])
+
+    impact = new.impact_from(old, codes)
+    assert impact.changed == ['sc']
+    assert impact.affected == ['ch1', 'ch2', 'main', 'sc']
+    assert impact.ranges == [('sc', 2, 4), ('sc', 6, 8)]
+
+    assert new.impact_from(new).is_empty()
+
+    removed = _graph({'main': 'a', 'ch1': 'b', 'ch2': 'c'}, CALLS)
+    impact = removed.impact_from(old)
+    assert impact.changed == ['sc']
+    assert impact.affected == ['ch1', 'ch2', 'main']
+
+
+def test_scenegraph__save_and_load(tmp_path):
+
+    path = str(tmp_path / 'cache' / 'scenegraph.json')
+    graph = _graph({'main': 'a', 'ch1': 'b'}, CALLS)
+
+    assert graph.save(path)
+    loaded = SceneGraph()
+    assert loaded.load(path)
+    assert loaded.entry == 'main'
+    assert loaded.nodes == graph.nodes
+    assert loaded.impact_from(graph).is_empty()
@@ -0,0 +1,66 @@
+"""Test for scenes db."""
+
+# Official Libraries
+
+
+# My Modules
+from sms.db.scenes import LazyScenesDB
+from sms.db.srcs import SrcsDB
+from sms.objs.rawsrc import RawSrc
+from sms.objs.scenecode import SceneCode
+
+
+# Define Constants
+def _srcs_of(*tags: str) -> SrcsDB:
+    db = SrcsDB()
+
+    for tag in tags:
+        db.add(tag, RawSrc(tag, [f"text of {tag}"]))
+
+    return db
+
+
+class _Converter(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, src: RawSrc) -> SceneCode:
+        self.calls.append(src.tag)
+        return SceneCode(src.tag) if src.tag != 'broken' else None
+
+
+# test "LazyScenesDB"
+def test_lazyscenesdb__converts_used_scenes():
+
+    conv = _Converter()
+    db = LazyScenesDB(_srcs_of('main', 'ch1', 'draft', 'broken'), conv)
+
+    assert conv.calls == []
+    assert db.get('main').tag == 'main'
+    assert db.has('ch1')
+    assert not db.has('missing')
+    assert not db.has('broken')
+    assert not db.has('broken')
+    assert db.get('ch1').tag == 'ch1'
+
+    assert conv.calls == ['main', 'ch1', 'broken']
+    assert db.unused_tags() == ['draft']
+    assert not db.is_empty()
+
+
+def test_lazyscenesdb__reuses_converted():
+
+    srcs = _srcs_of('main', 'ch1')
+    converted = {}
+    conv = _Converter()
+
+    first = LazyScenesDB(srcs, conv, converted)
+    first.get('main')
+    srcs.add('ch1', RawSrc('ch1', ['updated']))
+    second = LazyScenesDB(srcs, conv, converted)
+
+    assert second.get('main') is first.get('main')
+    assert second.get('ch1').tag == 'ch1'
+    assert conv.calls == ['main', 'ch1']
+    assert set(converted.keys()) == {'main', 'ch1'}
@@ -0,0 +1,111 @@
+"""Test for process pool utility."""
+
+# Official Libraries
+import os
+import pytest
+import time
+
+
+# My Modules
+from sms.utils import pools
+
+
+# Define Constants
+def _delayed(shared: dict, item: int) -> tuple:
+    # NOTE: the first items end last, so the results come out of order without sorting
+    time.sleep(shared['delay'] * (4 - item % 4))
+    return item * shared['scale'], os.getpid()
+
+
+def _failed(shared: dict, item: int) -> tuple:
+    return item, 'failed' if item in shared['failures'] else None
+
+
+def _raised(shared: dict, item: int) -> int:
+    if item in shared['errors']:
+        raise ValueError(item)
+    return item
+
+
+def _until_failure(results) -> list:
+    """Return the items until the first failure, as the builder reports it."""
+    tmp = []
+
+    for item, failure in results:
+        tmp.append(item)
+        if failure:
+            break
+
+    return tmp
+
+
+def _until_error(results) -> tuple:
+    tmp = []
+
+    try:
+        for item in results:
+            tmp.append(item)
+    except ValueError as err:
+        return tmp, err.args
+
+    return tmp, None
+
+
+is_forkable = pytest.mark.skipif(not pools._can_fork(), reason='no fork start method')
+
+
+# test "imap_forked"
+@is_forkable
+def test_imap_forked__in_order_of_items():
+
+    items = list(range(8))
+    shared = {'delay': 0.02, 'scale': 3}
+
+    results = list(pools.imap_forked(_delayed, items, shared, 4))
+
+    assert [value for value, _ in results] == [item * 3 for item in items]
+    assert all(pid != os.getpid() for _, pid in results)
+    assert pools._shared is None
+
+
+@pytest.mark.parametrize('jobs', [0, 1])
+def test_imap_forked__in_process_with_one_job(jobs):
+
+    shared = {'delay': 0, 'scale': 2}
+
+    results = pools.imap_forked(_delayed, [1, 2, 3], shared, jobs)
+
+    assert not isinstance(results, list)
+    assert list(results) == [(2, os.getpid()), (4, os.getpid()), (6, os.getpid())]
+
+
+@is_forkable
+def test_imap_forked__failures_in_serial_order():
+
+    items = list(range(10))
+    shared = {'failures': {3, 6}}
+
+    serial = _until_failure(pools.imap_forked(_failed, items, shared, 1))
+    forked = _until_failure(pools.imap_forked(_failed, items, shared, 4))
+
+    assert forked == serial == [0, 1, 2, 3]
+
+
+@is_forkable
+def test_imap_forked__errors_in_serial_order():
+
+    items = list(range(10))
+    shared = {'errors': {7, 4}}
+
+    serial = _until_error(pools.imap_forked(_raised, items, shared, 1))
+    forked = _until_error(pools.imap_forked(_raised, items, shared, 4))
+
+    assert forked == serial == ([0, 1, 2, 3], (4,))
+    assert pools._shared is None
+
+
+# test "jobs_count_of"
+def test_jobs_count_of():
+
+    assert pools.jobs_count_of(3) == 3
+    assert pools.jobs_count_of(0) == (os.cpu_count() or 1)
@@ -0,0 +1,106 @@
+"""Test for profiler utility."""
+
+# Official Libraries
+import json
+import tracemalloc
+
+
+# My Modules
+from sms.utils import profiler
+
+
+# test "profiled"
+def test_profiled__disabled():
+
+    with profiler.profiled('stage', 'load') as stage:
+        stage.records = 3
+
+    assert not profiler.is_profiling()
+    assert profiler.records_count() == 0
+
+
+def test_profiled__nested():
+
+    profiler.enable_profiling(is_memory=True)
+    try:
+        with profiler.profiled('outer', 'compile') as outer:
+            with profiler.profiled('inner', 'pass') as inner:
+                data = [str(i) for i in range(1000)]
+                inner.records = len(data)
+            profiler.record_stage('timed', 'pass', 0.5, 0.25, 10)
+            outer.records = len(data)
+    finally:
+        records = profiler.disable_profiling()
+
+    assert [(r.name, r.depth, r.records) for r in records] == [
+            ('outer', 0, 1000), ('inner', 1, 1000), ('timed', 1, 10)]
+    assert records[0].wall >= records[1].wall
+    assert records[1].memory > 0
+    assert records[2].memory is None
+
+
+def test_profiled__without_memory():
+
+    profiler.enable_profiling()
+    try:
+        with profiler.profiled('stage') as stage:
+            stage.records = len([str(i) for i in range(1000)])
+    finally:
+        records = profiler.disable_profiling()
+
+    assert not tracemalloc.is_tracing()
+    assert (records[0].memory, records[0].peak) == (None, None)
+    assert records[0].wall > 0
+
+
+def test_profiled__cprofile():
+
+    profiler.enable_profiling(True)
+    try:
+        with profiler.profiled('fast'):
+            pass
+        with profiler.profiled('slow'):
+            sorted(str(i) for i in range(10000))
+    finally:
+        records = profiler.disable_profiling()
+
+    assert all(r.stats is not None for r in records)
+    assert profiler.slowest_of(records).name == 'slow'
+
+
+# test "records_since"
+def test_records_since():
+
+    profiler.enable_profiling()
+    try:
+        with profiler.profiled('first'):
+            pass
+        start = profiler.records_count()
+        with profiler.profiled('second'):
+            pass
+        taken = profiler.records_since(start)
+        profiler.add_records(taken)
+    finally:
+        records = profiler.disable_profiling()
+
+    assert [r.name for r in taken] == ['second']
+    assert [r.name for r in records] == ['first', 'second']
+
+
+# test "json_of" and "markdown_of"
+def test_reports():
+
+    records = [
+            profiler.StageRecord('compile', 'compile', 0, 2.0, 1.5, 100, 2048, 4096),
+            profiler.StageRecord('alias', 'pass', 1, 0.5, 0.5, 100),
+            profiler.StageRecord('novel', 'build', 0, 1.0, 1.0, 50, 1024, 1024),
+            ]
+
+    data = json.loads(profiler.json_of(records))
+    text = profiler.markdown_of(records)
+
+    assert data['total'] == {'wall': 3.0, 'cpu': 2.5}
+    assert [stage['name'] for stage in data['stages']] == ['compile', 'alias', 'novel']
+    assert '- slowest: compile (2.000s)' in text
+    assert '| compile | compile | 2.000 | 66.7 | 1.500 | 100 | 2.0 | 4.0 |' in text
+    assert '| 　alias | pass | 0.500 | 16.7 | 0.500 | 100 | - | - |' in text
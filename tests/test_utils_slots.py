@@ -0,0 +1,30 @@
+"""Test for slotted classes utility."""
+
+# Official Libraries
+from dataclasses import dataclass, field
+import pytest
+
+
+# My Modules
+from sms.utils.slots import slotted
+
+
+@slotted
+@dataclass
+class _Record(object):
+    subject: str
+    descs: list = field(default_factory=list)
+    note: str = ''
+
+
+# test "slotted"
+def test_slotted():
+
+    record = _Record('taro')
+
+    assert record == _Record('taro', [], '')
+    assert _Record.__slots__ == ('subject', 'descs', 'note')
+    assert not hasattr(record, '__dict__')
+
+    with pytest.raises(AttributeError):
+        record.unknown = 1
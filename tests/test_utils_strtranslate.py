@@ -0,0 +1,71 @@
+"""Test for string translate utility."""
+
+# Official Libraries
+import pytest
+
+
+# My Modules
+from sms.utils.dicts import dict_sorted
+from sms.utils.strtranslate import TagTranslator
+from sms.utils.strtranslate import translate_tags_str
+from sms.utils.strtranslate import translate_tags_text_list
+
+
+# Define Constants
+TAGS = {
+        'taro': '太郎',
+        'taro2': '太郎二号',
+        'hana': '花子',
+        'S': '俺',
+        }
+
+
+# test "translate_tags_str"
+@pytest.mark.parametrize(
+        ['src', 'is_sorted', 'expect'],
+        [
+            ['$taro is here', False, '太郎 is here'],
+            ['$taro2 and $hana', True, '太郎二号 and 花子'],
+            ['$taro2 and $hana', False, '太郎2 and 花子'],
+            ['$$taro$S', True, '$太郎俺'],
+            ['$none and $S', True, '$none and 俺'],
+            ['no tag', True, 'no tag'],
+            ])
+def test_translate_tags_str(src, is_sorted, expect):
+
+    tags = dict_sorted(TAGS, True) if is_sorted else TAGS
+    assert translate_tags_str(src, tags) == expect
+    assert translate_tags_str(src, TagTranslator(tags)) == expect
+
+
+@pytest.mark.parametrize(
+        ['src', 'prefix', 'expect'],
+        [
+            ['$taro', '$', '太郎'],
+            ['$taro san', '$', '$taro san'],
+            ['taro', None, '太郎'],
+            ['taro san', None, 'taro san'],
+            ])
+def test_translate_tags_str_fullmatch(src, prefix, expect):
+
+    assert translate_tags_str(src, TagTranslator(TAGS), True, prefix) == expect
+
+
+# test "translate_tags_text_list"
+def test_translate_tags_text_list():
+
+    translator = TagTranslator(dict_sorted(TAGS, True))
+    src = ['$taro', '$taro2 meets $hana', '']
+
+    assert translate_tags_text_list(src, translator) == ['太郎', '太郎二号 meets 花子', '']
+    assert translate_tags_text_list(src, {}) == src
+
+
+# test "TagTranslator.translate_deferring"
+def test_TagTranslator_translate_deferring():
+
+    translator = TagTranslator(dict_sorted(TAGS, True))
+    deferred = TagTranslator({'ha': 'ha', 'S': 'S'})
+
+    assert translator.translate_deferring('$taro meets $hana and $S', deferred) \
+            == '太郎 meets $hana and $S'